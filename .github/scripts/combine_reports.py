@@ -1,33 +1,153 @@
 # .github/scripts/combine_reports.py
 
-import json
+import argparse
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial, reduce
 import glob
 
-def read_json_file(json_file):
+from report_parser import iter_scenarios, EmptyReportError, ReportParseError
+from report_renderer import write_html_report
+from results_db import DEFAULT_DB_PATH, current_git_sha, default_run_id, record_run
+
+def empty_aggregate():
     """
-    Safely read and parse a JSON file
+    Partial aggregate of no reports, the identity of merge_aggregates
     """
+    return {
+        "files": 0,
+        "skipped_files": 0,
+        "bytes": 0,
+        "start_time": None,
+        "end_time": None,
+        "total_scenarios": 0,
+        "passed_scenarios": 0,
+        "failed_scenarios": 0,
+        "skipped_scenarios": 0,
+        "features": {},
+        "test_results": [],
+        "messages": []
+    }
+
+def status_counter(status):
+    """
+    Name of the counter a scenario status is added to
+    """
+    if status == "passed":
+        return "passed_scenarios"
+    if status == "failed":
+        return "failed_scenarios"
+    return "skipped_scenarios"
+
+def summarize_report(json_file, include_steps=False):
+    """
+    Stream one JSON report into a partial aggregate, runs in the pool's worker processes.
+    Scenario records keep their steps when include_steps, for the results history.
+    """
+    aggregate = empty_aggregate()
+    aggregate["files"] = 1
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-            if not content:
-                print(f"Empty file: {json_file}")
-                return None
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError as e:
-                print(f"Invalid JSON in file {json_file}: {e}")
-                return None
+        aggregate["bytes"] = os.path.getsize(json_file)
+        meta = {}
+        # Records are collected per file so a report that turns out invalid adds nothing
+        records = list(iter_scenarios(json_file, meta, include_steps=include_steps))
+    except EmptyReportError:
+        aggregate["skipped_files"] = 1
+        aggregate["messages"].append(f"Empty file: {json_file}")
+        return aggregate
+    except ReportParseError as e:
+        aggregate["skipped_files"] = 1
+        aggregate["messages"].append(f"Invalid JSON in file {json_file}: {e}")
+        return aggregate
     except Exception as e:
-        print(f"Error reading file {json_file}: {e}")
-        return None
+        aggregate["skipped_files"] = 1
+        aggregate["messages"].append(f"Error reading file {json_file}: {e}")
+        return aggregate
+
+    aggregate["messages"].append(f"Processing file: {json_file}")
+    # Extract timing information if available
+    for time_field in ['start_time', 'end_time']:
+        if time_field in meta and isinstance(meta[time_field], str):
+            try:
+                aggregate[time_field] = datetime.fromisoformat(meta[time_field]).isoformat()
+            except (ValueError, TypeError) as e:
+                aggregate["messages"].append(f"Error parsing {time_field} in {json_file}: {e}")
+
+    for result in records:
+        counter = status_counter(result["status"])
+        aggregate["total_scenarios"] += 1
+        aggregate[counter] += 1
+
+        feature = aggregate["features"].setdefault(result["feature"], {
+            "total_scenarios": 0,
+            "passed_scenarios": 0,
+            "failed_scenarios": 0,
+            "skipped_scenarios": 0,
+            "duration": 0.0
+        })
+        feature["total_scenarios"] += 1
+        feature[counter] += 1
+        feature["duration"] += result["duration"]
+
+        aggregate["test_results"].append(result)
+    return aggregate
+
+def merge_aggregates(left, right):
+    """
+    Merge right into left. Associative, so partial aggregates can be combined in any grouping.
+    """
+    for key in ["files", "skipped_files", "bytes", "total_scenarios", "passed_scenarios",
+                "failed_scenarios", "skipped_scenarios"]:
+        left[key] += right[key]
+
+    if right["start_time"] and (not left["start_time"] or right["start_time"] < left["start_time"]):
+        left["start_time"] = right["start_time"]
+    if right["end_time"] and (not left["end_time"] or right["end_time"] > left["end_time"]):
+        left["end_time"] = right["end_time"]
+
+    for name, rollup in right["features"].items():
+        if name not in left["features"]:
+            left["features"][name] = dict(rollup)
+            continue
+        merged = left["features"][name]
+        for key, value in rollup.items():
+            merged[key] += value
+
+    left["test_results"].extend(right["test_results"])
+    left["messages"].extend(right["messages"])
+    return left
 
-def combine_json_reports():
+def print_messages(aggregates):
+    """
+    Print the messages of each partial aggregate as it arrives, in file order
+    """
+    for aggregate in aggregates:
+        for message in aggregate["messages"]:
+            print(message)
+        aggregate["messages"] = []
+        yield aggregate
+
+def ingest_reports(json_files, workers, include_steps=False):
+    """
+    Summarise reports in a process pool and reduce the partial aggregates
+    """
+    summarize = partial(summarize_report, include_steps=include_steps)
+    if workers > 1 and len(json_files) > 1:
+        workers = min(workers, len(json_files))
+        # A few chunks per worker keeps them busy without a round trip per file
+        chunksize = max(1, len(json_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = pool.map(summarize, json_files, chunksize=chunksize)
+            return reduce(merge_aggregates, print_messages(partials), empty_aggregate())
+    return reduce(merge_aggregates, print_messages(map(summarize, json_files)), empty_aggregate())
+
+def combine_json_reports(workers=None, include_steps=False):
     """
     Combines all JSON reports from different test runs into a single report
     """
+    workers = workers or os.cpu_count() or 1
     combined_data = {
         "start_time": datetime.now().isoformat(),
         "end_time": datetime.now().isoformat(),
@@ -35,6 +155,7 @@ def combine_json_reports():
         "passed_scenarios": 0,
         "failed_scenarios": 0,
         "skipped_scenarios": 0,
+        "features": {},
         "test_results": []
     }
 
@@ -46,207 +167,137 @@ def combine_json_reports():
         print("No JSON result files found!")
         return combined_data
 
-    for json_file in json_files:
-        data = read_json_file(json_file)
-        if not data:
-            continue
+    start = time.perf_counter()
+    aggregate = ingest_reports(sorted(json_files), workers, include_steps)
+    elapsed = time.perf_counter() - start
 
-        print(f"Processing file: {json_file}")
-        try:
-            # Handle different JSON structures
-            if isinstance(data, dict):
-                # Extract timing information if available
-                for time_field in ['start_time', 'end_time']:
-                    if time_field in data and isinstance(data[time_field], str):
-                        try:
-                            time_value = datetime.fromisoformat(data[time_field])
-                            if (time_field == 'start_time' and 
-                                (not combined_data[time_field] or 
-                                 time_value.isoformat() < combined_data[time_field])):
-                                combined_data[time_field] = time_value.isoformat()
-                            elif (time_field == 'end_time' and 
-                                  (not combined_data[time_field] or 
-                                   time_value.isoformat() > combined_data[time_field])):
-                                combined_data[time_field] = time_value.isoformat()
-                        except (ValueError, TypeError) as e:
-                            print(f"Error parsing {time_field} in {json_file}: {e}")
-
-                # Process test results
-                features = data.get('features', [])
-                if not isinstance(features, list):
-                    print(f"Warning: 'features' in {json_file} is not a list")
-                    continue
-
-                for feature in features:
-                    if not isinstance(feature, dict):
-                        continue
-
-                    scenarios = feature.get('scenarios', [])
-                    if not isinstance(scenarios, list):
-                        continue
-
-                    for scenario in scenarios:
-                        if not isinstance(scenario, dict):
-                            continue
-
-                        combined_data["total_scenarios"] += 1
-                        status = scenario.get('status', 'unknown')
-                        
-                        if status == "passed":
-                            combined_data["passed_scenarios"] += 1
-                        elif status == "failed":
-                            combined_data["failed_scenarios"] += 1
-                        else:
-                            combined_data["skipped_scenarios"] += 1
-                        
-                        result = {
-                            "feature": feature.get('name', 'Unknown Feature'),
-                            "scenario": scenario.get('name', 'Unknown Scenario'),
-                            "status": status,
-                            "tags": scenario.get('tags', []),
-                            "duration": float(scenario.get('duration', 0))
-                        }
-                        combined_data["test_results"].append(result)
-            
-        except Exception as e:
-            print(f"Error processing data in {json_file}: {e}")
-            continue
+    for key in ["total_scenarios", "passed_scenarios", "failed_scenarios", "skipped_scenarios",
+                "features", "test_results"]:
+        combined_data[key] = aggregate[key]
+    if aggregate["start_time"] and aggregate["start_time"] < combined_data["start_time"]:
+        combined_data["start_time"] = aggregate["start_time"]
+    if aggregate["end_time"] and aggregate["end_time"] > combined_data["end_time"]:
+        combined_data["end_time"] = aggregate["end_time"]
 
+    combined_data["ingestion"] = {
+        "files": aggregate["files"],
+        "skipped_files": aggregate["skipped_files"],
+        "bytes": aggregate["bytes"],
+        "workers": min(workers, len(json_files)),
+        "seconds": round(elapsed, 3),
+        "files_per_second": round(aggregate["files"] / elapsed, 1) if elapsed else None,
+        "mb_per_second": round(aggregate["bytes"] / 1024 / 1024 / elapsed, 2) if elapsed else None
+    }
     return combined_data
 
-def generate_html_report(data):
-    """
-    Generates an HTML report from the combined test data
+def record_history(combined_data, db_path, run_id=None, git_sha=None, browser=None):
     """
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Combined Test Report</title>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                margin: 20px;
-                background-color: #f5f5f5;
-            }}
-            .summary {{
-                background-color: white;
-                padding: 20px;
-                margin-bottom: 20px;
-                border-radius: 5px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }}
-            .passed {{ color: #28a745; }}
-            .failed {{ color: #dc3545; }}
-            .skipped {{ color: #ffc107; }}
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin-top: 20px;
-                background-color: white;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }}
-            th, td {{
-                border: 1px solid #dee2e6;
-                padding: 12px;
-                text-align: left;
-            }}
-            th {{
-                background-color: #f8f9fa;
-            }}
-            tr:nth-child(even) {{
-                background-color: #f8f9fa;
-            }}
-            .status-passed {{ background-color: #d4edda; }}
-            .status-failed {{ background-color: #f8d7da; }}
-            .status-skipped {{ background-color: #fff3cd; }}
-            h1, h2 {{
-                color: #333;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="summary">
-            <h1>Test Execution Report</h1>
-            <p><strong>Total Scenarios:</strong> {total}</p>
-            <p class="passed"><strong>Passed:</strong> {passed}</p>
-            <p class="failed"><strong>Failed:</strong> {failed}</p>
-            <p class="skipped"><strong>Skipped:</strong> {skipped}</p>
-            <p><strong>Report Generated:</strong> {timestamp}</p>
-        </div>
-        
-        <div class="results">
-            <h2>Test Results</h2>
-            <table>
-                <tr>
-                    <th>Feature</th>
-                    <th>Scenario</th>
-                    <th>Status</th>
-                    <th>Tags</th>
-                    <th>Duration (s)</th>
-                </tr>
-                {test_rows}
-            </table>
-        </div>
-    </body>
-    </html>
+    Append the run's scenario and step durations to the results history database
     """
-    
-    # Generate test result rows
-    if not data.get("test_results"):
-        test_rows = "<tr><td colspan='5'>No test results found</td></tr>"
-    else:
-        test_rows = ""
-        for result in data["test_results"]:
-            status_class = f"status-{result['status'].lower()}"
-            test_rows += f"""
-                <tr class="{status_class}">
-                    <td>{result.get("feature", "Unknown Feature")}</td>
-                    <td>{result.get("scenario", "Unknown Scenario")}</td>
-                    <td>{result.get("status", "unknown")}</td>
-                    <td>{', '.join(result.get("tags", []))}</td>
-                    <td>{result.get("duration", 0):.2f}</td>
-                </tr>
-            """
+    run_id = run_id or default_run_id(browser)
+    git_sha = git_sha or current_git_sha()
+    start = time.perf_counter()
+    rows = record_run(db_path, run_id, combined_data["test_results"], git_sha, browser)
+    print(f"Recorded {rows} result(s) of run {run_id} ({git_sha[:10] if git_sha else 'unknown commit'}, "
+          f"{browser or 'unknown browser'}) in {db_path} in {time.perf_counter() - start:.2f}s")
 
-    # Debugging output to verify data structure
-    print(f"Debugging Data for HTML Report: {data}")
-
-    # Format the HTML content
-    return html_content.format(
-        total=data.get("total_scenarios", 0),
-        passed=data.get("passed_scenarios", 0),
-        failed=data.get("failed_scenarios", 0),
-        skipped=data.get("skipped_scenarios", 0),
-        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        test_rows=test_rows
-    )
+def synthetic_report_data(scenario_count):
+    """
+    Build combined data with generated scenarios, for benchmarking the renderer
+    """
+    statuses = ["passed"] * 8 + ["failed", "skipped"]
+    data = empty_aggregate()
+    for index in range(scenario_count):
+        status = statuses[index % len(statuses)]
+        feature = f"Feature {index % 50}"
+        data["total_scenarios"] += 1
+        data[status_counter(status)] += 1
+        rollup = data["features"].setdefault(feature, {
+            "total_scenarios": 0,
+            "passed_scenarios": 0,
+            "failed_scenarios": 0,
+            "skipped_scenarios": 0,
+            "duration": 0.0
+        })
+        rollup["total_scenarios"] += 1
+        rollup[status_counter(status)] += 1
+        rollup["duration"] += (index % 97) / 10
+        data["test_results"].append({
+            "feature": feature,
+            "scenario": f"Scenario {index} with <generated> name",
+            "status": status,
+            "tags": [f"@p{index % 4 + 1}", "@smoke"] if index % 3 else [f"@p{index % 4 + 1}"],
+            "duration": (index % 97) / 10
+        })
+    return data
 
+def benchmark_renderer(scenario_count):
+    """
+    Render synthetic reports of a tenth of and the full scenario count, printing time and size
+    """
+    for count in sorted({max(1, scenario_count // 10), scenario_count}):
+        data = synthetic_report_data(count)
+        report_path = f'reports/benchmark_report_{count}.html'
+        start = time.perf_counter()
+        write_html_report(data, report_path)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(report_path)
+        print(f"Rendered {count} scenarios in {elapsed:.3f}s ({elapsed / count * 1e6:.1f} us/scenario), "
+              f"{size / 1024 / 1024:.2f} MB ({size / count:.1f} bytes/scenario) at {report_path}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Combine behave JSON reports into an HTML report")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="Processes parsing reports concurrently (default: one per CPU core)")
+    parser.add_argument('--benchmark', type=int, metavar='SCENARIOS', default=None,
+                        help="Only render synthetic reports of this many scenarios and print timings")
+    parser.add_argument('--results-db', default=DEFAULT_DB_PATH,
+                        help=f"SQLite results history appended to on each run (default: {DEFAULT_DB_PATH})")
+    parser.add_argument('--no-history', action='store_true',
+                        help="Do not record the run in the results history")
+    parser.add_argument('--run-id', default=None,
+                        help="Run id in the results history "
+                             "(default: the GitHub Actions run, attempt, job and browser, else a timestamp)")
+    parser.add_argument('--git-sha', default=None,
+                        help="Commit under test (default: GITHUB_SHA, else git rev-parse HEAD)")
+    parser.add_argument('--browser', default=os.getenv('BROWSER'),
+                        help="Browser the reports were produced with (default: BROWSER)")
+    args = parser.parse_args()
+
     try:
         print("Starting report generation...")
         
         # Create reports directory if it doesn't exist
         os.makedirs('reports', exist_ok=True)
+
+        if args.benchmark:
+            benchmark_renderer(args.benchmark)
+            return
         
         # Combine JSON reports
-        combined_data = combine_json_reports()
+        combined_data = combine_json_reports(args.workers, include_steps=not args.no_history)
         print(f"Combined data summary:")
         print(f"Total scenarios: {combined_data['total_scenarios']}")
         print(f"Passed: {combined_data['passed_scenarios']}")
         print(f"Failed: {combined_data['failed_scenarios']}")
         print(f"Skipped: {combined_data['skipped_scenarios']}")
+        for name, rollup in sorted(combined_data['features'].items()):
+            print(f"  {name}: {rollup['passed_scenarios']}/{rollup['total_scenarios']} passed "
+                  f"in {rollup['duration']:.2f}s")
+        ingestion = combined_data.get('ingestion')
+        if ingestion:
+            print(f"Ingested {ingestion['files']} file(s), {ingestion['bytes'] / 1024 / 1024:.2f} MB "
+                  f"in {ingestion['seconds']:.2f}s with {ingestion['workers']} worker(s): "
+                  f"{ingestion['files_per_second']} files/s, {ingestion['mb_per_second']} MB/s")
         
-        # Generate HTML report
-        html_content = generate_html_report(combined_data)
-        
-        # Write the combined report
+        # Stream the combined HTML report to disk
         report_path = 'reports/combined_report.html'
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        write_html_report(combined_data, report_path)
         
         print(f"Report successfully generated at: {report_path}")
+
+        if not args.no_history and combined_data['test_results']:
+            record_history(combined_data, args.results_db, args.run_id, args.git_sha, args.browser)
         
     except Exception as e:
         print(f"Error in main: {str(e)}")
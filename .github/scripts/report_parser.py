@@ -0,0 +1,357 @@
+# .github/scripts/report_parser.py
+
+import json
+import re
+
+# Characters read from a report at a time
+CHUNK_SIZE = 64 * 1024
+
+# Top-level keys of a wrapped report kept as run metadata
+META_KEYS = ('start_time', 'end_time')
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Longest run of string content without the closing quote
+_STRING_CONTENT = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S)
+# Characters that matter while skipping over a nested value
+_STRUCTURE = re.compile(r'[{}\[\]"]')
+_SCALAR = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null')
+# Longest scalar token read in one piece
+_SCALAR_LOOKAHEAD = 64
+
+
+class ReportParseError(ValueError):
+    """
+    Raised when a report is not valid JSON
+    """
+
+
+class EmptyReportError(ReportParseError):
+    """
+    Raised when a report file has no content
+    """
+
+
+class _Reader:
+    """
+    Pull tokenizer over a JSON file read in fixed-size chunks. Only the unread
+    part of the current chunk is kept, so skipping large values (step logs,
+    embedded screenshots) costs time proportional to their size but no memory.
+    """
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """
+        Drop consumed text and append the next chunk, returns False at end of file
+        """
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message: str):
+        return ReportParseError(f"{message} at offset {self.offset + self.pos}")
+
+    def peek(self) -> str:
+        """
+        Get the next non-whitespace character without consuming it, '' at end of file
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        """
+        Consume the next non-whitespace character, which must be char
+        """
+        found = self.peek()
+        if found != char:
+            raise self.error(f"Expected {char!r}, found {found!r}" if found else f"Expected {char!r}, found end of file")
+        self.pos += 1
+
+    def _scan_string(self, keep: bool):
+        """
+        Consume string content up to and including the closing quote, returning the raw content if keep
+        """
+        parts = []
+        while True:
+            end = _STRING_CONTENT.match(self.buf, self.pos).end()
+            if keep:
+                parts.append(self.buf[self.pos:end])
+            if end < len(self.buf) and self.buf[end] == '"':
+                self.pos = end + 1
+                return ''.join(parts) if keep else None
+            # The chunk ended inside the string, possibly right after a backslash
+            self.pos = end
+            if not self._fill():
+                raise self.error("Unterminated string")
+
+    def read_string(self) -> str:
+        """
+        Read a string value
+        """
+        self.expect('"')
+        raw = self._scan_string(keep=True)
+        try:
+            return json.loads(f'"{raw}"')
+        except json.JSONDecodeError as e:
+            raise self.error(f"Invalid string: {e.msg}")
+
+    def read_scalar(self):
+        """
+        Read a number, true, false or null
+        """
+        self.peek()
+        while len(self.buf) - self.pos < _SCALAR_LOOKAHEAD and self._fill():
+            pass
+        match = _SCALAR.match(self.buf, self.pos)
+        if not match:
+            raise self.error(f"Unexpected character {self.buf[self.pos:self.pos + 1]!r}")
+        self.pos = match.end()
+        return json.loads(match.group())
+
+    def read_value(self):
+        """
+        Read a whole value, only used for small values such as names and tags
+        """
+        char = self.peek()
+        if char == '"':
+            return self.read_string()
+        if char == '[':
+            return [self.read_value() for _ in self.iter_array()]
+        if char == '{':
+            return {key: self.read_value() for key in self.iter_object()}
+        return self.read_scalar()
+
+    def skip_value(self):
+        """
+        Consume a value without building it
+        """
+        char = self.peek()
+        if char == '"':
+            self.pos += 1
+            self._scan_string(keep=False)
+            return
+        if char not in ('{', '['):
+            self.read_scalar()
+            return
+
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise self.error("Unexpected end of file")
+                continue
+            self.pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._scan_string(keep=False)
+            elif char in ('{', '['):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def iter_object(self):
+        """
+        Yield the keys of an object, the caller reads or skips each value before the next key
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.read_string()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                self.pos -= 1
+                raise self.error(f"Expected ',' or '}}', found {char!r}")
+
+    def iter_array(self):
+        """
+        Yield once per array item, the caller reads or skips each item before the next one
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                self.pos -= 1
+                raise self.error(f"Expected ',' or ']', found {char!r}")
+
+
+def _read_step(reader: _Reader) -> dict:
+    """
+    Read the keyword, name, status and duration of a step, steps that never ran have no result
+    """
+    keyword = ''
+    name = ''
+    status = 'untested'
+    duration = None
+
+    for key in reader.iter_object():
+        if key == 'keyword':
+            keyword = reader.read_value()
+        elif key == 'name':
+            name = reader.read_value()
+        elif key == 'result' and reader.peek() == '{':
+            for result_key in reader.iter_object():
+                if result_key == 'status':
+                    status = reader.read_value()
+                elif result_key == 'duration':
+                    duration = reader.read_value()
+                else:
+                    reader.skip_value()
+        else:
+            reader.skip_value()
+
+    return {
+        'step': f"{keyword} {name}".strip(),
+        'status': status,
+        'duration': float(duration) if duration is not None else None
+    }
+
+
+def _read_scenario(reader: _Reader, include_steps: bool = False):
+    """
+    Read the name, status, tags and duration of a scenario element, or None for a background
+    """
+    name = 'Unknown Scenario'
+    status = 'unknown'
+    tags = []
+    duration = None
+    steps = []
+    is_background = False
+
+    for key in reader.iter_object():
+        if key == 'type':
+            is_background = reader.read_value() == 'background'
+        elif key == 'name':
+            name = reader.read_value()
+        elif key == 'status':
+            status = reader.read_value()
+        elif key == 'tags':
+            tags = reader.read_value()
+        elif key == 'duration':
+            duration = reader.read_value()
+        elif key == 'steps' and reader.peek() == '[':
+            for _ in reader.iter_array():
+                if reader.peek() != '{':
+                    reader.skip_value()
+                    continue
+                steps.append(_read_step(reader))
+        else:
+            reader.skip_value()
+
+    if is_background:
+        return None
+    scenario = {
+        'scenario': name,
+        'status': status,
+        'tags': tags,
+        'duration': float(duration) if duration is not None else sum(step['duration'] or 0 for step in steps)
+    }
+    if include_steps:
+        scenario['steps'] = steps
+    return scenario
+
+
+def _read_feature(reader: _Reader, include_steps: bool = False):
+    """
+    Yield the scenario records of a feature as they are parsed
+    """
+    name = None
+    # Scenarios parsed before the feature name, only when a report puts the name last
+    pending = []
+
+    for key in reader.iter_object():
+        if key == 'name':
+            name = reader.read_value()
+        elif key in ('elements', 'scenarios') and reader.peek() == '[':
+            for _ in reader.iter_array():
+                if reader.peek() != '{':
+                    reader.skip_value()
+                    continue
+                scenario = _read_scenario(reader, include_steps)
+                if scenario is None:
+                    continue
+                if name is None:
+                    pending.append(scenario)
+                else:
+                    yield {'feature': name, **scenario}
+        else:
+            reader.skip_value()
+
+    for scenario in pending:
+        yield {'feature': name if name is not None else 'Unknown Feature', **scenario}
+
+
+def _read_features(reader: _Reader, include_steps: bool = False):
+    """
+    Yield the scenario records of every feature in an array
+    """
+    for _ in reader.iter_array():
+        if reader.peek() == '{':
+            yield from _read_feature(reader, include_steps)
+        else:
+            reader.skip_value()
+
+
+def iter_scenarios(path: str, meta: dict = None, chunk_size: int = CHUNK_SIZE, include_steps: bool = False):
+    """
+    Stream the scenario records (feature, scenario, status, tags, duration) of a behave JSON report,
+    with a 'steps' list of step, status and duration records when include_steps.
+    Accepts behave's plain list of features or an object with a 'features' list; the
+    start_time/end_time of the latter are stored into meta when given.
+    Raises EmptyReportError for an empty file and ReportParseError for invalid JSON.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f, chunk_size)
+        char = reader.peek()
+        if not char:
+            raise EmptyReportError(f"Empty file: {path}")
+
+        if char == '[':
+            yield from _read_features(reader, include_steps)
+        elif char == '{':
+            for key in reader.iter_object():
+                if key == 'features' and reader.peek() == '[':
+                    yield from _read_features(reader, include_steps)
+                elif key in META_KEYS and meta is not None:
+                    meta[key] = reader.read_value()
+                else:
+                    reader.skip_value()
+        else:
+            reader.skip_value()
+
+        if reader.peek():
+            raise reader.error("Extra data after the report")
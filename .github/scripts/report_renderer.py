@@ -0,0 +1,283 @@
+# .github/scripts/report_renderer.py
+
+import html
+import json
+from datetime import datetime
+
+# Rows encoded per write while streaming the results payload
+WRITE_BATCH_SIZE = 1000
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Combined Test Report</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .summary, .controls {
+            background-color: white;
+            padding: 20px;
+            margin-bottom: 20px;
+            border-radius: 5px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .passed { color: #28a745; }
+        .failed { color: #dc3545; }
+        .skipped { color: #ffc107; }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 20px;
+            background-color: white;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        th, td {
+            border: 1px solid #dee2e6;
+            padding: 12px;
+            text-align: left;
+        }
+        th {
+            background-color: #f8f9fa;
+        }
+        th[data-sort] {
+            cursor: pointer;
+        }
+        tr:nth-child(even) {
+            background-color: #f8f9fa;
+        }
+        .status-passed { background-color: #d4edda; }
+        .status-failed { background-color: #f8d7da; }
+        .status-skipped { background-color: #fff3cd; }
+        .controls input, .controls select, .controls button {
+            margin-right: 10px;
+        }
+        h1, h2 {
+            color: #333;
+        }
+    </style>
+</head>
+<body>
+"""
+
+HTML_RESULTS = """
+    <div class="results">
+        <h2>Test Results</h2>
+        <div class="controls">
+            <input id="filter-text" type="search" placeholder="Filter by feature, scenario or tag">
+            <select id="filter-status">
+                <option value="">All statuses</option>
+            </select>
+            <select id="page-size">
+                <option>50</option>
+                <option selected>100</option>
+                <option>500</option>
+            </select>
+            <button id="prev-page">Previous</button>
+            <span id="page-info"></span>
+            <button id="next-page">Next</button>
+        </div>
+        <table>
+            <thead>
+                <tr>
+                    <th data-sort="feature">Feature</th>
+                    <th data-sort="scenario">Scenario</th>
+                    <th data-sort="status">Status</th>
+                    <th data-sort="tags">Tags</th>
+                    <th data-sort="duration">Duration (s)</th>
+                </tr>
+            </thead>
+            <tbody id="results"></tbody>
+        </table>
+    </div>
+"""
+
+# Decodes the columnar payload and renders one page of rows at a time
+HTML_SCRIPT = """
+    <script>
+    (function () {
+        var data = JSON.parse(document.getElementById('report-data').textContent);
+        var rows = data.rows.map(function (row, index) {
+            return {
+                index: index,
+                feature: data.features[row[0]],
+                scenario: row[1],
+                status: data.statuses[row[2]],
+                tags: row[3].map(function (tag) { return data.tags[tag]; }).join(', '),
+                duration: row[4]
+            };
+        });
+        var view = rows;
+        var page = 0;
+        var sortKey = null;
+        var sortDirection = 1;
+
+        var tbody = document.getElementById('results');
+        var filterText = document.getElementById('filter-text');
+        var filterStatus = document.getElementById('filter-status');
+        var pageSize = document.getElementById('page-size');
+        var pageInfo = document.getElementById('page-info');
+
+        data.statuses.forEach(function (status) {
+            var option = document.createElement('option');
+            option.value = option.textContent = status;
+            filterStatus.appendChild(option);
+        });
+
+        function cell(tr, text) {
+            var td = document.createElement('td');
+            td.textContent = text;
+            tr.appendChild(td);
+        }
+
+        function render() {
+            var size = parseInt(pageSize.value, 10);
+            var pages = Math.max(1, Math.ceil(view.length / size));
+            page = Math.min(page, pages - 1);
+            var fragment = document.createDocumentFragment();
+            if (!view.length) {
+                var empty = document.createElement('tr');
+                var td = document.createElement('td');
+                td.colSpan = 5;
+                td.textContent = 'No test results found';
+                empty.appendChild(td);
+                fragment.appendChild(empty);
+            }
+            view.slice(page * size, (page + 1) * size).forEach(function (row) {
+                var tr = document.createElement('tr');
+                tr.className = 'status-' + String(row.status).toLowerCase();
+                cell(tr, row.feature);
+                cell(tr, row.scenario);
+                cell(tr, row.status);
+                cell(tr, row.tags);
+                cell(tr, row.duration.toFixed(2));
+                fragment.appendChild(tr);
+            });
+            tbody.textContent = '';
+            tbody.appendChild(fragment);
+            pageInfo.textContent = 'Page ' + (page + 1) + ' of ' + pages + ' (' + view.length + ' scenarios)';
+        }
+
+        function update() {
+            var text = filterText.value.trim().toLowerCase();
+            var status = filterStatus.value;
+            view = rows.filter(function (row) {
+                return (!status || row.status === status) && (!text ||
+                    (row.feature + '\\n' + row.scenario + '\\n' + row.tags).toLowerCase().indexOf(text) !== -1);
+            });
+            if (sortKey) {
+                view.sort(function (a, b) {
+                    var x = a[sortKey], y = b[sortKey];
+                    return (x < y ? -1 : x > y ? 1 : a.index - b.index) * sortDirection;
+                });
+            }
+            page = 0;
+            render();
+        }
+
+        document.querySelectorAll('th[data-sort]').forEach(function (th) {
+            th.addEventListener('click', function () {
+                sortDirection = sortKey === th.dataset.sort ? -sortDirection : 1;
+                sortKey = th.dataset.sort;
+                update();
+            });
+        });
+        filterText.addEventListener('input', update);
+        filterStatus.addEventListener('change', update);
+        pageSize.addEventListener('change', render);
+        document.getElementById('prev-page').addEventListener('click', function () { page = Math.max(0, page - 1); render(); });
+        document.getElementById('next-page').addEventListener('click', function () { page += 1; render(); });
+        render();
+    })();
+    </script>
+</body>
+</html>
+"""
+
+
+def _script_json(value) -> str:
+    """
+    Encode a value as compact JSON that is safe inside a script element
+    """
+    # '<' only occurs inside JSON strings, where \\u003c is equivalent
+    return _encode(value).replace('<', '\\u003c')
+
+
+def _summary_html(data: dict) -> str:
+    """
+    Render the summary and per-feature rollup, small regardless of the scenario count
+    """
+    parts = [
+        '    <div class="summary">\n',
+        '        <h1>Test Execution Report</h1>\n',
+        f'        <p><strong>Total Scenarios:</strong> {data.get("total_scenarios", 0)}</p>\n',
+        f'        <p class="passed"><strong>Passed:</strong> {data.get("passed_scenarios", 0)}</p>\n',
+        f'        <p class="failed"><strong>Failed:</strong> {data.get("failed_scenarios", 0)}</p>\n',
+        f'        <p class="skipped"><strong>Skipped:</strong> {data.get("skipped_scenarios", 0)}</p>\n',
+        f'        <p><strong>Report Generated:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>\n',
+        '    </div>\n'
+    ]
+
+    features = data.get("features") or {}
+    if features:
+        parts.append('    <div class="features">\n        <h2>Features</h2>\n        <table>\n')
+        parts.append('            <tr><th>Feature</th><th>Scenarios</th><th>Passed</th><th>Failed</th>'
+                     '<th>Skipped</th><th>Duration (s)</th></tr>\n')
+        for name, rollup in sorted(features.items()):
+            parts.append(
+                f'            <tr><td>{html.escape(str(name))}</td><td>{rollup["total_scenarios"]}</td>'
+                f'<td>{rollup["passed_scenarios"]}</td><td>{rollup["failed_scenarios"]}</td>'
+                f'<td>{rollup["skipped_scenarios"]}</td><td>{rollup["duration"]:.2f}</td></tr>\n'
+            )
+        parts.append('        </table>\n    </div>\n')
+    return ''.join(parts)
+
+
+def write_html_report(data: dict, path: str):
+    """
+    Stream the HTML report to path. Results are embedded as one compact JSON
+    payload, with features, statuses and tags stored once and referenced by
+    index, and rendered client-side a page at a time.
+    """
+    results = data.get("test_results") or []
+    features, statuses, tags = {}, {}, {}
+
+    def index_of(table, value):
+        index = table.get(value)
+        if index is None:
+            index = table[value] = len(table)
+        return index
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(HTML_HEAD)
+        f.write(_summary_html(data))
+        f.write(HTML_RESULTS)
+
+        # Rows first, the lookup tables are complete only once every row is encoded
+        f.write('    <script id="report-data" type="application/json">{"rows":[')
+        for start in range(0, len(results), WRITE_BATCH_SIZE):
+            batch = []
+            for result in results[start:start + WRITE_BATCH_SIZE]:
+                batch.append(_script_json([
+                    index_of(features, str(result.get("feature", "Unknown Feature"))),
+                    str(result.get("scenario", "Unknown Scenario")),
+                    index_of(statuses, str(result.get("status", "unknown"))),
+                    [index_of(tags, str(tag)) for tag in result.get("tags", [])],
+                    round(float(result.get("duration", 0)), 3)
+                ]))
+            if start:
+                f.write(',')
+            f.write(','.join(batch))
+        f.write('],"features":')
+        f.write(_script_json(list(features)))
+        f.write(',"statuses":')
+        f.write(_script_json(list(statuses)))
+        f.write(',"tags":')
+        f.write(_script_json(list(tags)))
+        f.write('}</script>\n')
+        f.write(HTML_SCRIPT)
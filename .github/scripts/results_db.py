@@ -0,0 +1,254 @@
+# .github/scripts/results_db.py
+
+import argparse
+import math
+import os
+import sqlite3
+import subprocess
+from datetime import datetime, timezone
+
+# Local results history, appended to by combine_reports.py on every run
+DEFAULT_DB_PATH = os.getenv('RESULTS_DB', 'reports/results_history.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    git_sha TEXT,
+    browser TEXT,
+    recorded_at TEXT NOT NULL,
+    scenarios INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    feature TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    step_index INTEGER,
+    step TEXT,
+    status TEXT NOT NULL,
+    duration REAL,
+    browser TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_history ON results (feature, scenario, step_index, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results (run_id, step_index);
+CREATE INDEX IF NOT EXISTS idx_runs_recorded_at ON runs (recorded_at);
+"""
+
+
+def connect(db_path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """
+    Open the results database, creating the schema on first use
+    """
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def current_git_sha() -> str:
+    """
+    Commit under test: GITHUB_SHA in CI, otherwise the checkout's HEAD, None outside a git checkout
+    """
+    sha = os.getenv('GITHUB_SHA')
+    if sha:
+        return sha
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def default_run_id(browser: str = None) -> str:
+    """
+    Run id of the current run: the GitHub Actions run, attempt, job and browser, otherwise a
+    timestamp and the browser. Jobs of one workflow run (e.g. a browser matrix) get distinct
+    ids, so recording one does not replace the others.
+    """
+    if os.getenv('GITHUB_RUN_ID'):
+        parts = [os.getenv('GITHUB_RUN_ID'), os.getenv('GITHUB_RUN_ATTEMPT', '1'), os.getenv('GITHUB_JOB')]
+    else:
+        parts = [datetime.now().strftime('%Y%m%d_%H%M%S')]
+    return '-'.join(part for part in parts + [browser] if part)
+
+
+def _result_rows(run_id: str, results: list, browser: str):
+    """
+    Flatten scenario records into one row per scenario (step_index NULL) and one per step
+    """
+    for result in results:
+        yield (run_id, result["feature"], result["scenario"], None, None,
+               result["status"], result["duration"], browser)
+        for index, step in enumerate(result.get("steps", [])):
+            yield (run_id, result["feature"], result["scenario"], index, step["step"],
+                   step["status"], step["duration"], browser)
+
+
+def record_run(db_path: str, run_id: str, results: list, git_sha: str = None, browser: str = None) -> int:
+    """
+    Append a run's scenario and step results in one transaction. Recording a run id again
+    replaces its results, so re-running the combiner does not duplicate history.
+    Returns the number of rows written.
+    """
+    connection = connect(db_path)
+    try:
+        with connection:
+            connection.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            connection.execute(
+                "INSERT INTO runs (run_id, git_sha, browser, recorded_at, scenarios) VALUES (?, ?, ?, ?, ?)",
+                (run_id, git_sha, browser, datetime.now(timezone.utc).isoformat(timespec='seconds'), len(results))
+            )
+            cursor = connection.executemany(
+                "INSERT INTO results (run_id, feature, scenario, step_index, step, status, duration, browser) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                _result_rows(run_id, results, browser)
+            )
+            return cursor.rowcount
+    finally:
+        connection.close()
+
+
+def percentile(values: list, fraction: float):
+    """
+    Nearest-rank percentile of a list of numbers, None when it is empty
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = min(max(1, math.ceil(fraction * len(ordered))), len(ordered))
+    return ordered[rank - 1]
+
+
+def list_runs(connection: sqlite3.Connection, limit: int = 20) -> list:
+    """
+    Most recent runs first: (run_id, recorded_at, git_sha, browser, scenarios)
+    """
+    return connection.execute(
+        "SELECT run_id, recorded_at, git_sha, browser, scenarios FROM runs "
+        "ORDER BY recorded_at DESC, rowid DESC LIMIT ?", (limit,)
+    ).fetchall()
+
+
+def duration_trend(connection: sqlite3.Connection, scenario: str = None, step: str = None,
+                   last: int = 10, browser: str = None) -> list:
+    """
+    p50/p95 of passed durations per run over the last runs, oldest first. Covers every
+    scenario when no scenario is given, or the steps of a scenario matching step.
+    Returns (run_id, recorded_at, git_sha, samples, p50, p95) rows.
+    """
+    runs = connection.execute(
+        "SELECT run_id, recorded_at, git_sha FROM runs WHERE (? IS NULL OR browser = ?) "
+        "ORDER BY recorded_at DESC, rowid DESC LIMIT ?", (browser, browser, last)
+    ).fetchall()
+
+    query = "SELECT duration FROM results WHERE run_id = ? AND status = 'passed' AND duration IS NOT NULL"
+    params = []
+    if scenario is not None:
+        query += " AND scenario = ?"
+        params.append(scenario)
+    if step is not None:
+        query += " AND step_index IS NOT NULL AND step LIKE ?"
+        params.append(f"%{step}%")
+    else:
+        query += " AND step_index IS NULL"
+
+    trend = []
+    for run_id, recorded_at, git_sha in reversed(runs):
+        durations = [row[0] for row in connection.execute(query, [run_id, *params])]
+        trend.append((run_id, recorded_at, git_sha, len(durations),
+                      percentile(durations, 0.5), percentile(durations, 0.95)))
+    return trend
+
+
+def _median_durations(connection: sqlite3.Connection, run_id: str, steps: bool) -> dict:
+    """
+    Median passed duration of each scenario (or step) of a run, keyed by feature, scenario, step index and step.
+    Scenario outlines can repeat a name, so a key may have several samples.
+    """
+    step_filter = "step_index IS NOT NULL" if steps else "step_index IS NULL"
+    samples = {}
+    for feature, scenario, step_index, step, duration in connection.execute(
+            "SELECT feature, scenario, step_index, step, duration FROM results "
+            f"WHERE run_id = ? AND {step_filter} AND status = 'passed' AND duration IS NOT NULL", (run_id,)):
+        samples.setdefault((feature, scenario, step_index, step), []).append(duration)
+    return {key: percentile(durations, 0.5) for key, durations in samples.items()}
+
+
+def regressions(connection: sqlite3.Connection, base_run: str, run: str, steps: bool = False,
+                min_delta: float = 0.0, limit: int = 20) -> list:
+    """
+    Scenarios (or steps) passing in both runs whose median duration grew from base_run to run,
+    largest slowdown first. Returns (feature, scenario, step, base duration, duration, delta, ratio) rows.
+    """
+    base = _median_durations(connection, base_run, steps)
+    rows = []
+    for key, current in _median_durations(connection, run, steps).items():
+        previous = base.get(key)
+        if previous is None or current - previous <= min_delta:
+            continue
+        feature, scenario, _, step = key
+        rows.append((feature, scenario, step, previous, current, current - previous,
+                     current / previous if previous else None))
+    rows.sort(key=lambda row: row[5], reverse=True)
+    return rows[:limit]
+
+
+def _format_seconds(value) -> str:
+    return f"{value:.3f}" if value is not None else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the scenario and step duration history")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help=f"Results database (default: {DEFAULT_DB_PATH})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    runs_parser = commands.add_parser('runs', help="List recorded runs, most recent first")
+    runs_parser.add_argument('--limit', type=int, default=20)
+
+    trend_parser = commands.add_parser('trend', help="p50/p95 durations per run")
+    trend_parser.add_argument('--scenario', help="Only this scenario (default: every scenario)")
+    trend_parser.add_argument('--step', help="Steps of the scenario containing this text instead of whole scenarios")
+    trend_parser.add_argument('--browser', help="Only runs on this browser")
+    trend_parser.add_argument('--last', type=int, default=10, help="Number of most recent runs (default: 10)")
+
+    regressions_parser = commands.add_parser('regressions', help="Slowest regressions between two runs")
+    regressions_parser.add_argument('base_run', help="Run id compared against")
+    regressions_parser.add_argument('run', help="Run id checked for regressions")
+    regressions_parser.add_argument('--steps', action='store_true', help="Compare steps instead of scenarios")
+    regressions_parser.add_argument('--min-delta', type=float, default=0.0, help="Minimum slowdown in seconds")
+    regressions_parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        parser.error(f"No results database at {args.db}")
+    connection = connect(args.db)
+    try:
+        if args.command == 'runs':
+            for run_id, recorded_at, git_sha, browser, scenarios in list_runs(connection, args.limit):
+                print(f"{run_id}  {recorded_at}  {(git_sha or '-')[:10]}  {browser or '-'}  {scenarios} scenarios")
+
+        elif args.command == 'trend':
+            if args.step and not args.scenario:
+                parser.error("--step requires --scenario")
+            print(f"{'run':<24} {'recorded':<26} {'commit':<10} {'samples':>7} {'p50 (s)':>9} {'p95 (s)':>9}")
+            for run_id, recorded_at, git_sha, samples, p50, p95 in duration_trend(
+                    connection, args.scenario, args.step, args.last, args.browser):
+                print(f"{run_id:<24} {recorded_at:<26} {(git_sha or '-')[:10]:<10} {samples:>7} "
+                      f"{_format_seconds(p50):>9} {_format_seconds(p95):>9}")
+
+        elif args.command == 'regressions':
+            rows = regressions(connection, args.base_run, args.run, args.steps, args.min_delta, args.limit)
+            if not rows:
+                print(f"No regressions from {args.base_run} to {args.run}")
+            for feature, scenario, step, base, current, delta, ratio in rows:
+                name = f"{feature} / {scenario}" + (f" / {step}" if step else "")
+                ratio_text = f"x{ratio:.2f}" if ratio is not None else "x-"
+                print(f"+{delta:.3f}s ({ratio_text})  {_format_seconds(base)}s -> {_format_seconds(current)}s  {name}")
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
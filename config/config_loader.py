@@ -0,0 +1,183 @@
+import copy
+import json
+import os
+import threading
+from config.logging_config import logger
+from utils.browser_manager import SUPPORTED_BROWSERS
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Values used when the environment config does not set them
+DEFAULTS = {
+    'timeout': 30000,
+    'state_change_timeout': 2000,
+    'legacy_fixed_waits': False,
+    'validate_locators_on_load': False,
+    'browser': 'chromium',
+    'headless': False,
+    'viewport': {'width': 1920, 'height': 1080}
+}
+
+# Keys every environment config must provide, with their expected types
+REQUIRED_KEYS = {
+    'base_url': str,
+    'timeout': int,
+    'viewport': dict
+}
+
+# Prefix of environment variables overriding config values, e.g. CONFIG_TIMEOUT=10000
+# or CONFIG_CONTEXT_POOL__SIZE=4. Only keys the config already has are overridden.
+ENV_OVERRIDE_PREFIX = 'CONFIG_'
+
+
+def _deep_merge(base: dict, override: dict) -> dict:
+    """
+    Merge override into a copy of base, recursing into nested dicts
+    """
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _parse_env_value(value: str):
+    """
+    Parse an override value as JSON, falling back to the plain string
+    """
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+class ConfigLoader:
+    """
+    Loads, validates and merges the environment config once per process.
+    Every page object and hook shares the same dict, which is reloaded
+    only when the config file changes on disk.
+    """
+
+    def __init__(self, config_dir: str = CONFIG_DIR):
+        self.config_dir = config_dir
+        self.load_count = 0
+        self._entries = {}
+        self._runtime_overrides = {}
+        self._lock = threading.Lock()
+
+    def config_path(self, env: str) -> str:
+        """
+        Get the config file of an environment
+        """
+        return os.path.join(self.config_dir, f'{env}_config.json')
+
+    def get(self, env: str = None) -> dict:
+        """
+        Get the config of an environment (default: ENV), loading it on first use or when the file changed
+        """
+        env = env or os.getenv('ENV', 'dev')
+        config_path = self.config_path(env)
+        try:
+            stat = os.stat(config_path)
+        except OSError as e:
+            logger.error(f"Failed to load config file {config_path}: {str(e)}")
+            raise
+
+        # Size is compared too, as mtime granularity can hide quick successive writes
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(env)
+        if entry is not None and entry['version'] == version:
+            return entry['config']
+
+        with self._lock:
+            entry = self._entries.get(env)
+            if entry is None or entry['version'] != version:
+                if entry is not None:
+                    logger.info(f"Config file {config_path} changed, reloading")
+                entry = {'version': version, 'config': self._load(env, config_path)}
+                self._entries[env] = entry
+        return entry['config']
+
+    def _load(self, env: str, config_path: str) -> dict:
+        """
+        Read, merge and validate a config file and apply the overrides
+        """
+        try:
+            with open(config_path, 'r') as f:
+                config = _deep_merge(DEFAULTS, json.load(f))
+            self._apply_env_overrides(config)
+            config = _deep_merge(config, self._runtime_overrides)
+            self._validate(config)
+        except Exception as e:
+            logger.error(f"Failed to load config file {config_path}: {str(e)}")
+            raise
+        self.load_count += 1
+        logger.info(f"Loaded configuration for environment: {env}")
+        return config
+
+    @staticmethod
+    def _apply_env_overrides(config: dict):
+        """
+        Apply BASE_URL and CONFIG_* environment variable overrides. Variables naming a key
+        the merged config does not have are ignored, so unrelated CI variables sharing
+        the prefix never end up in the config.
+        """
+        ignored = []
+        for name, value in sorted(os.environ.items()):
+            if not name.startswith(ENV_OVERRIDE_PREFIX):
+                continue
+            keys = [key.lower() for key in name[len(ENV_OVERRIDE_PREFIX):].split('__')]
+            target = config
+            for key in keys[:-1]:
+                target = target.get(key) if isinstance(target, dict) else None
+            if not isinstance(target, dict) or keys[-1] not in target:
+                ignored.append(name)
+                continue
+            target[keys[-1]] = _parse_env_value(value)
+
+        if ignored:
+            logger.warning(f"Ignored environment overrides for unknown config keys: {', '.join(ignored)}")
+
+        # Allow the run to point page objects at another server, e.g. the local AUT
+        if os.getenv('BASE_URL'):
+            config['base_url'] = os.getenv('BASE_URL')
+
+    @staticmethod
+    def _validate(config: dict):
+        """
+        Check required keys, their types and known values
+        """
+        for key, expected_type in REQUIRED_KEYS.items():
+            if key not in config:
+                raise ValueError(f"Missing required config key: {key}")
+            if not isinstance(config[key], expected_type) or isinstance(config[key], bool):
+                raise ValueError(f"Config key {key} must be {expected_type.__name__}, got {config[key]!r}")
+        if not config['base_url']:
+            raise ValueError("Config key base_url must not be empty")
+        if config['timeout'] <= 0:
+            raise ValueError(f"Config key timeout must be positive, got {config['timeout']}")
+        if config['browser'] not in SUPPORTED_BROWSERS:
+            raise ValueError(f"Unsupported browser in config: {config['browser']}")
+        if not {'width', 'height'} <= set(config['viewport']):
+            raise ValueError("Config key viewport must have width and height")
+
+    def override(self, key: str, value):
+        """
+        Set a value for the rest of the process, kept across reloads
+        """
+        with self._lock:
+            self._runtime_overrides[key] = value
+            for entry in self._entries.values():
+                entry['config'][key] = value
+
+    def stats(self) -> dict:
+        """
+        Get the number of file loads and cached environments
+        """
+        return {'load_count': self.load_count, 'environments': sorted(self._entries)}
+
+
+# Process-wide config service shared by page objects, hooks and runners
+config_loader = ConfigLoader()
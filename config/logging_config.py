@@ -1,42 +1,323 @@
+import atexit
+import gzip
+import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import shutil
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+# Loggers of the per-action messages page objects write for every click and fill
+ACTION_LOGGERS = ('features.pages', 'features.async_pages')
+
+# Verbosity name -> (framework level, per-action level)
+VERBOSITY_LEVELS = {
+    'debug': (logging.DEBUG, logging.DEBUG),
+    'normal': (logging.INFO, logging.INFO),
+    'quiet': (logging.INFO, logging.WARNING)
+}
+
+LOG_FORMATS = ('text', 'json')
+LOGS_DIR = 'logs'
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+# Records held until configure_logging picks the log file format
+STARTUP_BUFFER_RECORDS = 10000
+
+# Shared by all workers of a parallel run, which receive it through RUN_ID
+RUN_ID = os.getenv('RUN_ID') or f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{os.getpid()}"
+WORKER_ID = os.getenv('WORKER_ID')
+
+# Feature, scenario and step the current thread or asyncio task is running
+_log_feature = ContextVar('log_feature', default=None)
+_log_scenario = ContextVar('log_scenario', default=None)
+_log_step = ContextVar('log_step', default=None)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+    The message is merged with its arguments on the logging thread, so a mutable
+    argument changed after the call is logged with the value it had at the call.
+    Records stay in-process, so the rest does not need to be made picklable first.
+    """
+
+    def prepare(self, record):
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class RunContextFilter(logging.Filter):
+    """
+    Stamps records with the run, worker, feature, scenario and step on the thread that logs them
+    """
+
+    def filter(self, record):
+        record.run_id = RUN_ID
+        record.worker_id = WORKER_ID
+        record.feature = _log_feature.get()
+        record.scenario = _log_scenario.get()
+        record.step = _log_step.get()
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats each record as one JSON object per line
+    """
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'source': f"{record.filename}:{record.lineno}",
+            'message': record.getMessage(),
+            'run_id': getattr(record, 'run_id', RUN_ID),
+            'worker_id': getattr(record, 'worker_id', WORKER_ID),
+            'feature': getattr(record, 'feature', None),
+            'scenario': getattr(record, 'scenario', None),
+            'step': getattr(record, 'step', None),
+            'duration_ms': getattr(record, 'duration_ms', None)
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _gzip_namer(name: str) -> str:
+    """
+    Name rotated log segments with a .gz suffix
+    """
+    return f"{name}.gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    """
+    Compress a rotated log segment, runs on the listener thread
+    """
+    with open(source, 'rb') as source_file, gzip.open(dest, 'wb') as dest_file:
+        shutil.copyfileobj(source_file, dest_file)
+    os.remove(source)
+
+
+def set_log_context(feature: str = None, scenario: str = None, step: str = None):
+    """
+    Set the feature, scenario and step attached to following log records
+    """
+    _log_feature.set(feature)
+    _log_scenario.set(scenario)
+    _log_step.set(step)
+
+
+def set_log_step(step: str = None):
+    """
+    Set the step attached to following log records
+    """
+    _log_step.set(step)
+
+
+def set_verbosity(verbosity: str):
+    """
+    Set how much is logged: 'debug', 'normal', or 'quiet' to drop per-action page object logs
+    """
+    if verbosity not in VERBOSITY_LEVELS:
+        raise ValueError(f"Unsupported log verbosity: {verbosity}, expected one of {list(VERBOSITY_LEVELS)}")
+    framework_level, action_level = VERBOSITY_LEVELS[verbosity]
+    logging.getLogger().setLevel(framework_level)
+    logging.getLogger('automation_framework').setLevel(framework_level)
+    for name in ACTION_LOGGERS:
+        logging.getLogger(name).setLevel(action_level)
+
+
+def log_file_path(log_format: str) -> str:
+    """
+    Get the log file of this process, one per run and worker
+    """
+    worker_suffix = f"_worker_{WORKER_ID}" if WORKER_ID is not None else ''
+    extension = 'ndjson' if log_format == 'json' else 'log'
+    return os.path.join(LOGS_DIR, f"test_run_{RUN_ID}{worker_suffix}.{extension}")
+
+
+def _create_file_handler(log_format: str, max_bytes: int, backup_count: int, formatter: logging.Formatter):
+    """
+    Create the size-rotated log file handler, compressing rotated segments
+    """
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unsupported log format: {log_format}, expected one of {list(LOG_FORMATS)}")
+    os.makedirs(LOGS_DIR, exist_ok=True)
+    handler = logging.handlers.RotatingFileHandler(
+        log_file_path(log_format), maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True
+    )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    handler.setFormatter(JsonLinesFormatter() if log_format == 'json' else formatter)
+    return handler
+
+
+class _StartupBuffer(logging.Handler):
+    """
+    Holds the records logged before configure_logging picks the file format, so no
+    file is created in a format about to be replaced. Past capacity, e.g. in a
+    process that never configures logging, records go to a file in the default format.
+    """
+
+    def __init__(self, capacity: int, create_handler):
+        super().__init__()
+        self.capacity = capacity
+        self.create_handler = create_handler
+        self.records = []
+        self.target = None
+
+    def emit(self, record):
+        if self.target is not None:
+            self.target.handle(record)
+            return
+        self.records.append(record)
+        if len(self.records) >= self.capacity:
+            self.target = self.create_handler()
+            self.release_to(self.target)
+
+    def release_to(self, handler: logging.Handler):
+        """
+        Write the held records to handler
+        """
+        for record in self.records:
+            handler.handle(record)
+        self.records = []
+
+    def close(self):
+        if self.target is not None:
+            self.target.close()
+        super().close()
+
+
+class _LoggingPipeline:
+    """
+    Queue listener owning the file and console handlers, which can be reconfigured once config is loaded
+    """
+
+    def __init__(self, text_formatter: logging.Formatter):
+        self.text_formatter = text_formatter
+        self.settings = None
+        self.queue = queue.SimpleQueue()
+        self.console_handler = logging.StreamHandler()
+        self.console_handler.setFormatter(text_formatter)
+        self.file_handler = None
+        self.startup_buffer = None
+        self.listener = None
+
+    def _default_file_handler(self) -> logging.Handler:
+        """
+        File handler used when logging was never configured
+        """
+        return _create_file_handler(
+            os.getenv('LOG_FORMAT', 'text'), DEFAULT_MAX_BYTES, DEFAULT_BACKUP_COUNT, self.text_formatter
+        )
+
+    def _listen(self, *handlers):
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+
+    def start_buffered(self):
+        """
+        Start the listener with the console handler only, holding file records until start()
+        """
+        self.startup_buffer = _StartupBuffer(STARTUP_BUFFER_RECORDS, self._default_file_handler)
+        self._listen(self.startup_buffer, self.console_handler)
+
+    def start(self, log_format: str, max_bytes: int, backup_count: int):
+        """
+        (Re)start the listener with a file handler for the given settings
+        """
+        settings = (log_format, max_bytes, backup_count)
+        if settings == self.settings:
+            return
+        file_handler = _create_file_handler(log_format, max_bytes, backup_count, self.text_formatter)
+        if self.listener is not None:
+            # Drains what is queued into the old handlers before switching
+            self.listener.stop()
+        if self.file_handler is not None:
+            self.file_handler.close()
+        if self.startup_buffer is not None:
+            # Records logged before the format was known go first, in the chosen format
+            self.startup_buffer.release_to(file_handler)
+            self.startup_buffer.close()
+            self.startup_buffer = None
+        self.file_handler = file_handler
+        self.settings = settings
+        self._listen(self.file_handler, self.console_handler)
+
+    def stop(self):
+        """
+        Flush queued records and stop the listener
+        """
+        if self.listener is None:
+            return
+        self.listener.stop()
+        self.listener = None
+        if self.startup_buffer is not None:
+            # Logging was never configured, write what was held in the default format
+            if self.startup_buffer.records and self.startup_buffer.target is None:
+                self.startup_buffer.target = self._default_file_handler()
+            if self.startup_buffer.target is not None:
+                self.startup_buffer.release_to(self.startup_buffer.target)
+            self.startup_buffer.close()
+        if self.file_handler is not None:
+            self.file_handler.close()
+
+
+_pipeline = None
+
+
+def configure_logging(logging_settings: dict):
+    """
+    Apply the logging config section: verbosity, format ('text' or 'json') and rotation.
+    LOG_VERBOSITY and LOG_FORMAT take precedence over the config.
+    """
+    set_verbosity(os.getenv('LOG_VERBOSITY') or logging_settings.get('verbosity', 'normal'))
+    _pipeline.start(
+        os.getenv('LOG_FORMAT') or logging_settings.get('format', 'text'),
+        logging_settings.get('max_bytes', DEFAULT_MAX_BYTES),
+        logging_settings.get('backup_count', DEFAULT_BACKUP_COUNT)
+    )
+
 
 def setup_logging():
     """
     Configure logging for the test framework
-    Creates a new log file for each test run with timestamp
+    Creates one log file per run and worker, rotated by size
     """
-    # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
-
-    # Create a timestamp for the log file
-    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-    log_file = f'logs/test_run_{timestamp}.log'
+    global _pipeline
 
     # Configure logging format
     logging_format = '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
 
+    # Test threads only enqueue records, a listener thread does the disk and console I/O.
+    # The log file is created once configure_logging knows its format.
+    _pipeline = _LoggingPipeline(logging.Formatter(logging_format, datefmt=date_format))
+    _pipeline.start_buffered()
+    # Flush what is still queued when the process exits
+    atexit.register(_pipeline.stop)
+
+    queue_handler = DeferredQueueHandler(_pipeline.queue)
+    queue_handler.addFilter(RunContextFilter())
+
     # Configure root logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format=logging_format,
-        datefmt=date_format,
-        handlers=[
-            # File handler with detailed information
-            logging.FileHandler(log_file),
-            # Console handler with color formatting
-            logging.StreamHandler()
-        ]
-    )
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
     # Create logger instance
     logger = logging.getLogger('automation_framework')
     logger.setLevel(logging.INFO)
 
+    set_verbosity(os.getenv('LOG_VERBOSITY', 'normal'))
+
     return logger
 
 # Create a logger instance that can be imported by other modules
-logger = setup_logging()
\ No newline at end of file
+logger = setup_logging()
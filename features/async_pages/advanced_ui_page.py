@@ -0,0 +1,62 @@
+from features.async_pages.base_page import AsyncBasePage
+from features.pages.advanced_ui_page import AdvancedUIPage
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncAdvancedUIPage(AsyncBasePage):
+    """
+    Async advanced UI page object sharing the locators of AdvancedUIPage
+    """
+    
+    # Locators
+    ADVANCED_UI_BUTTON = AdvancedUIPage.ADVANCED_UI_BUTTON
+    CHALLENGE_TITLE = AdvancedUIPage.CHALLENGE_TITLE
+    BOOK_TITLE = AdvancedUIPage.BOOK_TITLE
+    STAR_RATING = AdvancedUIPage.STAR_RATING
+    RATING_INPUT = AdvancedUIPage.RATING_INPUT
+    CHECK_RATING_BUTTON = AdvancedUIPage.CHECK_RATING_BUTTON
+    RATING_RESULT = AdvancedUIPage.RATING_RESULT
+    PAGE_LOAD_LOCATORS = AdvancedUIPage.PAGE_LOAD_LOCATORS
+        
+    async def click_advanced_ui_section(self):
+        """
+        Click on Advanced UI Features section
+        """
+        self.logger.info("Clicking on Advanced UI Features section")
+        await self.click_element(self.ADVANCED_UI_BUTTON)
+        await self.verify_page_loaded()
+        
+    async def get_book_rating(self) -> str:
+        """
+        Get the star rating for the book
+        """
+        self.logger.info("Getting book star rating")
+        # Get the content of the pseudo-element
+        rating = await self.page.evaluate("""() => {
+            const style = window.getComputedStyle(document.querySelector('label.star-rating'), ':after');
+            return style.getPropertyValue('content');
+        }""")
+        self.logger.info(f"Found rating: {rating}")
+        return rating.strip('"')  # Remove quotes from the content value
+        
+    async def enter_rating(self, rating: str):
+        """
+        Enter rating in the text box
+        """
+        self.logger.info(f"Entering rating: {rating}")
+        await self.fill_text(self.RATING_INPUT, rating)
+        
+    async def click_check_rating(self):
+        """
+        Click the Check Rating button
+        """
+        self.logger.info("Clicking Check Rating button")
+        await self.click_element(self.CHECK_RATING_BUTTON)
+        
+    async def get_rating_result(self) -> str:
+        """
+        Get the rating validation message
+        """
+        self.logger.info("Getting rating result message")
+        return await self.get_element_text(self.RATING_RESULT)
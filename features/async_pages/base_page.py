@@ -0,0 +1,318 @@
+from playwright.async_api import Page, Error as PlaywrightError, expect
+import os
+import re
+import logging
+from config.config_loader import config_loader
+from utils.element_query import ELEMENT_STATE_SCRIPT, FILL_FORM_SCRIPT, to_query
+from utils.locator_registry import LocatorRegistry
+from utils.screenshots import screenshot_service
+from utils.timing import instrument_page, timed
+
+logger = logging.getLogger(__name__)
+
+class AsyncBasePage:
+    """
+    Async counterpart of BasePage built on playwright.async_api.
+    Lets one process drive many pages concurrently from an event loop.
+    """
+    
+    # Selector constants that must match the DOM once the page has loaded
+    PAGE_LOAD_LOCATORS = ()
+    
+    def __init__(self, page: Page):
+        self.page = instrument_page(page)
+        self.logger = logger
+        self.config = config_loader.get()
+        self.locators = LocatorRegistry.for_page(page)
+        self.legacy_fixed_waits = self._use_legacy_fixed_waits()
+
+    def _use_legacy_fixed_waits(self) -> bool:
+        """
+        Check whether the old fixed-delay waits were explicitly opted into
+        """
+        legacy_env = os.getenv('LEGACY_FIXED_WAITS')
+        if legacy_env is not None:
+            return legacy_env.lower() == 'true'
+        return self.config.get('legacy_fixed_waits', False)
+        
+    @timed('navigate_to')
+    async def navigate_to(self, url: str) -> None:
+        """
+        Navigate to a specific URL
+        """
+        try:
+            self.logger.info("Navigating to URL: %s", url)
+            await self.page.goto(url)
+            self.logger.info("Successfully navigated to: %s", url)
+        except Exception as e:
+            self.logger.error("Failed to navigate to %s: %s", url, e)
+            raise
+        
+    @timed('get_element_text')
+    async def get_element_text(self, selector: str) -> str:
+        """
+        Get text content of an element
+        """
+        try:
+            self.logger.debug("Getting text content from element: %s", selector)
+            text = await self.locators.locator(selector).text_content()
+            self.logger.debug("Text content retrieved: %s", text)
+            return text
+        except Exception as e:
+            self.logger.error("Failed to get text from element %s: %s", selector, e)
+            raise
+    
+    @timed('click_element')
+    async def click_element(self, selector: str) -> None:
+        """
+        Click on an element
+        """
+        try:
+            self.logger.debug("Attempting to click element: %s", selector)
+            await self.locators.locator(selector).click()
+            self.logger.debug("Successfully clicked element: %s", selector)
+        except Exception as e:
+            self.logger.error("Failed to click element %s: %s", selector, e)
+            raise
+    
+    @timed('fill_text')
+    async def fill_text(self, selector: str, text: str) -> None:
+        """
+        Fill text in an input field
+        """
+        try:
+            self.logger.info("Filling text field %s with value: %s", selector, text)
+            await self.locators.locator(selector).fill(text)
+            self.logger.debug("Successfully filled text field: %s", selector)
+        except Exception as e:
+            self.logger.error("Failed to fill text in element %s: %s", selector, e)
+            raise
+    
+    @timed('is_element_visible')
+    async def is_element_visible(self, selector: str) -> bool:
+        """
+        Check if element is visible
+        """
+        try:
+            self.logger.debug("Checking visibility of element: %s", selector)
+            is_visible = await self.locators.locator(selector).is_visible()
+            self.logger.debug("Element %s visibility status: %s", selector, is_visible)
+            return is_visible
+        except Exception as e:
+            self.logger.error("Failed to check visibility of element %s: %s", selector, e)
+            raise
+    
+    @timed('wait_for_element')
+    async def wait_for_element(self, selector: str, timeout: int = None) -> None:
+        """
+        Wait for element to be visible
+        """
+        try:
+            timeout = timeout or self.config['timeout']
+            self.logger.debug("Waiting for element %s with timeout %sms", selector, timeout)
+            await self.locators.locator(selector).wait_for(timeout=timeout)
+            self.logger.debug("Element %s appeared within timeout", selector)
+        except Exception as e:
+            self.logger.error("Timeout waiting for element %s: %s", selector, e)
+            raise
+
+    @timed('pause', selector_arg=False)
+    async def pause(self, milliseconds: int) -> None:
+        """
+        Sleep for a fixed delay, only when legacy fixed waits are enabled
+        """
+        if self.legacy_fixed_waits:
+            await self.page.wait_for_timeout(milliseconds)
+
+    @timed('wait_for_checked')
+    async def wait_for_checked(self, selector: str, checked: bool = True, timeout: int = None) -> None:
+        """
+        Wait for a checkbox, radio or its label to reach the checked state
+        """
+        timeout = timeout or self.config['timeout']
+        await expect(self.locators.locator(selector)).to_be_checked(checked=checked, timeout=timeout)
+
+    @timed('wait_for_text')
+    async def wait_for_text(self, selector: str, text: str, timeout: int = None) -> None:
+        """
+        Wait for an element's text to contain the expected text
+        """
+        timeout = timeout or self.config['timeout']
+        await expect(self.locators.locator(selector)).to_contain_text(text, timeout=timeout)
+
+    @timed('wait_for_attribute')
+    async def wait_for_attribute(self, selector: str, attribute: str, value: str, timeout: int = None) -> None:
+        """
+        Wait for an element attribute to have the expected value
+        """
+        timeout = timeout or self.config['timeout']
+        await expect(self.locators.locator(selector)).to_have_attribute(attribute, value, timeout=timeout)
+
+    @timed('wait_for_class')
+    async def wait_for_class(self, selector: str, class_name: str, present: bool = True, timeout: int = None) -> None:
+        """
+        Wait for a CSS class to be added to (or removed from) an element
+        """
+        timeout = timeout or self.config['timeout']
+        pattern = re.compile(rf"(^|\s){re.escape(class_name)}(\s|$)")
+        assertion = expect(self.locators.locator(selector))
+        if present:
+            await assertion.to_have_class(pattern, timeout=timeout)
+        else:
+            await assertion.not_to_have_class(pattern, timeout=timeout)
+
+    @timed('wait_for_condition', selector_arg=False)
+    async def wait_for_condition(self, expression: str, arg=None, timeout: int = None) -> None:
+        """
+        Wait for a JavaScript predicate evaluated in the page to become truthy
+        """
+        timeout = timeout or self.config['timeout']
+        await self.page.wait_for_function(expression, arg=arg, timeout=timeout)
+
+    @timed('get_elements_state')
+    async def get_elements_state(self, selectors) -> dict:
+        """
+        Get visibility, text, value and checked state of several elements in one page evaluation
+        """
+        named = dict(selectors) if isinstance(selectors, dict) else {selector: selector for selector in selectors}
+        queries = {name: to_query(selector) for name, selector in named.items()}
+        batched = [name for name, query in queries.items() if query is not None]
+
+        states = {}
+        if batched:
+            results = await self.page.evaluate(ELEMENT_STATE_SCRIPT, [queries[name] for name in batched])
+            states = {name: state for name, state in zip(batched, results) if state is not None}
+        for name, selector in named.items():
+            if name not in states:
+                states[name] = await self._get_element_state(selector)
+        return {name: states[name] for name in named}
+
+    async def _get_element_state(self, selector: str) -> dict:
+        """
+        Get the state of one element through individual Playwright calls
+        """
+        locator = self.locators.locator(selector)
+        if not await locator.count():
+            return {'found': False, 'visible': False, 'text': None, 'value': None, 'checked': None,
+                    'valid': None, 'validation_message': None}
+        state = {'found': True, 'visible': await locator.is_visible(), 'text': await locator.text_content(),
+                 'value': None, 'checked': None, 'valid': None, 'validation_message': None}
+        try:
+            state['value'] = await locator.input_value(timeout=1000)
+        except PlaywrightError:
+            pass
+        try:
+            state['checked'] = await locator.is_checked(timeout=1000)
+        except PlaywrightError:
+            pass
+        return state
+
+    async def are_elements_visible(self, selectors) -> bool:
+        """
+        Check in one page evaluation that all elements are visible
+        """
+        states = await self.get_elements_state(selectors)
+        hidden = [name for name, state in states.items() if not state['visible']]
+        if hidden:
+            self.logger.error("Elements not visible: %s", hidden)
+        return not hidden
+
+    @timed('fill_form')
+    async def fill_form(self, fields: dict) -> dict:
+        """
+        Fill many fields in one page evaluation and return the resulting state of all of them.
+        Takes selector -> value: text for inputs and text areas, an option value or label (or a list)
+        for selects, True/False for checkboxes and radios, and a path (or list of paths) for file inputs.
+        """
+        self.logger.info("Filling form with %s field(s)", len(fields))
+        try:
+            queries = {selector: to_query(selector) for selector in fields}
+            batched = [selector for selector, query in queries.items() if query is not None]
+            results = {}
+            if batched:
+                plan = [{'query': queries[selector], 'value': _plan_value(fields[selector])} for selector in batched]
+                results = dict(zip(batched, await self.page.evaluate(FILL_FORM_SCRIPT, plan)))
+
+            # File inputs and fields the page could not set go through Playwright one by one
+            pending = [selector for selector in fields if results.get(selector, {}).get('status') != 'filled']
+            for selector in pending:
+                await self._fill_field(selector, fields[selector])
+            if pending:
+                states = await self.get_elements_state(list(fields))
+            else:
+                states = {selector: results[selector]['state'] for selector in fields}
+
+            self.logger.debug("Filled %s field(s) in one evaluation, %s individually", len(fields) - len(pending), len(pending))
+            invalid = [selector for selector, state in states.items() if state['valid'] is False]
+            if invalid:
+                self.logger.info("Fields failing validation after fill: %s", invalid)
+            return states
+        except Exception as e:
+            self.logger.error("Failed to fill form fields %s: %s", list(fields), e)
+            raise
+
+    async def _fill_field(self, selector: str, value) -> None:
+        """
+        Fill one field through Playwright, picking the action from the element type
+        """
+        locator = self.locators.locator(selector)
+        tag_name, input_type = await locator.evaluate(
+            "el => { const c = el.tagName === 'LABEL' && el.control ? el.control : el; return [c.tagName, c.type]; }"
+        )
+        if input_type == 'file':
+            await locator.set_input_files(value)
+        elif input_type in ('checkbox', 'radio'):
+            await locator.set_checked(bool(value))
+        elif tag_name == 'SELECT':
+            await locator.select_option(value)
+        else:
+            await locator.fill(str(value))
+
+    def locator_for(self, name: str, key: str = None):
+        """
+        Get the cached locator of a selector constant, or of an entry of a locator map
+        """
+        return self.locators.named(type(self), name, key)
+
+    async def validate_locators(self, names=None) -> dict:
+        """
+        Check in one page evaluation that registered selectors match the live DOM
+        """
+        names = self.PAGE_LOAD_LOCATORS if names is None else names
+        states = await self.get_elements_state(self.locators.expand(type(self), names))
+        broken = [label for label, state in states.items() if not state['found']]
+        if broken:
+            self.logger.error("Locators of %s not found in the page: %s", type(self).__name__, broken)
+            raise AssertionError(f"Broken locators on {type(self).__name__}: {broken}")
+        self.logger.debug("Validated %s locator(s) of %s", len(states), type(self).__name__)
+        return states
+
+    async def verify_page_loaded(self) -> None:
+        """
+        Wait for the page to load and validate its PAGE_LOAD_LOCATORS, when enabled in config
+        """
+        if not self.PAGE_LOAD_LOCATORS or not self.config.get('validate_locators_on_load', False):
+            return
+        await self.locator_for(self.PAGE_LOAD_LOCATORS[0]).wait_for(state='attached', timeout=self.config['timeout'])
+        await self.page.wait_for_load_state('domcontentloaded')
+        await self.validate_locators()
+    
+    @timed('take_screenshot', selector_arg=False)
+    async def take_screenshot(self, name: str, full_page: bool = None):
+        """
+        Capture a screenshot into the run's screenshots directory, written in the background.
+        Returns a future resolving to the file path.
+        """
+        self.logger.info("Taking screenshot: %s", name)
+        return await screenshot_service.capture_async(self.page, name, full_page)
+
+
+def _plan_value(value):
+    """
+    Make a form-fill value JSON serialisable for the page
+    """
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    if isinstance(value, (list, tuple)):
+        return [_plan_value(item) for item in value]
+    return value
@@ -0,0 +1,290 @@
+from features.async_pages.base_page import AsyncBasePage
+from features.pages.forms_page import FormsPage
+from utils.download_verifier import download_stats
+from utils.upload_cache import upload_cache
+from time import perf_counter
+import asyncio
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncFormsPage(AsyncBasePage):
+    """
+    Async forms page object sharing the locators of FormsPage
+    """
+    
+    # Basic Form Controls
+    FORMS_LINK = FormsPage.FORMS_LINK
+    EXPERIENCE_INPUT = FormsPage.EXPERIENCE_INPUT
+    EXPERIENCE_VALIDATION = FormsPage.EXPERIENCE_VALIDATION
+    PYTHON_CHECKBOX = FormsPage.PYTHON_CHECKBOX
+    JAVASCRIPT_CHECKBOX = FormsPage.JAVASCRIPT_CHECKBOX
+    CHECKBOX_VALIDATION = FormsPage.CHECKBOX_VALIDATION
+    SELENIUM_RADIO = FormsPage.SELENIUM_RADIO
+    PROTRACTOR_RADIO = FormsPage.PROTRACTOR_RADIO
+    RADIO_VALIDATION = FormsPage.RADIO_VALIDATION
+    PRIMARY_SKILL_DROPDOWN = FormsPage.PRIMARY_SKILL_DROPDOWN
+    LANGUAGE_MULTISELECT = FormsPage.LANGUAGE_MULTISELECT
+    SKILL_VALIDATION = FormsPage.SKILL_VALIDATION
+    LANGUAGE_VALIDATION = FormsPage.LANGUAGE_VALIDATION
+    NOTES_AREA = FormsPage.NOTES_AREA
+    NOTES_VALIDATION = FormsPage.NOTES_VALIDATION
+    GERMAN_SWITCH = FormsPage.GERMAN_SWITCH
+    GERMAN_FLUENCY = FormsPage.GERMAN_FLUENCY
+    GERMAN_VALIDATION = FormsPage.GERMAN_VALIDATION
+    FLUENCY_VALIDATION = FormsPage.FLUENCY_VALIDATION
+    COMMON_SENSE_INPUT = FormsPage.COMMON_SENSE_INPUT
+    SALARY_INPUT = FormsPage.SALARY_INPUT
+    CITY_INPUT = FormsPage.CITY_INPUT
+    STATE_INPUT = FormsPage.STATE_INPUT
+    ZIP_INPUT = FormsPage.ZIP_INPUT
+    TERMS_CHECKBOX = FormsPage.TERMS_CHECKBOX
+    SUBMIT_BUTTON = FormsPage.SUBMIT_BUTTON
+    SINGLE_FILE_UPLOAD = FormsPage.SINGLE_FILE_UPLOAD
+    MULTIPLE_FILES_UPLOAD = FormsPage.MULTIPLE_FILES_UPLOAD
+    SINGLE_FILE_VALIDATION = FormsPage.SINGLE_FILE_VALIDATION
+    MULTIPLE_FILES_VALIDATION = FormsPage.MULTIPLE_FILES_VALIDATION
+    NON_ENGLISH_NAME = FormsPage.NON_ENGLISH_NAME
+    MARATHI_CHECKBOX = FormsPage.MARATHI_CHECKBOX
+    GUJARATI_CHECKBOX = FormsPage.GUJARATI_CHECKBOX
+    PUNJABI_CHECKBOX = FormsPage.PUNJABI_CHECKBOX
+    NON_ENGLISH_NAME_VALIDATION = FormsPage.NON_ENGLISH_NAME_VALIDATION
+    DOWNLOAD_LINK = FormsPage.DOWNLOAD_LINK
+    PAGE_LOAD_LOCATORS = FormsPage.PAGE_LOAD_LOCATORS
+
+    # Checkbox selector and validation text per programming language
+    LANGUAGE_CHECKBOXES = {
+        "Python": ("#check_python", "PYTHON"),
+        "JavaScript": ("#check_javascript", "JAVASCRIPT")
+    }
+
+    # Validation message selector per field
+    VALIDATION_SELECTORS = {
+        'city': "#invalid_city",
+        'state': "#invalid_state",
+        'zip': "#invalid_zip",
+        'terms': "#invalid_terms"
+    }
+    
+    async def click_forms_section(self):
+        """
+        Click on the Forms section link
+        """
+        self.logger.info("Clicking on Forms section")
+        await self.click_element(self.FORMS_LINK)
+        await self.verify_page_loaded()
+        
+    async def enter_experience(self, years: str):
+        """
+        Enter years of automation experience
+        """
+        self.logger.info(f"Entering {years} years of experience")
+        await self.fill_text(self.EXPERIENCE_INPUT, years)
+        
+    async def select_programming_languages(self, languages: list):
+        """
+        Select programming language checkboxes using a second click if needed
+        """
+        self.logger.info(f"Starting to select languages: {languages}")
+        for lang in languages:
+            if lang not in self.LANGUAGE_CHECKBOXES:
+                continue
+            selector = self.LANGUAGE_CHECKBOXES[lang][0]
+            for attempt in range(2):
+                await self.page.click(selector, force=True)
+                await self.pause(500)
+                timeout = self.config['timeout'] if attempt else self.config.get('state_change_timeout', 2000)
+                if await self._reaches_checked(selector, timeout=timeout):
+                    break
+            else:
+                await self.take_screenshot(f"checkbox_failure_{lang.lower()}")
+                raise AssertionError(f"Could not select {lang} checkbox after two attempts")
+
+        missing_languages = []
+        for lang in languages:
+            if lang not in self.LANGUAGE_CHECKBOXES:
+                continue
+            try:
+                await self.wait_for_text(self.CHECKBOX_VALIDATION, self.LANGUAGE_CHECKBOXES[lang][1])
+            except AssertionError:
+                missing_languages.append(lang)
+        if missing_languages:
+            await self.take_screenshot("validation_text_failure")
+            raise AssertionError(f"Languages not showing in validation text: {missing_languages}")
+
+    async def _reaches_checked(self, selector: str, checked: bool = True, timeout: int = None) -> bool:
+        """
+        Check whether a control reaches the checked state within a short timeout
+        """
+        try:
+            await self.wait_for_checked(selector, checked, timeout or self.config.get('state_change_timeout', 2000))
+            return True
+        except AssertionError:
+            return False
+                
+    async def select_automation_tool(self, tool: str):
+        """
+        Select automation tool radio button
+        """
+        self.logger.info(f"Selecting automation tool: {tool}")
+        if tool == "Selenium":
+            await self.click_element(self.SELENIUM_RADIO)
+        elif tool == "Protractor":
+            await self.click_element(self.PROTRACTOR_RADIO)
+            
+    async def select_primary_skill(self, skill: str):
+        """
+        Select primary skill from dropdown
+        """
+        self.logger.info(f"Selecting primary skill: {skill}")
+        await self.page.select_option(self.PRIMARY_SKILL_DROPDOWN, label=skill)
+        
+    async def select_languages(self, languages: list):
+        """
+        Select languages from multi-select dropdown
+        """
+        self.logger.info(f"Selecting languages: {languages}")
+        await self.page.select_option(self.LANGUAGE_MULTISELECT, value=[lang.lower() for lang in languages])
+        
+    async def enter_notes(self, text: str):
+        """
+        Enter text in notes area
+        """
+        self.logger.info(f"Entering notes: {text}")
+        await self.fill_text(self.NOTES_AREA, text)
+        
+    async def toggle_german_switch(self, state: str):
+        """
+        Toggle German switch to specified state using a second click if needed
+        """
+        self.logger.info(f"Setting German switch to: {state}")
+        desired_state = state.lower() == "on"
+        if await self.page.locator(self.GERMAN_SWITCH).is_checked() == desired_state:
+            return
+        await self.click_element(self.GERMAN_SWITCH)
+        await self.pause(500)
+        # Try second click if the first one did not register
+        if not await self._reaches_checked(self.GERMAN_SWITCH, desired_state):
+            await self.click_element(self.GERMAN_SWITCH)
+            await self.pause(500)
+            await self.wait_for_checked(self.GERMAN_SWITCH, desired_state)
+
+    async def get_german_status(self) -> str:
+        """
+        Get the German speaking status text
+        """
+        return await self.get_element_text(self.GERMAN_VALIDATION)
+            
+    async def set_german_fluency(self, level: str):
+        """
+        Set German fluency level
+        """
+        self.logger.info(f"Setting German fluency to: {level}")
+        await self.page.fill(self.GERMAN_FLUENCY, level)
+        
+    async def fill_validation_form(self, city: str = None, state: str = None, zip_code: str = None) -> dict:
+        """
+        Fill validation form fields and return their validation state
+        """
+        values = {self.CITY_INPUT: city, self.STATE_INPUT: state, self.ZIP_INPUT: zip_code}
+        return await self.fill_form({selector: value for selector, value in values.items() if value})
+            
+    async def accept_terms(self):
+        """
+        Accept terms and conditions
+        """
+        self.logger.info("Accepting terms and conditions")
+        await self.click_element(self.TERMS_CHECKBOX)
+        
+    async def submit_form(self):
+        """
+        Click the submit form button
+        """
+        self.logger.info("Submitting form")
+        url_before = self.page.url
+        await self.click_element(self.SUBMIT_BUTTON)
+        await self.pause(500)
+        # Wait for the page to navigate away or for validations to appear
+        await self.wait_for_condition(
+            """(url) => window.location.href !== url ||
+                document.querySelector('form.was-validated') !== null""",
+            arg=url_before
+        )
+
+    async def get_validation_message(self, field: str) -> str:
+        """
+        Get validation message for specific field and clean it
+        """
+        if field not in self.VALIDATION_SELECTORS:
+            raise ValueError(f"Unknown field: {field}")
+            
+        self.logger.info(f"Getting validation message for {field}")
+        await self.wait_for_element(self.VALIDATION_SELECTORS[field])
+        message = await self.get_element_text(self.VALIDATION_SELECTORS[field])
+        return message.strip() if message else ""
+    
+    async def upload_single_file(self, filename: str):
+        """
+        Upload a single file from the cached upload fixtures
+        """
+        self.logger.info(f"Uploading file: {filename}")
+        await self.page.set_input_files(self.SINGLE_FILE_UPLOAD, upload_cache.payload(filename))
+
+    async def upload_multiple_files(self, filenames: list):
+        """
+        Upload multiple files from the cached upload fixtures
+        """
+        self.logger.info(f"Uploading files: {filenames}")
+        await self.page.set_input_files(self.MULTIPLE_FILES_UPLOAD, upload_cache.payloads(filenames))
+
+    async def upload_generated_file(self, size, name: str = None) -> float:
+        """
+        Upload a generated payload of the given size (e.g. "5MB") and return the upload latency in ms
+        """
+        payload = upload_cache.synthetic(size, name)
+        started = perf_counter()
+        await self.page.set_input_files(self.SINGLE_FILE_UPLOAD, payload)
+        elapsed_ms = (perf_counter() - started) * 1000
+        self.logger.info("Uploaded %s (%s bytes) in %.1f ms", payload['name'], len(payload['buffer']), elapsed_ms)
+        return elapsed_ms
+
+    async def enter_non_english_name(self, name: str):
+        """
+        Enter name in the non-English name field
+        """
+        self.logger.info(f"Entering name in non-English field: {name}")
+        await self.fill_text(self.NON_ENGLISH_NAME, name)
+        
+    async def select_non_english_languages(self, languages: list):
+        """
+        Select non-English language options
+        """
+        self.logger.info(f"Selecting non-English languages: {languages}")
+        language_map = {
+            "मराठी": self.MARATHI_CHECKBOX,
+            "ગુજરાતી": self.GUJARATI_CHECKBOX,
+            "ਪੰਜਾਬੀ": self.PUNJABI_CHECKBOX
+        }
+        
+        for lang in languages:
+            if lang in language_map:
+                await self.click_element(language_map[lang])
+
+    async def download_file(self, downloads_dir: str) -> dict:
+        """
+        Click the download link and save the file into downloads_dir.
+        Returns the path, size, SHA-256, time-to-first-byte and throughput of the download.
+        """
+        self.logger.info("Downloading file into %s", downloads_dir)
+        started = perf_counter()
+        async with self.page.expect_download(timeout=self.config['timeout']) as download_info:
+            await self.click_element(self.DOWNLOAD_LINK)
+        download = await download_info.value
+        first_byte = perf_counter()
+        
+        download_path = os.path.join(downloads_dir, download.suggested_filename)
+        await download.save_as(download_path)
+        completed = perf_counter()
+        # Hash off the event loop so other scenarios keep running
+        return await asyncio.to_thread(download_stats, download_path, started, first_byte, completed)
@@ -0,0 +1,44 @@
+from features.async_pages.base_page import AsyncBasePage
+from features.pages.home_page import HomePage
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncHomePage(AsyncBasePage):
+    """
+    Async home page object sharing the locators of HomePage
+    """
+    
+    # Page elements/locators
+    PAGE_TITLE = HomePage.PAGE_TITLE
+    PAGE_SUBTITLE = HomePage.PAGE_SUBTITLE
+    PAGE_LOAD_LOCATORS = HomePage.PAGE_LOAD_LOCATORS
+    
+    def __init__(self, page):
+        """
+        Initialize the home page with Playwright page object
+        """
+        super().__init__(page)
+        self.url = f"{self.config['base_url']}/index.html"
+    
+    async def navigate(self):
+        """
+        Navigate to the home page
+        """
+        self.logger.info(f"Navigating to home page: {self.url}")
+        await self.navigate_to(self.url)
+        await self.verify_page_loaded()
+    
+    async def get_page_title(self) -> str:
+        """
+        Get the main page title text
+        """
+        self.logger.info("Getting page title text")
+        return await self.get_element_text(self.PAGE_TITLE)
+    
+    async def get_page_subtitle(self) -> str:
+        """
+        Get the page subtitle text
+        """
+        self.logger.info("Getting page subtitle text")
+        return await self.get_element_text(self.PAGE_SUBTITLE)
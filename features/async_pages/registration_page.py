@@ -0,0 +1,63 @@
+from features.async_pages.base_page import AsyncBasePage
+from features.pages.registration_page import RegistrationPage
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncRegistrationPage(AsyncBasePage):
+    """
+    Async registration page object sharing the locators of RegistrationPage
+    """
+    
+    # Page elements/locators
+    FIRST_NAME_INPUT = RegistrationPage.FIRST_NAME_INPUT
+    LAST_NAME_INPUT = RegistrationPage.LAST_NAME_INPUT
+    EMAIL_INPUT = RegistrationPage.EMAIL_INPUT
+    PASSWORD_INPUT = RegistrationPage.PASSWORD_INPUT
+    CONFIRM_PASSWORD_INPUT = RegistrationPage.CONFIRM_PASSWORD_INPUT
+    TERMS_CHECKBOX = RegistrationPage.TERMS_CHECKBOX
+    REGISTER_BUTTON = RegistrationPage.REGISTER_BUTTON
+    ERROR_MESSAGE = RegistrationPage.ERROR_MESSAGE
+        
+    async def accept_terms(self):
+        """
+        Check the terms checkbox
+        """
+        self.logger.info("Accepting terms and conditions")
+        await self.click_element(self.TERMS_CHECKBOX)
+        
+    async def click_register(self):
+        """
+        Click the register button
+        """
+        self.logger.info("Clicking register button")
+        await self.click_element(self.REGISTER_BUTTON)
+        
+    async def get_error_message(self) -> str:
+        """
+        Get the error message text
+        """
+        self.logger.info("Getting error message")
+        return await self.get_element_text(self.ERROR_MESSAGE)
+        
+    async def fill_registration_form(self, form_data: dict) -> dict:
+        """
+        Fill in all registration form fields and return their validation state
+        """
+        self.logger.info("Filling registration form")
+        field_mapping = {
+            'First Name': self.FIRST_NAME_INPUT,
+            'Last Name': self.LAST_NAME_INPUT,
+            'Email': self.EMAIL_INPUT,
+            'Password': self.PASSWORD_INPUT,
+            'Confirm Password': self.CONFIRM_PASSWORD_INPUT
+        }
+        
+        fields = {field_mapping[field]: value for field, value in form_data.items() if field in field_mapping}
+        return await self.fill_form(fields)
+
+    def is_on_confirmation_page(self) -> bool:
+        """
+        Check if we're on the confirmation page
+        """
+        return self.page.url.endswith('confirmation.html')
@@ -0,0 +1,174 @@
+from features.async_pages.base_page import AsyncBasePage
+from features.pages.sample_pages import SamplePagesPage
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncSamplePagesPage(AsyncBasePage):
+    """
+    Async sample pages object sharing the locators of SamplePagesPage
+    """
+    
+    # Page elements/locators
+    SAMPLE_PAGES_BUTTON = SamplePagesPage.SAMPLE_PAGES_BUTTON
+    USERNAME_FIELD = SamplePagesPage.USERNAME_FIELD
+    PASSWORD_FIELD = SamplePagesPage.PASSWORD_FIELD
+    LOGIN_BUTTON = SamplePagesPage.LOGIN_BUTTON
+    REMEMBER_ME_CHECKBOX = SamplePagesPage.REMEMBER_ME_CHECKBOX
+    REGISTER_LINK = SamplePagesPage.REGISTER_LINK
+    PIZZA_TITLE = SamplePagesPage.PIZZA_TITLE
+    PIZZA_SIZE_LARGE = SamplePagesPage.PIZZA_SIZE_LARGE
+    PIZZA_SIZE_MAP = SamplePagesPage.PIZZA_SIZE_MAP
+    PIZZA_FLAVOR_DROPDOWN = SamplePagesPage.PIZZA_FLAVOR_DROPDOWN
+    SAUCE_MAP = SamplePagesPage.SAUCE_MAP
+    TOPPINGS_MAP = SamplePagesPage.TOPPINGS_MAP
+    QUANTITY_INPUT = SamplePagesPage.QUANTITY_INPUT
+    ADD_TO_CART_BUTTON = SamplePagesPage.ADD_TO_CART_BUTTON
+    PIZZA_FORM = SamplePagesPage.PIZZA_FORM
+    QUANTITY_VALIDATION_MODAL = SamplePagesPage.QUANTITY_VALIDATION_MODAL
+    QUANTITY_VALIDATION_MESSAGE = SamplePagesPage.QUANTITY_VALIDATION_MESSAGE
+    ADDING_TO_CART_MODAL = SamplePagesPage.ADDING_TO_CART_MODAL
+    ADDING_TO_CART_MESSAGE = SamplePagesPage.ADDING_TO_CART_MESSAGE
+    CART_CONFIRMATION_MESSAGE = SamplePagesPage.CART_CONFIRMATION_MESSAGE
+    PAGE_LOAD_LOCATORS = SamplePagesPage.PAGE_LOAD_LOCATORS
+        
+    async def click_sample_pages_section(self):
+        """
+        Click on the Sample Pages section
+        """
+        self.logger.info("Clicking on Sample Pages section")
+        await self.wait_for_element(self.SAMPLE_PAGES_BUTTON)
+        await self.click_element(self.SAMPLE_PAGES_BUTTON)
+        await self.verify_page_loaded()
+        
+    async def are_login_form_elements_visible(self) -> bool:
+        """
+        Check if all login form elements are visible
+        """
+        self.logger.info("Checking visibility of login form elements")
+        return await self.are_elements_visible([
+            self.USERNAME_FIELD,
+            self.PASSWORD_FIELD,
+            self.LOGIN_BUTTON,
+            self.REMEMBER_ME_CHECKBOX,
+            self.REGISTER_LINK
+        ])
+    
+    async def fill_login_form(self, username: str = None, password: str = None, remember_me: bool = False):
+        """
+        Fill in the login form
+        """
+        if username:
+            self.logger.info(f"Filling username: {username}")
+            await self.page.fill(self.USERNAME_FIELD, username)
+            
+        if password:
+            self.logger.info("Filling password")
+            await self.page.fill(self.PASSWORD_FIELD, password)
+            
+        if remember_me:
+            self.logger.info("Checking remember me checkbox")
+            await self.click_element(self.REMEMBER_ME_CHECKBOX)
+    
+    async def click_login_button(self):
+        """
+        Click the login button
+        """
+        self.logger.info("Clicking login button")
+        await self.click_element(self.LOGIN_BUTTON)
+
+    async def is_pizza_form_visible(self) -> bool:
+        """
+        Check if pizza order form is visible
+        """
+        self.logger.info("Checking if pizza order form is visible")
+        try:
+            await self.wait_for_element(self.PIZZA_FORM)
+            return await self.are_elements_visible([self.PIZZA_FORM, self.PIZZA_SIZE_LARGE, self.ADD_TO_CART_BUTTON])
+        except Exception as e:
+            self.logger.error(f"Error checking pizza form visibility: {str(e)}")
+            return False
+
+    async def verify_pizza_form_sections(self) -> bool:
+        """
+        Verify all pizza form sections are present
+        """
+        self.logger.info("Verifying pizza form sections")
+        sections = ("Pizza Size", "Pizza Flavor", "Sauce", "Toppings", "Quantity")
+        states = await self.get_elements_state({section: f"text={section}" for section in sections})
+        missing = [section for section, state in states.items() if not state['visible']]
+        if missing:
+            self.logger.error(f"Sections not found: {missing}")
+        return not missing
+
+    async def select_pizza_size(self, size: str):
+        """
+        Select the pizza size
+        """
+        self.logger.info(f"Selecting pizza size: {size}")
+        selector = self.PIZZA_SIZE_MAP.get(size)
+        if not selector:
+            raise ValueError(f"Invalid pizza size: {size}")
+        await self.click_element(selector)
+    
+    async def select_pizza_flavor(self, flavor: str):
+        """
+        Select pizza flavor from dropdown
+        """
+        self.logger.info(f"Selecting pizza flavor: {flavor}")
+        await self.page.select_option(self.PIZZA_FLAVOR_DROPDOWN, label=flavor)
+    
+    async def select_sauce(self, sauce: str):
+        """
+        Select the sauce type
+        """
+        self.logger.info(f"Selecting sauce: {sauce}")
+        selector = self.SAUCE_MAP.get(sauce)
+        if not selector:
+            raise ValueError(f"Invalid sauce type: {sauce}")
+        await self.click_element(selector)
+    
+    async def check_topping(self, topping: str):
+        """
+        Check a specific topping
+        """
+        self.logger.info(f"Checking topping: {topping}")
+        selector = self.TOPPINGS_MAP.get(topping)
+        if not selector:
+            raise ValueError(f"Invalid topping: {topping}")
+        await self.click_element(selector)
+    
+    async def enter_quantity(self, quantity: str):
+        """
+        Enter pizza quantity
+        """
+        self.logger.info(f"Entering quantity: {quantity}")
+        await self.fill_text(self.QUANTITY_INPUT, quantity)
+    
+    async def click_add_to_cart(self):
+        """
+        Click the Add to Cart button
+        """
+        self.logger.info("Clicking Add to Cart button")
+        await self.click_element(self.ADD_TO_CART_BUTTON)
+    
+    async def get_quantity_validation_message(self) -> str:
+        """
+        Get the quantity validation message from modal
+        """
+        await self.wait_for_element(self.QUANTITY_VALIDATION_MODAL)
+        return await self.get_element_text(self.QUANTITY_VALIDATION_MESSAGE)
+    
+    async def get_cart_status_message(self) -> str:
+        """
+        Get the cart status message
+        """
+        await self.wait_for_element(self.CART_CONFIRMATION_MESSAGE)
+        return await self.get_element_text(self.CART_CONFIRMATION_MESSAGE)
+    
+    async def get_adding_to_cart_message(self) -> str:
+        """
+        Get the "Adding to cart..." message
+        """
+        await self.wait_for_element(self.ADDING_TO_CART_MODAL)
+        return await self.get_element_text(self.ADDING_TO_CART_MESSAGE)
@@ -0,0 +1,50 @@
+import importlib
+from behave.matchers import ParseMatcher, MatchWithError
+
+# Async step definitions, keyed by step type like behave's own registry
+STEP_REGISTRY = {'given': [], 'when': [], 'then': [], 'step': []}
+
+# Same order behave loads features/steps in, so the first match agrees
+STEP_MODULES = (
+    'features.async_steps.advanced_ui_steps',
+    'features.async_steps.form_steps',
+    'features.async_steps.home_steps',
+    'features.async_steps.registration_steps',
+    'features.async_steps.sample_page_steps',
+)
+
+def _step_decorator(step_type):
+    """
+    Create a decorator that registers an async step function for a step type
+    """
+    def decorator(pattern):
+        def wrapper(func):
+            STEP_REGISTRY[step_type].append(ParseMatcher(func, pattern, step_type))
+            return func
+        return wrapper
+    return decorator
+
+given = _step_decorator('given')
+when = _step_decorator('when')
+then = _step_decorator('then')
+step = _step_decorator('step')
+
+def load_steps():
+    """
+    Import every async step module so its steps are registered
+    """
+    for module in STEP_MODULES:
+        importlib.import_module(module)
+
+def find_step(step_type: str, step_text: str):
+    """
+    Find the first async step matching the step text, or None if undefined
+    """
+    for matcher in STEP_REGISTRY.get(step_type, []) + STEP_REGISTRY['step']:
+        match = matcher.match(step_text)
+        if match is None:
+            continue
+        if isinstance(match, MatchWithError):
+            raise match.stored_error
+        return match
+    return None
@@ -0,0 +1,67 @@
+from features.async_steps import when, then
+from features.async_pages.advanced_ui_page import AsyncAdvancedUIPage
+import logging
+
+logger = logging.getLogger(__name__)
+
+@when('I click on Advanced UI Features section')
+async def click_advanced_ui_section(context):
+    """
+    Click on Advanced UI Features section
+    """
+    context.advanced_ui = AsyncAdvancedUIPage(context.page)
+    await context.advanced_ui.click_advanced_ui_section()
+
+@then('I should see "Challenge 1" as the title')
+async def verify_challenge_title(context):
+    """
+    Verify the challenge title is displayed
+    """
+    assert await context.advanced_ui.is_element_visible(context.advanced_ui.CHALLENGE_TITLE), \
+        "Challenge 1 title not visible"
+
+@then('I should see book rating instructions')
+async def verify_instructions(context):
+    """
+    Verify the rating instructions are displayed
+    """
+    instructions = "Using Selenium (or any other tool) - read the * Rating of the book"
+    assert await context.advanced_ui.is_element_visible(f"text={instructions}"), \
+        "Rating instructions not visible"
+
+@when('I get the star rating for "{book_title}"')
+async def get_book_rating(context, book_title):
+    """
+    Get the star rating for the specified book
+    """
+    context.current_rating = await context.advanced_ui.get_book_rating()
+
+@when('I enter the star rating in the text box')
+async def enter_current_rating(context):
+    """
+    Enter the current star rating
+    """
+    await context.advanced_ui.enter_rating(context.current_rating)
+
+@when('I enter an incorrect star rating "{rating}"')
+async def enter_incorrect_rating(context, rating):
+    """
+    Enter an incorrect star rating
+    """
+    await context.advanced_ui.enter_rating(rating)
+
+@when('I click Check Rating button')
+async def click_check_rating(context):
+    """
+    Click the Check Rating button
+    """
+    await context.advanced_ui.click_check_rating()
+
+@then('I should see "{expected_message}" message')
+async def verify_rating_message(context, expected_message):
+    """
+    Verify the rating result message
+    """
+    actual_message = await context.advanced_ui.get_rating_result()
+    assert actual_message == expected_message, \
+        f"Expected message '{expected_message}' but got '{actual_message}'"
@@ -0,0 +1,301 @@
+from features.async_steps import when, then
+from features.async_pages.forms_page import AsyncFormsPage
+from utils.download_verifier import expected_checksums, verify_download
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+@when('I click on Forms section')
+async def click_forms_section(context):
+    """
+    Click on Forms section
+    """
+    context.forms_page = AsyncFormsPage(context.page)
+    await context.forms_page.click_forms_section()
+
+@when('I enter "{years}" years of automation experience')
+async def enter_experience(context, years):
+    """
+    Enter years of experience
+    """
+    await context.forms_page.enter_experience(years)
+
+@when('I select the following programming languages')
+async def select_languages(context):
+    """
+    Select programming languages
+    """
+    languages = [row['language'] for row in context.table]
+    await context.forms_page.select_programming_languages(languages)
+
+@when('I select "{tool}" as the automation tool')
+async def select_automation_tool(context, tool):
+    """
+    Select automation tool
+    """
+    await context.forms_page.select_automation_tool(tool)
+
+@when('I select "{skill}" as primary skill')
+async def select_primary_skill(context, skill):
+    """
+    Select primary skill
+    """
+    await context.forms_page.select_primary_skill(skill)
+
+@when('I select the following languages from multi-select')
+async def select_multiple_languages(context):
+    """
+    Select multiple languages from the multi-select dropdown
+    """
+    languages = [row['language'] for row in context.table]
+    await context.forms_page.select_languages(languages)
+
+@when('I enter "{text}" in the notes area')
+async def enter_notes(context, text):
+    """
+    Enter notes
+    """
+    await context.forms_page.enter_notes(text)
+
+@when('I toggle "Speaks German" switch to "{state}"')
+async def toggle_german(context, state):
+    """
+    Toggle German switch
+    """
+    await context.forms_page.toggle_german_switch(state)
+
+@when('I set German fluency level to "{level}"')
+async def set_fluency(context, level):
+    """
+    Set German fluency level
+    """
+    await context.forms_page.set_german_fluency(level)
+
+@when('I click Submit Form')
+async def submit_empty_form(context):
+    """
+    Submit form 
+    """
+    await context.forms_page.submit_form()
+
+@when('I enter "{city}" as city')
+async def enter_city(context, city):
+    """
+    Enter city
+    """
+    await context.forms_page.fill_validation_form(city=city)
+
+@when('I enter "{state}" as state')
+async def enter_state(context, state):
+    """
+    Enter state
+    """
+    await context.forms_page.fill_validation_form(state=state)
+
+@when('I enter "{zip_code}" as zip')
+async def enter_zip(context, zip_code):
+    """
+    Enter zip code
+    """
+    await context.forms_page.fill_validation_form(zip_code=zip_code)
+
+@when('I accept the terms and conditions')
+async def accept_terms(context):
+    """
+    Accept terms and conditions
+    """
+    await context.forms_page.accept_terms()
+
+@then('I should see "{message}" validation for {field}')
+async def verify_validation_message(context, message, field):
+    """
+    Verify validation message for a specific field
+    """
+    expected_message = message.strip('"').strip().strip('.')
+    actual_message = await context.forms_page.get_validation_message(field.lower())
+    actual_message = actual_message.strip().strip('.')
+    assert expected_message.lower() in actual_message.lower(), \
+        f"Expected validation message containing '{expected_message}' for {field} but got '{actual_message}'"
+
+@then('the "{field}" field should be read-only with value "{value}"')
+async def verify_readonly_field(context, field, value):
+    """
+    Verify read-only field
+    """
+    field_map = {
+        "Common Sense": context.forms_page.COMMON_SENSE_INPUT,
+        "Current Salary": context.forms_page.SALARY_INPUT
+    }
+    element = context.page.locator(field_map[field])
+    assert await element.is_enabled() is False, f"Field {field} should be disabled"
+    placeholder = await element.get_attribute('placeholder')
+    assert placeholder == value, f"Expected value '{value}' but got '{placeholder}'"
+    
+@then('I should see the entered experience "{years}" displayed')
+async def verify_experience_displayed(context, years):
+    """
+    Verify displayed experience years
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.EXPERIENCE_VALIDATION)
+    assert actual_text == years, f"Expected {years} but got {actual_text}"
+
+@when('I click the download link')
+async def click_download_link(context):
+    """
+    Click the download link and save the file into the scenario's downloads directory
+    """
+    context.download = await context.forms_page.download_file(context.downloads_dir)
+    context.download_path = context.download['path']
+    logger.info(f"File downloaded to: {context.download_path}")
+
+@then('the file should be downloaded successfully')
+async def verify_file_downloaded(context):
+    """
+    Verify the downloaded file's size and SHA-256 against the expected checksums
+    """
+    assert os.path.exists(context.download_path), \
+        f"Downloaded file not found at {context.download_path}"
+    verify_download(
+        context.download,
+        expected_checksums(),
+        strict=context.config.get('downloads', {}).get('strict_checksums', False)
+    )
+    logger.info(f"Successfully verified download: {context.download_path}")
+
+@then('I should see selected languages "{expected_languages}" displayed')
+async def verify_selected_languages(context, expected_languages):
+    """
+    Verify selected languages display
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.CHECKBOX_VALIDATION)
+    assert expected_languages.upper() == actual_text.upper(), \
+        f"Expected {expected_languages} but got {actual_text}"
+
+@then('I should see "{tool}" as selected tool')
+async def verify_selected_tool(context, tool):
+    """
+    Verify selected automation tool
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.RADIO_VALIDATION)
+    assert actual_text == tool, f"Expected {tool} but got {actual_text}"
+
+@then('I should see "{skill}" as selected primary skill')
+async def verify_primary_skill(context, skill):
+    """
+    Verify selected primary skill
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.SKILL_VALIDATION)
+    assert actual_text == skill, f"Expected {skill} but got {actual_text}"
+
+@then('I should see "{languages}" in selected languages')
+async def verify_multiselect_languages(context, languages):
+    """
+    Verify selected languages in multi-select
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.LANGUAGE_VALIDATION)
+    assert actual_text == languages, f"Expected {languages} but got {actual_text}"
+
+@then('I should see "{text}" in notes validation')
+async def verify_notes_text(context, text):
+    """
+    Verify notes text
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.NOTES_VALIDATION)
+    assert actual_text == text, f"Expected {text} but got {actual_text}"
+
+@then('I should see "{status}" for German speaking status')
+async def verify_german_status(context, status):
+    """
+    Verify German speaking status
+    """
+    actual_status = await context.forms_page.get_german_status()
+    assert str(status).lower() == actual_status.lower(), \
+        f"Expected German speaking status to be '{status}' but got '{actual_status}'"
+
+@then('I should see "{level}" as German fluency level')
+async def verify_fluency_level(context, level):
+    """
+    Verify German fluency level
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.FLUENCY_VALIDATION)
+    assert actual_text == level, f"Expected {level} but got {actual_text}"
+
+@when('I select "{filename}" for single file upload')
+async def select_single_file(context, filename):
+    """
+    Select file for single file upload
+    """
+    await context.forms_page.upload_single_file(filename)
+
+@when('I select multiple files for upload')
+async def select_multiple_files(context):
+    """
+    Select multiple files for upload
+    """
+    filenames = [row['filename'] for row in context.table]
+    await context.forms_page.upload_multiple_files(filenames)
+
+@when('I upload a generated "{size}" file named "{filename}"')
+async def upload_generated_file(context, size, filename):
+    """
+    Upload a generated payload of the given size
+    """
+    context.upload_ms = await context.forms_page.upload_generated_file(size, filename)
+
+@then('I should see "{filename}" as the uploaded file name')
+async def verify_uploaded_filename(context, filename):
+    """
+    Verify uploaded file name
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.SINGLE_FILE_VALIDATION)
+    assert actual_text == filename, f"Expected {filename} but got {actual_text}"
+
+@then('I should see "{filenames}" as the uploaded files')
+async def verify_uploaded_filenames(context, filenames):
+    """
+    Verify uploaded files names
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.MULTIPLE_FILES_VALIDATION)
+    assert actual_text.strip() == filenames.strip(), f"Expected {filenames} but got {actual_text}"
+
+@when('I enter "{name}" in the non-English name field')
+async def enter_non_english_name(context, name):
+    """
+    Enter name in non-English name field
+    """
+    await context.forms_page.enter_non_english_name(name)
+
+@when('I select the following non-English options')
+async def select_non_english_options(context):
+    """
+    Select non-English language options
+    """
+    language_mapping = {
+        "Marathi": "मराठी",
+        "Gujarati": "ગુજરાતી",
+        "Punjabi": "ਪੰਜਾਬੀ"
+    }
+    selected_languages = [
+        language_mapping[row['language']] for row in context.table
+        if row['language'] in language_mapping
+    ]
+    await context.forms_page.select_non_english_languages(selected_languages)
+
+@then('I should see "{text}" in the non-English name validation')
+async def verify_non_english_name(context, text):
+    """
+    Verify non-English name validation
+    """
+    actual_text = await context.forms_page.get_element_text(context.forms_page.NON_ENGLISH_NAME_VALIDATION)
+    assert actual_text == text, f"Expected {text} but got {actual_text}"
+
+@then('the "Current Salary" field should be disabled')
+async def verify_salary_field_disabled(context):
+    """
+    Verify salary field is disabled
+    """
+    salary_field = context.page.locator(context.forms_page.SALARY_INPUT)
+    assert await salary_field.is_disabled(), "Salary field should be disabled"
+    assert await salary_field.get_attribute('placeholder') == "You should not provide this", \
+        "Salary field placeholder text is incorrect"
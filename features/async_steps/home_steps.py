@@ -0,0 +1,31 @@
+from features.async_steps import given, then
+from features.async_pages.home_page import AsyncHomePage
+import logging
+
+logger = logging.getLogger(__name__)
+
+@given('I navigate to the automation playground')
+async def navigate_to_home(context):
+    """
+    Navigate to the automation playground home page
+    """
+    context.home_page = AsyncHomePage(context.page)
+    await context.home_page.navigate()
+
+@then('I should see the page title "{expected_title}"')
+async def verify_page_title(context, expected_title):
+    """
+    Verify the page title matches the expected text
+    """
+    actual_title = await context.home_page.get_page_title()
+    assert actual_title == expected_title, \
+        f"Expected title '{expected_title}' but got '{actual_title}'"
+
+@then('I should see the subtitle "{expected_subtitle}"')
+async def verify_page_subtitle(context, expected_subtitle):
+    """
+    Verify the page subtitle matches the expected text
+    """
+    actual_subtitle = await context.home_page.get_page_subtitle()
+    assert actual_subtitle == expected_subtitle, \
+        f"Expected subtitle '{expected_subtitle}' but got '{actual_subtitle}'"
@@ -0,0 +1,207 @@
+from features.async_steps import given, when, then
+from features.async_pages.home_page import AsyncHomePage
+from features.async_pages.sample_pages import AsyncSamplePagesPage
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from utils.auth_state import apply_login_state_async
+import logging
+
+logger = logging.getLogger(__name__)
+
+@when('I click on the Sample Pages section')
+async def click_sample_pages(context):
+    """
+    Click on Sample Pages section
+    """
+    if not hasattr(context, 'sample_pages'):
+        context.sample_pages = AsyncSamplePagesPage(context.page)
+    await context.sample_pages.click_sample_pages_section()
+
+@then('I should see "Log in" page title')
+async def verify_login_title(context):
+    """
+    Verify we're on the login page
+    """
+    assert await context.sample_pages.is_element_visible("h2:has-text('Log in')"), \
+        "Login page title not visible"
+
+@then('I should see "Already a user? Please login." text')
+async def verify_login_subtitle(context):
+    """
+    Verify login page subtitle
+    """
+    assert await context.sample_pages.is_element_visible("text=Already a user? Please login."), \
+        "Login page subtitle not visible"
+    
+@then('I should see the login form elements')
+async def verify_login_form(context):
+    """
+    Verify login form elements are visible
+    """
+    assert await context.sample_pages.are_login_form_elements_visible(), \
+        "Login form elements not visible"
+
+@then('I should see "Hint-admin" text')
+async def verify_hint_text(context):
+    """
+    Verify hint text is visible
+    """
+    assert await context.sample_pages.is_element_visible("text=Hint: admin"), \
+        "Hint text not visible"
+
+@given('I am logged in as "{username}" with password "{password}"')
+async def login_with_cached_state(context, username, password):
+    """
+    Log in, starting from the cached storage state for these credentials when available
+    """
+    context.sample_pages = AsyncSamplePagesPage(context.page)
+    base_url = context.sample_pages.config['base_url']
+    cache = getattr(context, 'login_state_cache', None)
+
+    entry = cache.get(base_url, username, password) if cache else None
+    if entry is not None:
+        await apply_login_state_async(context.browser_context, context.page, entry)
+        # Like a fresh login, the state only counts once the post-login page has loaded
+        try:
+            await context.sample_pages.wait_for_element(context.sample_pages.PIZZA_FORM, cache.verify_timeout)
+            logger.info(f"Restored cached login state for {username}")
+            return
+        except PlaywrightTimeoutError:
+            logger.warning(f"Cached login state for {username} was rejected, logging in again")
+            cache.invalidate(base_url, username, password)
+
+    context.home_page = AsyncHomePage(context.page)
+    await context.home_page.navigate()
+    await context.sample_pages.click_sample_pages_section()
+    await context.sample_pages.fill_login_form(username=username, password=password)
+    await context.sample_pages.click_login_button()
+    await context.sample_pages.wait_for_element(context.sample_pages.PIZZA_FORM)
+
+    if cache is not None:
+        cache.save(base_url, username, password, await context.browser_context.storage_state(), context.page.url)
+
+@when('I fill in the username "{username}"')
+async def fill_username(context, username):
+    """Fill in username"""
+    await context.sample_pages.fill_login_form(username=username, password=None)
+
+@when('I fill in the password "{password}"')
+async def fill_password(context, password):
+    """Fill in password"""
+    await context.sample_pages.fill_login_form(username=None, password=password)
+
+@when('I check the Remember me option')
+async def check_remember_me(context):
+    """Check the Remember me checkbox"""
+    await context.sample_pages.fill_login_form(username=None, password=None, remember_me=True)
+
+@when('I click the Log in button')
+async def click_login(context):
+    """Click login button"""
+    await context.sample_pages.click_login_button()
+
+@then('I should be redirected to the pizza order form')
+async def verify_pizza_form_redirect(context):
+    """Verify that we are redirected to the pizza order form"""
+    assert await context.sample_pages.is_pizza_form_visible(), \
+        "Pizza order form is not visible"
+
+@then('I should see "{expected_text}" in the page')
+async def verify_page_title(context, expected_text):
+    """Verify the page title matches the expected text"""
+    actual_text = await context.sample_pages.get_element_text(context.sample_pages.PIZZA_TITLE)
+    assert expected_text in actual_text, \
+        f"Expected text '{expected_text}' not found in '{actual_text}'"
+
+@then('I should see pizza customization options')
+async def verify_pizza_customization_options(context):
+    """Verify all pizza customization options are present"""
+    assert await context.sample_pages.verify_pizza_form_sections(), \
+        "Not all pizza form sections are visible"
+
+@when('I select "{size}" pizza size')
+async def select_pizza_size(context, size):
+    """Select pizza size"""
+    await context.sample_pages.select_pizza_size(size)
+
+@when('I select "{flavor}" from pizza flavor dropdown')
+async def select_pizza_flavor(context, flavor):
+    """Select pizza flavor"""
+    await context.sample_pages.select_pizza_flavor(flavor)
+
+@when('I select "{sauce}" sauce')
+async def select_sauce(context, sauce):
+    """Select sauce type"""
+    await context.sample_pages.select_sauce(sauce)
+
+@when('I check the following toppings')
+async def check_toppings(context):
+    """Check specified toppings"""
+    for row in context.table:
+        await context.sample_pages.check_topping(row['topping'])
+
+@when('I enter "{quantity}" as the quantity')
+async def enter_quantity(context, quantity):
+    """Enter pizza quantity"""
+    await context.sample_pages.enter_quantity(quantity)
+
+@when('I click Add to Cart')
+async def click_add_to_cart(context):
+    """Click Add to Cart button"""
+    await context.sample_pages.click_add_to_cart()
+
+@then('I should see the quantity validation message "{expected_message}"')
+async def verify_quantity_validation(context, expected_message):
+    """Verify quantity validation message"""
+    actual_message = await context.sample_pages.get_quantity_validation_message()
+    assert expected_message in actual_message, \
+        f"Expected message '{expected_message}' not found in '{actual_message}'"
+
+@then('I should see the "{expected_message}" message')
+async def verify_adding_cart_message(context, expected_message):
+    """Verify adding to cart message"""
+    actual_message = await context.sample_pages.get_adding_to_cart_message()
+    assert expected_message in actual_message, \
+        f"Expected message '{expected_message}' not found in '{actual_message}'"
+
+@then('I should see "{expected_message}" confirmation')
+async def verify_cart_confirmation(context, expected_message):
+    """Verify cart confirmation message"""
+    actual_message = await context.sample_pages.get_cart_status_message()
+    assert expected_message in actual_message, \
+        f"Expected message '{expected_message}' not found in '{actual_message}'"
+    
+@when('I click on "New user? Register!" link')
+async def click_register_link(context):
+    """
+    Click on the register link
+    """
+    if not hasattr(context, 'sample_pages'):
+        context.sample_pages = AsyncSamplePagesPage(context.page)
+    await context.sample_pages.click_element("text=New user? Register!")
+
+@when('I click on "{link_text}" link')
+async def click_link_with_text(context, link_text):
+    """Click on a link with specific text"""
+    await context.sample_pages.click_element(f"text={link_text}")
+
+@then('I should be on the registration page')
+async def verify_registration_page(context):
+    """Verify that we are on the registration page"""
+    assert await context.sample_pages.is_element_visible("text=Register"), \
+        "Not on registration page"
+    
+@then('I should see "Register" page title')
+async def verify_registration_title(context):
+    """
+    Verify registration page title
+    """
+    assert await context.sample_pages.is_element_visible("h2:has-text('Register')"), \
+        "Registration page title not visible"
+    
+@then('I should see "Create your account. It\'s free and only takes a minute." text')
+async def verify_registration_subtitle(context):
+    """
+    Verify registration page subtitle
+    """
+    assert await context.sample_pages.is_element_visible("text=Create your account. It's free and only takes a minute."), \
+        "Registration page subtitle not visible"
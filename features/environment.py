@@ -1,8 +1,19 @@
 import os
-import json
-from datetime import datetime
-from playwright.sync_api import sync_playwright
-from config.logging_config import logger
+from collections import Counter
+from time import perf_counter
+from config.config_loader import config_loader
+from config.logging_config import logger, configure_logging, set_log_context, set_log_step
+from utils.browser_manager import BrowserManager
+from utils.context_pool import ContextPool
+from utils.downloads import DownloadDirectories
+from utils.auth_state import LoginStateCache
+from utils.har import HAR_MODES, apply_har, har_path
+from utils.local_server import LocalAUTServer
+from utils.resource_blocking import ResourceBlocker
+from utils.screenshots import screenshot_service
+from utils.timing import action_timer, timing_output_path
+from utils.upload_cache import upload_cache
+from utils.tracing import ScenarioTracer
 
 def before_all(context):
     """
@@ -10,33 +21,97 @@ def before_all(context):
     """
     logger.info("Starting test execution")
     
-    # Create downloads directory if it doesn't exist
+    # Root of the per-scenario downloads directories
     downloads_dir = os.path.join(os.getcwd(), 'test_data', 'downloads')
-    if not os.path.exists(downloads_dir):
-        os.makedirs(downloads_dir)
+    screenshots_dir = os.path.join(os.getcwd(), 'screenshots')
+
+    # Parallel workers each get their own downloads and screenshots directories
+    worker_id = os.getenv('WORKER_ID')
+    if worker_id is not None:
+        downloads_dir = os.path.join(downloads_dir, f'worker_{worker_id}')
+        screenshots_dir = os.path.join(screenshots_dir, f'worker_{worker_id}')
 
     # Create screenshots directory if it doesn't exist
-    screenshots_dir = os.path.join(os.getcwd(), 'screenshots')
     if not os.path.exists(screenshots_dir):
         os.makedirs(screenshots_dir)
 
     # Store screenshots path in context
     context.screenshots_dir = screenshots_dir
-    
-    # Store downloads path in context for use in tests
-    context.downloads_dir = downloads_dir
 
-    # Load configuration
-    env = os.getenv('ENV', 'dev')
-    config_path = f'config/{env}_config.json'
-    
-    try:
-        with open(config_path, 'r') as f:
-            context.config = json.load(f)
-            logger.info(f"Loaded configuration for environment: {env}")
-    except Exception as e:
-        logger.error(f"Failed to load config file {config_path}: {str(e)}")
-        raise
+    # Load configuration, shared with the page objects through the config service
+    context.env = os.getenv('ENV', 'dev')
+    context.config = config_loader.get(context.env)
+
+    # Every scenario downloads into its own directory, removed in the background afterwards
+    context.download_dirs = DownloadDirectories.from_config(
+        downloads_dir,
+        context.config.get('downloads', {}),
+        f'worker_{worker_id}' if worker_id is not None else None
+    )
+
+    # Upload fixtures are read once per worker and kept in memory up to uploads.max_in_memory_bytes
+    upload_cache.configure(context.config.get('uploads', {}))
+
+    # Failure and page object screenshots are written to screenshots_dir in the background
+    screenshot_service.configure(screenshots_dir, context.config.get('screenshots', {}))
+
+    # LOG_VERBOSITY=quiet drops per-action page object logs for throughput runs,
+    # LOG_FORMAT=json writes structured NDJSON records instead of text lines
+    configure_logging(context.config.get('logging', {}))
+
+    # Serve the Application Under Test locally when the environment asks for it
+    server_config = context.config.get('local_server', {})
+    if server_config.get('enabled', False):
+        # Parallel workers each take a free port instead of the configured one
+        port = 0 if worker_id is not None else server_config.get('port', 0)
+        context.local_server = LocalAUTServer(
+            server_config.get('root', os.path.join('test_data', 'aut')),
+            server_config.get('host', '127.0.0.1'),
+            port
+        )
+        context.local_server.start()
+        # Point the page objects at the local server for the rest of the run
+        config_loader.override('base_url', context.local_server.base_url)
+
+    # Time page object actions per selector, scenario and step
+    action_timer.enabled = context.config.get('timing', {}).get('enabled', False)
+
+    # Run-wide totals of requests blocked by resource_blocking
+    context.resource_blocking_totals = Counter()
+
+    context.har_mode = determine_har_mode(context)
+    if context.har_mode != 'off':
+        logger.info(f"HAR mode: {context.har_mode}")
+
+    # Share logged-in storage state between scenarios of this run
+    login_cache_config = context.config.get('login_state_cache', {})
+    if login_cache_config.get('enabled', False):
+        context.login_state_cache = LoginStateCache.from_config(login_cache_config)
+
+    # Record a trace chunk per scenario, kept only for failures
+    if determine_trace_on_failure(context):
+        traces_dir = context.config.get('tracing', {}).get('directory', os.path.join('reports', 'traces'))
+        if worker_id is not None:
+            traces_dir = os.path.join(traces_dir, f'worker_{worker_id}')
+        context.tracer = ScenarioTracer.from_config(traces_dir, context.config.get('tracing', {}))
+        logger.info(f"Tracing failed scenarios to {traces_dir}")
+
+    # Launch the browser once for the whole run when reuse is enabled
+    context.reuse_browser = determine_browser_reuse(context)
+    if context.reuse_browser:
+        context.browser_manager = create_browser_manager(context)
+        context.browser_manager.start()
+
+        # Pre-warm ready-made contexts for the first scenarios
+        pool_config = context.config.get('context_pool', {})
+        if pool_config.get('enabled', False):
+            context.context_pool = ContextPool(
+                context.browser_manager,
+                pool_config.get('size', 1),
+                prepare_context=context.tracer.attach if hasattr(context, 'tracer') else None
+            )
+            context.context_pool.replenish()
+            logger.info(f"Context pool pre-warmed with {context.context_pool.size} context(s)")
 
 def determine_headless_mode(context):
     """
@@ -59,83 +134,177 @@ def determine_headless_mode(context):
     # Use config file setting or default to headed for local development
     return context.config.get('headless', False)
 
+def determine_browser_reuse(context):
+    """
+    Determines whether one browser is shared by all scenarios
+    Priority:
+    1. REUSE_BROWSER environment variable (if set)
+    2. Config file setting
+    3. Default to a fresh browser per scenario
+    """
+    reuse_env = os.getenv('REUSE_BROWSER')
+    if reuse_env is not None:
+        return reuse_env.lower() == 'true'
+
+    return context.config.get('reuse_browser', False)
+
+def determine_trace_on_failure(context):
+    """
+    Determines whether Playwright traces are recorded and kept for failed scenarios
+    Priority:
+    1. TRACE_ON_FAILURE environment variable (if set)
+    2. Config file setting
+    3. Default to no tracing
+    """
+    trace_env = os.getenv('TRACE_ON_FAILURE')
+    if trace_env is not None:
+        return trace_env.lower() == 'true'
+
+    return context.config.get('trace_on_failure', False)
+
+def determine_har_mode(context):
+    """
+    Determines whether scenario traffic is recorded to or replayed from HAR files
+    Priority:
+    1. HAR_MODE environment variable (off, record or replay)
+    2. Config file setting
+    3. Default to off
+    """
+    mode = os.getenv('HAR_MODE') or context.config.get('har', {}).get('mode', 'off')
+    mode = mode.lower()
+    if mode not in HAR_MODES:
+        raise ValueError(f"Unsupported HAR mode: {mode}")
+    return mode
+
+def create_browser_manager(context):
+    """
+    Creates a browser manager from the environment and configuration
+    """
+    # Get browser type from environment variable or default to chromium
+    browser_name = os.getenv('BROWSER', 'chromium')
+
+    return BrowserManager(
+        browser_name,
+        headless=determine_headless_mode(context),
+        context_options={
+            'accept_downloads': True,  # Enable downloads
+            'viewport': context.config.get('viewport', {'width': 1920, 'height': 1080})
+        }
+    )
+
 def before_scenario(context, scenario):
     """
     Runs before each scenario
     """
+    action_timer.set_scenario(scenario.name)
+    set_log_context(scenario.feature.name, scenario.name)
+    context.scenario_started = perf_counter()
+    # Store the scenario's downloads path in context for use in tests
+    context.downloads_dir = context.download_dirs.create(scenario.name)
     try:
-        context.playwright = sync_playwright().start()
-        
-        # Get browser type from environment variable or default to chromium
-        browser_name = os.getenv('BROWSER', 'chromium')
-        
-        # Determine headless mode
-        headless = determine_headless_mode(context)
-        
-        # Launch browser based on browser type
-        if browser_name == 'chromium':
-            context.browser = context.playwright.chromium.launch(headless=headless)
-        elif browser_name == 'firefox':
-            context.browser = context.playwright.firefox.launch(headless=headless)
-        elif browser_name == 'webkit':
-            context.browser = context.playwright.webkit.launch(headless=headless)
+        if not context.reuse_browser:
+            context.browser_manager = create_browser_manager(context)
+            context.browser_manager.start()
+
+        if hasattr(context, 'context_pool'):
+            # Take a pre-warmed context and page from the pool
+            context.browser_context, context.page = context.context_pool.acquire()
         else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
-        
-        # Create new browser context with downloads enabled
-        context.browser_context = context.browser.new_context(
-            accept_downloads=True,  # Enable downloads
-            viewport=context.config.get('viewport', {'width': 1920, 'height': 1080})
-        )
-        
-        # Create new page
-        context.page = context.browser_context.new_page()
-        
-        logger.info(f"Browser {browser_name} initialized successfully in {'headless' if headless else 'headed'} mode")
+            # Create new isolated browser context, relaunching the browser if it crashed
+            context.browser_context = context.browser_manager.new_context()
+
+            # Create new page
+            context.page = context.browser_context.new_page()
+        context.browser = context.browser_manager.browser
+
+        # Record or replay the scenario's network traffic
+        if context.har_mode != 'off':
+            har_config = context.config.get('har', {})
+            apply_har(
+                context.browser_context,
+                context.har_mode,
+                har_path(har_config.get('directory', os.path.join('test_data', 'har')), context.env, scenario),
+                not_found=har_config.get('not_found', 'abort'),
+                url_filter=har_config.get('url_filter')
+            )
+
+        if hasattr(context, 'tracer'):
+            context.tracer.start_scenario(context.browser_context, scenario.name)
+
+        # Block resources the scenarios never look at, registered last so it runs before HAR routing
+        blocking_config = context.config.get('resource_blocking', {})
+        if blocking_config.get('enabled', False):
+            context.resource_blocker = ResourceBlocker.from_config(blocking_config)
+            context.resource_blocker.attach(context.browser_context)
+
+        logger.info(f"Browser context for scenario '{scenario.name}' initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize browser: {str(e)}")
         raise
 
+def before_step(context, step):
+    """
+    Runs before each step
+    """
+    step_name = f"{step.keyword} {step.name}"
+    action_timer.set_step(step_name)
+    set_log_step(step_name)
+    context.step_started = perf_counter()
+
+def after_step(context, step):
+    """
+    Runs after each step
+    """
+    duration_ms = round((perf_counter() - context.step_started) * 1000, 3)
+    logger.info(f"Step {step.status.name}: {step.keyword} {step.name}", extra={'duration_ms': duration_ms})
+    set_log_step(None)
+
 def after_scenario(context, scenario):
     """
     Runs after each scenario
     """
     try:
-        # Clean up downloads directory
-        if hasattr(context, 'downloads_dir') and os.path.exists(context.downloads_dir):
-            for file in os.listdir(context.downloads_dir):
-                file_path = os.path.join(context.downloads_dir, file)
-                try:
-                    if os.path.isfile(file_path):
-                        os.unlink(file_path)
-                        logger.info(f"Cleaned up file: {file_path}")
-                except Exception as e:
-                    logger.error(f"Error cleaning up file {file_path}: {e}")
-    
+        # Hand the scenario's downloads to the background reaper, keeping them for failures if configured
+        if hasattr(context, 'downloads_dir'):
+            context.download_dirs.release(context.downloads_dir, scenario.status == "failed")
+
+        if hasattr(context, 'resource_blocker'):
+            blocking_stats = context.resource_blocker.stats()
+            logger.info(f"Resource blocking for '{scenario.name}': {blocking_stats}")
+            context.resource_blocking_totals.update({
+                'blocked_requests': blocking_stats['blocked_requests'],
+                'allowed_requests': blocking_stats['allowed_requests'],
+                'allowed_bytes': blocking_stats['allowed_bytes']
+            })
+
         if scenario.status == "failed":
-            # Create timestamp for unique screenshot name
-            timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-            screenshot_path = os.path.join(
-                context.screenshots_dir, 
-                f"failure_{scenario.name.replace(' ', '_')}_{timestamp}.png"
-            )
-            
-            # Take screenshot
-            if hasattr(context, 'page'):
-                context.page.screenshot(path=screenshot_path, full_page=True)
-                logger.info(f"Screenshot captured at: {screenshot_path}")                
-
-        # Close browser resources
-        if hasattr(context, 'page'):
-            context.page.close()
-        if hasattr(context, 'browser_context'):
-            context.browser_context.close()
-        if hasattr(context, 'browser'):
-            context.browser.close()
-        if hasattr(context, 'playwright'):
-            context.playwright.stop()
+            # Capture the screenshot unless the browser itself went away, it is written in the background
+            if hasattr(context, 'page') and context.browser_manager.is_alive():
+                screenshot_service.capture(context.page, f"failure_{scenario.name}")
+
+        # Save the scenario's trace chunk if it failed, discard it otherwise
+        if hasattr(context, 'tracer') and hasattr(context, 'browser_context') and context.browser_manager.is_alive():
+            context.tracer.stop_scenario(context.browser_context, scenario.name, scenario.status == "failed")
+
+        # Close browser resources, skipping them if the browser has crashed
+        if hasattr(context, 'context_pool'):
+            # Hand the used context back for disposal and refill the pool for the next scenario
+            if hasattr(context, 'browser_context'):
+                context.context_pool.release(context.browser_context)
+            context.context_pool.replenish()
+        elif hasattr(context, 'browser_manager'):
+            if context.browser_manager.is_alive():
+                if hasattr(context, 'page'):
+                    context.page.close()
+                if hasattr(context, 'browser_context'):
+                    context.browser_context.close()
+            if not context.reuse_browser:
+                context.browser_manager.stop()
             
         logger.info("Browser resources cleaned up")
+        if hasattr(context, 'scenario_started'):
+            duration_ms = round((perf_counter() - context.scenario_started) * 1000, 3)
+            logger.info(f"Scenario {scenario.status.name}: {scenario.name}", extra={'duration_ms': duration_ms})
     except Exception as e:
         logger.error(f"Error in cleanup: {str(e)}")
         raise
@@ -144,4 +313,40 @@ def after_all(context):
     """
     Runs after all tests
     """
+    if getattr(context, 'resource_blocking_totals', None):
+        logger.info(f"Resource blocking totals: {dict(context.resource_blocking_totals)}")
+
+    if hasattr(context, 'login_state_cache'):
+        logger.info(f"Login state cache stats: {context.login_state_cache.stats()}")
+
+    if hasattr(context, 'tracer'):
+        logger.info(
+            f"Tracing API time, excluding the per-action snapshot and screenshot cost: {context.tracer.stats()}"
+        )
+
+    if hasattr(context, 'context_pool'):
+        logger.info(f"Context pool stats: {context.context_pool.stats()}")
+        context.context_pool.close()
+
+    if getattr(context, 'reuse_browser', False) and hasattr(context, 'browser_manager'):
+        context.browser_manager.stop()
+        logger.info("Shared browser shut down")
+
+    if hasattr(context, 'local_server'):
+        context.local_server.stop()
+
+    if action_timer.enabled and action_timer.actions:
+        timing_path = timing_output_path(context.config.get('timing', {}))
+        action_timer.write_json(timing_path)
+        logger.info(f"Page action timings (full data in {timing_path}):\n{action_timer.summary_table()}")
+
+    if hasattr(context, 'download_dirs'):
+        context.download_dirs.close()
+        logger.info(f"Download directory stats: {context.download_dirs.stats()}")
+
+    screenshot_service.flush()
+    logger.info(f"Screenshot stats: {screenshot_service.stats()}")
+    logger.info(f"Upload cache stats: {upload_cache.stats()}")
+
+    logger.info(f"Config loader stats: {config_loader.stats()}")
     logger.info("Test execution completed")
\ No newline at end of file
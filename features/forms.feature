@@ -63,6 +63,11 @@ Feature: Form Interactions
             | index.html    |
         Then I should see " sample_text.txt index.html" as the uploaded files
 
+    @forms @file-upload @slow
+    Scenario: Upload a Generated Large File
+        When I upload a generated "5MB" file named "large_payload.bin"
+        Then I should see "large_payload.bin" as the uploaded file name
+
     @forms @file-handling @p1
 Scenario: Handle File Upload and Download
     Given I navigate to the automation playground
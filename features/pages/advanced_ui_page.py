@@ -18,6 +18,11 @@ class AdvancedUIPage(BasePage):
     CHECK_RATING_BUTTON = "#check_rating"
     RATING_RESULT = "#validate_rating"
     
+    PAGE_LOAD_LOCATORS = (
+        "RATING_INPUT", "CHALLENGE_TITLE", "BOOK_TITLE", "STAR_RATING",
+        "CHECK_RATING_BUTTON", "RATING_RESULT"
+    )
+    
     def __init__(self, page):
         """
         Initialize the advanced UI page
@@ -30,6 +35,7 @@ class AdvancedUIPage(BasePage):
         """
         self.logger.info("Clicking on Advanced UI Features section")
         self.click_element(self.ADVANCED_UI_BUTTON)
+        self.verify_page_loaded()
         
     def get_book_rating(self) -> str:
         """
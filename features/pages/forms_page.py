@@ -1,4 +1,7 @@
 from features.pages.base_page import BasePage
+from utils.download_verifier import download_stats
+from utils.upload_cache import upload_cache
+from time import perf_counter
 import os
 import logging
 
@@ -62,6 +65,7 @@ class FormsPage(BasePage):
     MULTIPLE_FILES_UPLOAD = "#upload_files"
     SINGLE_FILE_VALIDATION = "#validate_cv"
     MULTIPLE_FILES_VALIDATION = "#validate_files"
+    DOWNLOAD_LINK = "#download_file"
     
     # Non-English Elements
     NON_ENGLISH_NAME = "input#नाव"  # Using ID directly
@@ -70,12 +74,21 @@ class FormsPage(BasePage):
     PUNJABI_CHECKBOX = "input#ਪੰਜਾਬੀ"
     NON_ENGLISH_NAME_VALIDATION = "#नाव_तपासा"
     
+    # Validated in one pass once the Forms page has loaded
+    PAGE_LOAD_LOCATORS = (
+        "EXPERIENCE_INPUT", "PYTHON_CHECKBOX", "JAVASCRIPT_CHECKBOX", "SELENIUM_RADIO",
+        "PROTRACTOR_RADIO", "PRIMARY_SKILL_DROPDOWN", "LANGUAGE_MULTISELECT", "NOTES_AREA",
+        "GERMAN_SWITCH", "GERMAN_FLUENCY", "CITY_INPUT", "STATE_INPUT", "ZIP_INPUT",
+        "TERMS_CHECKBOX", "SUBMIT_BUTTON", "SINGLE_FILE_UPLOAD", "MULTIPLE_FILES_UPLOAD"
+    )
+    
     def click_forms_section(self):
         """
         Click on the Forms section link
         """
         self.logger.info("Clicking on Forms section")
         self.click_element(self.FORMS_LINK)
+        self.verify_page_loaded()
         
     def enter_experience(self, years: str):
         """
@@ -112,24 +125,18 @@ class FormsPage(BasePage):
                 
                 # First click
                 self.page.click(checkbox_info[lang]["checkbox"], force=True)
-                self.page.wait_for_timeout(500)  # Short wait after click
-                
-                # Check if state changed to desired state
-                new_state = checkbox.is_checked()
-                self.logger.info(f"{lang} state after first click: {new_state}")
+                self.pause(500)
                 
-                # If not in desired state, click again
-                if not new_state:
+                # If the click did not register, click again
+                if not self._reaches_checked(checkbox_info[lang]["checkbox"]):
                     self.logger.info(f"First click didn't set {lang}, trying second click")
                     self.page.click(checkbox_info[lang]["checkbox"], force=True)
-                    self.page.wait_for_timeout(500)
-                    final_state = checkbox.is_checked()
-                    self.logger.info(f"{lang} state after second click: {final_state}")
+                    self.pause(500)
                     
-                    if not final_state:
-                        screenshot_path = f"checkbox_failure_{lang.lower()}.png"
-                        self.page.screenshot(path=screenshot_path)
+                    if not self._reaches_checked(checkbox_info[lang]["checkbox"], timeout=self.config['timeout']):
+                        self.take_screenshot(f"checkbox_failure_{lang.lower()}")
                         raise AssertionError(f"Could not select {lang} checkbox after two attempts")
+                self.logger.info(f"{lang} selected")
         
         # Final verification of all selections
         for lang in languages:
@@ -137,19 +144,28 @@ class FormsPage(BasePage):
             if not checkbox.is_checked():
                 raise AssertionError(f"{lang} checkbox lost its selection")
                 
-        # Verify validation text
-        final_validation = self.get_element_text("#check_validate")
-        self.logger.info(f"Final validation text: {final_validation}")
-        
         # Verify all selected languages appear in validation text
         missing_languages = []
         for lang in languages:
-            if checkbox_info[lang]["validation_text"] not in final_validation:
+            try:
+                self.wait_for_text(self.CHECKBOX_VALIDATION, checkbox_info[lang]["validation_text"])
+            except AssertionError:
                 missing_languages.append(lang)
+        self.logger.info(f"Final validation text: {self.get_element_text(self.CHECKBOX_VALIDATION)}")
         
         if missing_languages:
-            self.page.screenshot(path="validation_text_failure.png")
+            self.take_screenshot("validation_text_failure")
             raise AssertionError(f"Languages not showing in validation text: {missing_languages}")
+    
+    def _reaches_checked(self, selector: str, checked: bool = True, timeout: int = None) -> bool:
+        """
+        Check whether a control reaches the checked state within a short timeout
+        """
+        try:
+            self.wait_for_checked(selector, checked, timeout or self.config.get('state_change_timeout', 2000))
+            return True
+        except AssertionError:
+            return False
                 
     def select_automation_tool(self, tool: str):
         """
@@ -220,14 +236,13 @@ class FormsPage(BasePage):
         if current_state != desired_state:
             # First click
             self.click_element(self.GERMAN_SWITCH)
-            self.page.wait_for_timeout(500)
+            self.pause(500)
             
-            # Check if we got desired state
-            new_state = checkbox.is_checked()
-            if new_state != desired_state:
-                # Try second click if needed
+            # Try second click if the first one did not register
+            if not self._reaches_checked(self.GERMAN_SWITCH, desired_state):
                 self.click_element(self.GERMAN_SWITCH)
-                self.page.wait_for_timeout(500)
+                self.pause(500)
+                self.wait_for_checked(self.GERMAN_SWITCH, desired_state)
 
     def get_german_status(self) -> str:
         """
@@ -242,16 +257,12 @@ class FormsPage(BasePage):
         self.logger.info(f"Setting German fluency to: {level}")
         self.page.fill(self.GERMAN_FLUENCY, level)
         
-    def fill_validation_form(self, city: str = None, state: str = None, zip_code: str = None):
+    def fill_validation_form(self, city: str = None, state: str = None, zip_code: str = None) -> dict:
         """
-        Fill validation form fields
+        Fill validation form fields and return their validation state
         """
-        if city:
-            self.fill_text(self.CITY_INPUT, city)
-        if state:
-            self.fill_text(self.STATE_INPUT, state)
-        if zip_code:
-            self.fill_text(self.ZIP_INPUT, zip_code)
+        values = {self.CITY_INPUT: city, self.STATE_INPUT: state, self.ZIP_INPUT: zip_code}
+        return self.fill_form({selector: value for selector, value in values.items() if value})
             
     def accept_terms(self):
         """
@@ -265,9 +276,15 @@ class FormsPage(BasePage):
         Click the submit form button
         """
         self.logger.info("Submitting form")
+        url_before = self.page.url
         self.click_element(self.SUBMIT_BUTTON)
-        # Wait for validations to appear
-        self.page.wait_for_timeout(500)
+        self.pause(500)
+        # Wait for the page to navigate away or for validations to appear
+        self.wait_for_condition(
+            """(url) => window.location.href !== url ||
+                document.querySelector('form.was-validated') !== null""",
+            arg=url_before
+        )
 
     def get_validation_message(self, field: str) -> str:
         """
@@ -304,19 +321,28 @@ class FormsPage(BasePage):
     
     def upload_single_file(self, filename: str):
         """
-        Upload a single file
+        Upload a single file from the cached upload fixtures
         """
-        file_path = os.path.join(os.getcwd(), 'test_data', 'uploads', filename)
-        self.logger.info(f"Uploading file: {file_path}")
-        self.page.set_input_files(self.SINGLE_FILE_UPLOAD, file_path)
+        self.logger.info(f"Uploading file: {filename}")
+        self.page.set_input_files(self.SINGLE_FILE_UPLOAD, upload_cache.payload(filename))
 
     def upload_multiple_files(self, filenames: list):
         """
-        Upload multiple files
+        Upload multiple files from the cached upload fixtures
+        """
+        self.logger.info(f"Uploading files: {filenames}")
+        self.page.set_input_files(self.MULTIPLE_FILES_UPLOAD, upload_cache.payloads(filenames))
+
+    def upload_generated_file(self, size, name: str = None) -> float:
+        """
+        Upload a generated payload of the given size (e.g. "5MB") and return the upload latency in ms
         """
-        file_paths = [os.path.join(os.getcwd(), 'test_data', 'uploads', f) for f in filenames]
-        self.logger.info(f"Uploading files: {file_paths}")
-        self.page.set_input_files(self.MULTIPLE_FILES_UPLOAD, file_paths)
+        payload = upload_cache.synthetic(size, name)
+        started = perf_counter()
+        self.page.set_input_files(self.SINGLE_FILE_UPLOAD, payload)
+        elapsed_ms = (perf_counter() - started) * 1000
+        self.logger.info("Uploaded %s (%s bytes) in %.1f ms", payload['name'], len(payload['buffer']), elapsed_ms)
+        return elapsed_ms
 
     def enter_non_english_name(self, name: str):
         """
@@ -340,15 +366,19 @@ class FormsPage(BasePage):
             if lang in language_map:
                 self.click_element(language_map[lang])    
 
-    async def download_file(self):
+    def download_file(self, downloads_dir: str) -> dict:
         """
-        Handle file download
+        Click the download link and save the file into downloads_dir.
+        Returns the path, size, SHA-256, time-to-first-byte and throughput of the download.
         """
-        with self.page.expect_download() as download_info:
+        self.logger.info("Downloading file into %s", downloads_dir)
+        started = perf_counter()
+        with self.page.expect_download(timeout=self.config['timeout']) as download_info:
             self.click_element(self.DOWNLOAD_LINK)
         download = download_info.value
+        first_byte = perf_counter()
         
         # Wait for download to complete
-        download_path = os.path.join(self.context.downloads_dir, download.suggested_filename)
+        download_path = os.path.join(downloads_dir, download.suggested_filename)
         download.save_as(download_path)
-        return download_path
\ No newline at end of file
+        return download_stats(download_path, started, first_byte, perf_counter())
\ No newline at end of file
@@ -12,6 +12,8 @@ class HomePage(BasePage):
     PAGE_TITLE = "h1"
     PAGE_SUBTITLE = "h3"
     
+    PAGE_LOAD_LOCATORS = ("PAGE_TITLE", "PAGE_SUBTITLE")
+    
     def __init__(self, page):
         """
         Initialize the home page with Playwright page object
@@ -25,6 +27,7 @@ class HomePage(BasePage):
         """
         self.logger.info(f"Navigating to home page: {self.url}")
         self.navigate_to(self.url)
+        self.verify_page_loaded()
     
     def get_page_title(self) -> str:
         """
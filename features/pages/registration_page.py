@@ -83,22 +83,21 @@ class RegistrationPage(BasePage):
         self.logger.info("Getting error message")
         return self.get_element_text(self.ERROR_MESSAGE)
         
-    def fill_registration_form(self, form_data: dict):
+    def fill_registration_form(self, form_data: dict) -> dict:
         """
-        Fill in all registration form fields
+        Fill in all registration form fields and return their validation state
         """
         self.logger.info("Filling registration form")
         field_mapping = {
-            'First Name': self.fill_first_name,
-            'Last Name': self.fill_last_name,
-            'Email': self.fill_email,
-            'Password': self.fill_password,
-            'Confirm Password': self.fill_confirm_password
+            'First Name': self.FIRST_NAME_INPUT,
+            'Last Name': self.LAST_NAME_INPUT,
+            'Email': self.EMAIL_INPUT,
+            'Password': self.PASSWORD_INPUT,
+            'Confirm Password': self.CONFIRM_PASSWORD_INPUT
         }
         
-        for field, value in form_data.items():
-            if field in field_mapping:
-                field_mapping[field](value)
+        fields = {field_mapping[field]: value for field, value in form_data.items() if field in field_mapping}
+        return self.fill_form(fields)
 
     def is_on_confirmation_page(self) -> bool:
         """
@@ -20,6 +20,11 @@ class SamplePagesPage(BasePage):
     REMEMBER_ME_CHECKBOX = "input[type='checkbox']"
     REGISTER_LINK = "text=New user? Register!"
     HINT_ADMIN_TEXT = "text=Hint-admin"  # The hint text shown
+    
+    # Validated in one pass once the Login page has loaded
+    PAGE_LOAD_LOCATORS = (
+        "USERNAME_FIELD", "PASSWORD_FIELD", "LOGIN_BUTTON", "REMEMBER_ME_CHECKBOX", "REGISTER_LINK"
+    )
     # Pizza form elements - updated with correct locators from HTML source
     PIZZA_TITLE = "h3"
     
@@ -89,6 +94,7 @@ class SamplePagesPage(BasePage):
             # Wait for element to be visible
             self.wait_for_element(self.SAMPLE_PAGES_BUTTON)
             self.click_element(self.SAMPLE_PAGES_BUTTON)
+            self.verify_page_loaded()
             self.logger.info("Successfully clicked Sample Pages section")
         except Exception as e:
             self.logger.error(f"Failed to click Sample Pages section: {str(e)}")
@@ -107,18 +113,12 @@ class SamplePagesPage(BasePage):
         Check if all login form elements are visible
         """
         self.logger.info("Checking visibility of login form elements")
-        username_visible = self.is_element_visible(self.USERNAME_FIELD)
-        password_visible = self.is_element_visible(self.PASSWORD_FIELD)
-        login_button_visible = self.is_element_visible(self.LOGIN_BUTTON)
-        remember_me_visible = self.is_element_visible(self.REMEMBER_ME_CHECKBOX)
-        register_link_visible = self.is_element_visible(self.REGISTER_LINK)
-        
-        return all([
-            username_visible, 
-            password_visible, 
-            login_button_visible,
-            remember_me_visible,
-            register_link_visible
+        return self.are_elements_visible([
+            self.USERNAME_FIELD,
+            self.PASSWORD_FIELD,
+            self.LOGIN_BUTTON,
+            self.REMEMBER_ME_CHECKBOX,
+            self.REGISTER_LINK
         ])
     
     def fill_login_form(self, username: str = None, password: str = None, remember_me: bool = False):
@@ -158,10 +158,10 @@ class SamplePagesPage(BasePage):
             # Wait for the form to be visible
             self.wait_for_element(self.PIZZA_FORM)
             # Check for critical elements that indicate the form is loaded
-            return all([
-                self.is_element_visible(self.PIZZA_FORM),
-                self.is_element_visible(self.PIZZA_SIZE_LARGE),
-                self.is_element_visible(self.ADD_TO_CART_BUTTON)
+            return self.are_elements_visible([
+                self.PIZZA_FORM,
+                self.PIZZA_SIZE_LARGE,
+                self.ADD_TO_CART_BUTTON
             ])
         except Exception as e:
             self.logger.error(f"Error checking pizza form visibility: {str(e)}")
@@ -180,11 +180,11 @@ class SamplePagesPage(BasePage):
             "Quantity"
         ]
         
-        for section in sections:
-            if not self.is_element_visible(f"text={section}"):
-                self.logger.error(f"Section not found: {section}")
-                return False
-        return True
+        states = self.get_elements_state({section: f"text={section}" for section in sections})
+        missing = [section for section, state in states.items() if not state['visible']]
+        if missing:
+            self.logger.error(f"Sections not found: {missing}")
+        return not missing
 
     def are_pizza_customization_options_visible(self) -> bool:
         """
@@ -205,6 +205,8 @@ class SamplePagesPage(BasePage):
             self.QUANTITY_INPUT,
             self.ADD_TO_CART_BUTTON
         ]
+        return self.are_elements_visible(elements)
+    
     def select_pizza_size(self, size: str):
         """
         Select the pizza size
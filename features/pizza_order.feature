@@ -4,11 +4,7 @@ Feature: Pizza Order Functionality
     So that I can place my order successfully
 
     Background:
-        Given I navigate to the automation playground
-        When I click on the Sample Pages section
-        And I fill in the username "admin"
-        And I fill in the password "admin"
-        And I click the Log in button
+        Given I am logged in as "admin" with password "admin"
 
     @regression
     Scenario: Successful Login Redirects to Pizza Form
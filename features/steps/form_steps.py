@@ -2,6 +2,7 @@
 from behave import when, then
 from features.pages.forms_page import FormsPage
 from config.logging_config import logger
+from utils.download_verifier import expected_checksums, verify_download
 import os
 import logging
 
@@ -155,53 +156,26 @@ def verify_experience_displayed(context, years):
 @when('I click the download link')
 def click_download_link(context):
     """
-    Click the download link and handle the download
+    Click the download link and save the file into the scenario's downloads directory
     """
-    with context.page.expect_download() as download_info:
-        context.page.click('#download_file')
-    download = download_info.value
-    
-    # Save to downloads directory
-    context.download_path = os.path.join(context.downloads_dir, download.suggested_filename)
-    download.save_as(context.download_path)
+    context.download = context.forms_page.download_file(context.downloads_dir)
+    context.download_path = context.download['path']
     logger.info(f"File downloaded to: {context.download_path}")
 
 @then('the file should be downloaded successfully')
 def verify_file_downloaded(context):
     """
-    Verify file was downloaded successfully and clean up
-    """
-    try:
-        # Verify file exists
-        assert os.path.exists(context.download_path), \
-            f"Downloaded file not found at {context.download_path}"
-        
-        # Verify file is not empty
-        assert os.path.getsize(context.download_path) > 0, \
-            f"Downloaded file is empty: {context.download_path}"
-        
-        logger.info(f"Successfully verified download: {context.download_path}")
-        
-    finally:
-        # Clean up downloaded file
-        if os.path.exists(context.download_path):
-            os.remove(context.download_path)
-            logger.info(f"Cleaned up downloaded file: {context.download_path}")
-
-def after_scenario(context, scenario):
-    """
-    Clean up after each scenario
-    """
-    # Clean up downloads directory
-    if hasattr(context, 'downloads_dir') and os.path.exists(context.downloads_dir):
-        for file in os.listdir(context.downloads_dir):
-            file_path = os.path.join(context.downloads_dir, file)
-            try:
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-                    logger.info(f"Cleaned up file: {file_path}")
-            except Exception as e:
-                logger.error(f"Error cleaning up file {file_path}: {e}")
+    Verify the downloaded file's size and SHA-256 against the expected checksums
+    """
+    assert os.path.exists(context.download_path), \
+        f"Downloaded file not found at {context.download_path}"
+    verify_download(
+        context.download,
+        expected_checksums(context.env),
+        context.env,
+        strict=context.config.get('downloads', {}).get('strict_checksums', False)
+    )
+    logger.info(f"Successfully verified download: {context.download_path}")
 
 @then('the file should be downloaded to downloads directory')
 def verify_file_downloaded(context):
@@ -294,6 +268,13 @@ def select_multiple_files(context):
     filenames = [row['filename'] for row in context.table]
     context.forms_page.upload_multiple_files(filenames)
 
+@when('I upload a generated "{size}" file named "{filename}"')
+def upload_generated_file(context, size, filename):
+    """
+    Upload a generated payload of the given size
+    """
+    context.upload_ms = context.forms_page.upload_generated_file(size, filename)
+
 @then('I should see "{filename}" as the uploaded file name')
 def verify_uploaded_filename(context, filename):
     """
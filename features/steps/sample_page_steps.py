@@ -1,5 +1,8 @@
-from behave import when, then
+from behave import given, when, then
+from features.pages.home_page import HomePage
 from features.pages.sample_pages import SamplePagesPage
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils.auth_state import apply_login_state
 import logging
 
 logger = logging.getLogger(__name__)
@@ -44,6 +47,37 @@ def verify_hint_text(context):
     assert context.sample_pages.is_element_visible("text=Hint: admin"), \
         "Hint text not visible"
 
+@given('I am logged in as "{username}" with password "{password}"')
+def login_with_cached_state(context, username, password):
+    """
+    Log in, starting from the cached storage state for these credentials when available
+    """
+    context.sample_pages = SamplePagesPage(context.page)
+    base_url = context.sample_pages.config['base_url']
+    cache = getattr(context, 'login_state_cache', None)
+
+    entry = cache.get(base_url, username, password) if cache else None
+    if entry is not None:
+        apply_login_state(context.browser_context, context.page, entry)
+        # Like a fresh login, the state only counts once the post-login page has loaded
+        try:
+            context.sample_pages.wait_for_element(context.sample_pages.PIZZA_FORM, cache.verify_timeout)
+            logger.info(f"Restored cached login state for {username}")
+            return
+        except PlaywrightTimeoutError:
+            logger.warning(f"Cached login state for {username} was rejected, logging in again")
+            cache.invalidate(base_url, username, password)
+
+    context.home_page = HomePage(context.page)
+    context.home_page.navigate()
+    context.sample_pages.click_sample_pages_section()
+    context.sample_pages.fill_login_form(username=username, password=password)
+    context.sample_pages.click_login_button()
+    context.sample_pages.wait_for_element(context.sample_pages.PIZZA_FORM)
+
+    if cache is not None:
+        cache.save(base_url, username, password, context.browser_context.storage_state(), context.page.url)
+
 @when('I fill in the username "{username}"')
 def fill_username(context, username):
     """Fill in username"""
@@ -0,0 +1,9 @@
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runtime modules are imported as packages from the project root, as behave does
+sys.path.insert(0, PROJECT_ROOT)
+# The report scripts run as `python .github/scripts/<script>.py` and import each other by module name
+sys.path.insert(0, os.path.join(PROJECT_ROOT, '.github', 'scripts'))
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from utils.auth_state import LoginStateCache
+
+BASE_URL = 'https://site.test'
+
+
+@pytest.fixture
+def cache():
+    return LoginStateCache(ttl_seconds=60, verify_timeout=1000)
+
+
+def test_miss_then_hit(cache):
+    assert cache.get(BASE_URL, 'admin', 'admin') is None
+    cache.save(BASE_URL, 'admin', 'admin', {'cookies': []}, f'{BASE_URL}/pizza')
+    entry = cache.get(BASE_URL, 'admin', 'admin')
+    assert entry['url'] == f'{BASE_URL}/pizza'
+    assert cache.stats() == {'entries': 1, 'hits': 1, 'misses': 1}
+
+
+def test_entries_are_per_credentials_and_site(cache):
+    cache.save(BASE_URL, 'admin', 'admin', {}, BASE_URL)
+    assert cache.get(BASE_URL, 'admin', 'other') is None
+    assert cache.get(BASE_URL, 'user', 'admin') is None
+    assert cache.get('http://127.0.0.1:8765', 'admin', 'admin') is None
+
+
+def test_password_is_not_kept_in_plain_text(cache):
+    cache.save(BASE_URL, 'admin', 's3cret', {}, BASE_URL)
+    assert not any('s3cret' in key for key in cache._entries)
+
+
+def test_entry_expires_after_ttl(cache, monkeypatch):
+    cache.save(BASE_URL, 'admin', 'admin', {}, BASE_URL)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 61)
+    assert cache.get(BASE_URL, 'admin', 'admin') is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_entry_expires_with_its_cookies(cache):
+    expired = {'cookies': [{'name': 'session', 'expires': time.time() - 1}]}
+    cache.save(BASE_URL, 'admin', 'admin', expired, BASE_URL)
+    assert cache.get(BASE_URL, 'admin', 'admin') is None
+
+
+def test_session_cookies_do_not_expire_the_entry(cache):
+    cache.save(BASE_URL, 'admin', 'admin', {'cookies': [{'name': 'session', 'expires': -1}]}, BASE_URL)
+    assert cache.get(BASE_URL, 'admin', 'admin') is not None
+
+
+def test_invalidate(cache):
+    cache.save(BASE_URL, 'admin', 'admin', {}, BASE_URL)
+    cache.invalidate(BASE_URL, 'admin', 'admin')
+    cache.invalidate(BASE_URL, 'admin', 'admin')
+    assert cache.get(BASE_URL, 'admin', 'admin') is None
+
+
+def test_from_config():
+    cache = LoginStateCache.from_config({'ttl_seconds': 10, 'verify_timeout': 250})
+    assert (cache.ttl_seconds, cache.verify_timeout) == (10, 250)
@@ -0,0 +1,72 @@
+import copy
+import json
+from functools import reduce
+
+from combine_reports import empty_aggregate, ingest_reports, merge_aggregates, summarize_report
+
+
+def feature(name, *scenarios):
+    return {"name": name, "elements": [
+        {"type": "scenario", "name": scenario, "status": status, "tags": [], "duration": duration}
+        for scenario, status, duration in scenarios
+    ]}
+
+
+REPORTS = {
+    "smoke_results.json": {"start_time": "2024-01-01T10:00:00", "end_time": "2024-01-01T10:02:00", "features": [
+        feature("Forms", ("Fill", "passed", 1.0), ("Submit", "failed", 2.0))
+    ]},
+    "p1_results.json": {"start_time": "2024-01-01T09:58:00", "end_time": "2024-01-01T10:01:00", "features": [
+        feature("Forms", ("Upload", "skipped", 0.5)),
+        feature("Home", ("Load", "passed", 0.25))
+    ]},
+    "other_results.json": [feature("Books", ("Rating", "passed", 3.0), ("Search", "untested", 0.0))]
+}
+
+
+def write_reports(tmp_path):
+    paths = []
+    for name, report in sorted(REPORTS.items()):
+        path = tmp_path / name
+        path.write_text(json.dumps(report), encoding="utf-8")
+        paths.append(str(path))
+    empty = tmp_path / "empty_results.json"
+    empty.write_text("", encoding="utf-8")
+    invalid = tmp_path / "invalid_results.json"
+    invalid.write_text("[{", encoding="utf-8")
+    return paths + [str(empty), str(invalid)]
+
+
+def merge(left, right):
+    return merge_aggregates(copy.deepcopy(left), copy.deepcopy(right))
+
+
+def test_merge_aggregates_is_associative(tmp_path):
+    a, b, c, d, e = [summarize_report(path) for path in write_reports(tmp_path)]
+    assert merge(merge(a, b), c) == merge(a, merge(b, c))
+    assert merge(merge(merge(a, b), merge(c, d)), e) == merge(a, merge(b, merge(c, merge(d, e))))
+
+
+def test_empty_aggregate_is_the_identity(tmp_path):
+    a = summarize_report(write_reports(tmp_path)[0])
+    assert merge(empty_aggregate(), a) == a
+    assert merge(a, empty_aggregate()) == a
+
+
+def test_summarize_report_counts(tmp_path):
+    aggregate = reduce(merge, [summarize_report(path) for path in write_reports(tmp_path)], empty_aggregate())
+    assert (aggregate["files"], aggregate["skipped_files"]) == (5, 2)
+    assert aggregate["total_scenarios"] == 6
+    assert (aggregate["passed_scenarios"], aggregate["failed_scenarios"], aggregate["skipped_scenarios"]) == (3, 1, 2)
+    assert aggregate["start_time"] == "2024-01-01T09:58:00"
+    assert aggregate["end_time"] == "2024-01-01T10:02:00"
+    assert aggregate["features"]["Forms"] == {
+        "total_scenarios": 3, "passed_scenarios": 1, "failed_scenarios": 1, "skipped_scenarios": 1, "duration": 3.5
+    }
+
+
+def test_pool_matches_serial_ingestion(tmp_path):
+    paths = write_reports(tmp_path)
+    serial = ingest_reports(paths, workers=1)
+    pooled = ingest_reports(paths, workers=2)
+    assert pooled == serial
@@ -0,0 +1,102 @@
+import json
+import os
+
+import pytest
+
+from config.config_loader import DEFAULTS, ConfigLoader, _deep_merge
+
+
+def write_config(directory, env='test', **values):
+    config = {'base_url': 'https://site.test', 'timeout': 1000, 'viewport': {'width': 800, 'height': 600}}
+    config.update(values)
+    path = directory / f'{env}_config.json'
+    path.write_text(json.dumps(config), encoding='utf-8')
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch):
+    for name in list(os.environ):
+        if name.startswith('CONFIG_') or name == 'BASE_URL':
+            monkeypatch.delenv(name)
+
+
+def test_deep_merge_keeps_base_untouched():
+    base = {'a': 1, 'nested': {'x': 1, 'y': 2}}
+    merged = _deep_merge(base, {'nested': {'y': 3, 'z': 4}, 'b': 2})
+    assert merged == {'a': 1, 'b': 2, 'nested': {'x': 1, 'y': 3, 'z': 4}}
+    assert base == {'a': 1, 'nested': {'x': 1, 'y': 2}}
+
+
+def test_defaults_fill_missing_keys(tmp_path):
+    write_config(tmp_path, viewport={'width': 800})
+    config = ConfigLoader(str(tmp_path)).get('test')
+    assert config['state_change_timeout'] == DEFAULTS['state_change_timeout']
+    assert config['viewport'] == {'width': 800, 'height': DEFAULTS['viewport']['height']}
+
+
+def test_config_is_loaded_once(tmp_path):
+    write_config(tmp_path)
+    loader = ConfigLoader(str(tmp_path))
+    assert loader.get('test') is loader.get('test')
+    assert loader.load_count == 1
+
+
+def test_config_is_reloaded_when_the_file_changes(tmp_path):
+    path = write_config(tmp_path)
+    loader = ConfigLoader(str(tmp_path))
+    assert loader.get('test')['timeout'] == 1000
+    write_config(tmp_path, timeout=2000)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert loader.get('test')['timeout'] == 2000
+    assert loader.load_count == 2
+
+
+def test_env_overrides_known_keys(tmp_path, monkeypatch):
+    write_config(tmp_path, context_pool={'enabled': False, 'size': 1})
+    monkeypatch.setenv('CONFIG_TIMEOUT', '5000')
+    monkeypatch.setenv('CONFIG_CONTEXT_POOL__ENABLED', 'true')
+    monkeypatch.setenv('CONFIG_BROWSER', 'firefox')
+    monkeypatch.setenv('BASE_URL', 'http://127.0.0.1:8765')
+    config = ConfigLoader(str(tmp_path)).get('test')
+    assert config['timeout'] == 5000
+    assert config['context_pool'] == {'enabled': True, 'size': 1}
+    assert config['browser'] == 'firefox'
+    assert config['base_url'] == 'http://127.0.0.1:8765'
+
+
+def test_env_overrides_for_unknown_keys_are_ignored(tmp_path, monkeypatch):
+    write_config(tmp_path)
+    monkeypatch.setenv('CONFIG_RUNNER_TOKEN', 'abc')
+    monkeypatch.setenv('CONFIG_TIMEOUT__UNIT', 'ms')
+    monkeypatch.setenv('CONFIG_VIEWPORT__DEPTH', '3')
+    config = ConfigLoader(str(tmp_path)).get('test')
+    assert 'runner_token' not in config
+    assert config['timeout'] == 1000
+    assert config['viewport'] == {'width': 800, 'height': 600}
+
+
+@pytest.mark.parametrize('values', [
+    {'base_url': ''},
+    {'timeout': 0},
+    {'timeout': True},
+    {'browser': 'opera'},
+    {'viewport': [800, 600]}
+])
+def test_invalid_config_is_rejected(tmp_path, values):
+    write_config(tmp_path, **values)
+    with pytest.raises(ValueError):
+        ConfigLoader(str(tmp_path)).get('test')
+
+
+def test_runtime_override_survives_reload(tmp_path):
+    path = write_config(tmp_path)
+    loader = ConfigLoader(str(tmp_path))
+    loader.get('test')
+    loader.override('base_url', 'http://127.0.0.1:9000')
+    assert loader.get('test')['base_url'] == 'http://127.0.0.1:9000'
+    write_config(tmp_path, timeout=3000)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert loader.get('test')['base_url'] == 'http://127.0.0.1:9000'
@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+from utils.download_verifier import CHECKSUMS_PATH, download_stats, expected_checksums, hash_file, verify_download
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config')
+
+
+def stats_of(tmp_path, content: bytes, name: str = 'sample_text.txt') -> dict:
+    path = tmp_path / name
+    path.write_bytes(content)
+    return download_stats(str(path), 0.0, 0.1, 0.2)
+
+
+def test_hash_file_streams_in_chunks(tmp_path):
+    path = tmp_path / 'data.bin'
+    content = os.urandom(10_000)
+    path.write_bytes(content)
+    assert hash_file(str(path), chunk_size=7) == (hashlib.sha256(content).hexdigest(), len(content))
+
+
+def test_checksums_path_does_not_depend_on_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert os.path.isabs(CHECKSUMS_PATH)
+    assert 'sample_text.txt' in expected_checksums('local')
+
+
+def test_matching_entry_passes(tmp_path):
+    content = b'checked content'
+    stats = stats_of(tmp_path, content)
+    verify_download(stats, {'sample_text.txt': {'size': len(content), 'sha256': hashlib.sha256(content).hexdigest().upper()}})
+
+
+@pytest.mark.parametrize('entry', [{'size': 3}, {'sha256': '0' * 64}])
+def test_mismatching_entry_fails(tmp_path, entry):
+    with pytest.raises(AssertionError):
+        verify_download(stats_of(tmp_path, b'checked content'), {'sample_text.txt': entry})
+
+
+def test_empty_download_fails(tmp_path):
+    with pytest.raises(AssertionError, match='empty'):
+        verify_download(stats_of(tmp_path, b''), {})
+
+
+def test_missing_entry_only_fails_when_strict(tmp_path):
+    stats = stats_of(tmp_path, b'no entry for this file', 'other.txt')
+    verify_download(stats, {}, 'dev')
+    with pytest.raises(AssertionError, match='No expected checksum for other.txt in environment dev'):
+        verify_download(stats, {}, 'dev', strict=True)
+
+
+@pytest.mark.parametrize('env', ['dev', 'prod', 'local'])
+def test_strict_environments_have_checksums(env):
+    with open(os.path.join(CONFIG_DIR, f'{env}_config.json'), encoding='utf-8') as f:
+        config = json.load(f)
+    if config.get('downloads', {}).get('strict_checksums', False):
+        assert expected_checksums(env), f"{env} verifies downloads strictly but has no expected checksums"
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from utils.downloads import DownloadDirectories, DownloadReaper
+
+
+def test_reaper_removes_scheduled_directories(tmp_path):
+    reaper = DownloadReaper()
+    paths = []
+    for index in range(3):
+        path = tmp_path / f'scenario_{index}'
+        path.mkdir()
+        (path / 'file.txt').write_text('downloaded')
+        paths.append(path)
+        reaper.schedule(str(path))
+    reaper.schedule(str(tmp_path / 'already_gone'))
+    reaper.drain()
+    assert not any(path.exists() for path in paths)
+    assert (reaper.removed, reaper.failed) == (3, 0)
+
+
+def test_drain_without_work_returns():
+    DownloadReaper().drain()
+
+
+@pytest.fixture
+def directories(tmp_path):
+    return DownloadDirectories(str(tmp_path / 'scratch'), keep_failed=True, failed_root=str(tmp_path / 'kept'))
+
+
+def test_each_scenario_gets_its_own_directory(directories):
+    first = directories.create('Fill the form: step 1/2')
+    second = directories.create('Fill the form: step 1/2')
+    assert first != second
+    assert os.path.dirname(first) == directories.root
+    assert os.path.basename(first).startswith('Fill_the_form_step_1_2_')
+
+
+def test_passed_scenario_directory_is_removed(directories):
+    path = directories.create('passed')
+    directories.release(path, failed=False)
+    directories.close()
+    assert not os.path.exists(path)
+    assert directories.stats() == {'removed': 1, 'failed_removals': 0, 'retained': 0}
+
+
+def test_failed_scenario_directory_is_moved_out_of_the_scratch_root(directories, tmp_path):
+    path = directories.create('failed')
+    with open(os.path.join(path, 'report.csv'), 'w') as f:
+        f.write('data')
+    directories.release(path, failed=True)
+    directories.close()
+    kept = directories.retained[0]
+    assert not os.path.exists(path)
+    assert os.path.dirname(kept) == str(tmp_path / 'kept')
+    assert os.listdir(kept) == ['report.csv']
+    assert os.listdir(directories.root) == []
+
+
+def test_failed_scenario_directory_is_removed_without_retention(tmp_path):
+    directories = DownloadDirectories(str(tmp_path / 'scratch'), keep_failed=False, failed_root=str(tmp_path / 'kept'))
+    path = directories.create('failed')
+    directories.release(path, failed=True)
+    directories.close()
+    assert not os.path.exists(path)
+    assert not os.path.exists(tmp_path / 'kept')
+
+
+def test_from_config_keeps_failures_per_worker(tmp_path):
+    directories = DownloadDirectories.from_config(
+        str(tmp_path / 'scratch'), {'keep_failed': True, 'failed_directory': str(tmp_path / 'kept')}, 'worker_2'
+    )
+    assert directories.failed_root == str(tmp_path / 'kept' / 'worker_2')
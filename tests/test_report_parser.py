@@ -0,0 +1,160 @@
+import json
+
+import pytest
+
+from report_parser import EmptyReportError, ReportParseError, iter_scenarios
+
+# Chunk sizes small enough to split every token, plus the default-sized read
+CHUNK_SIZES = [1, 2, 3, 7, 64, 64 * 1024]
+
+FEATURES = [
+    {
+        "keyword": "Feature",
+        "name": "Forms é \"quoted\"",
+        "elements": [
+            {
+                "type": "background",
+                "name": "Open the forms page",
+                "steps": [{"keyword": "Given", "name": "I open the page", "result": {"status": "passed", "duration": 9.0}}]
+            },
+            {
+                "type": "scenario",
+                "name": "Escapes \\ \" \n \t ☃ 😀 and a long name " + "x" * 200,
+                "status": "passed",
+                "tags": ["smoke", "p1"],
+                "duration": 1.25e-3,
+                "steps": [
+                    {
+                        "keyword": "Given",
+                        "name": "I open the page",
+                        "result": {"status": "passed", "duration": 0.5},
+                        "text": "log {with} [brackets] and \"quotes\" " * 50,
+                        "embeddings": [{"mime_type": "image/png", "data": "QUJD" * 500}]
+                    },
+                    {"keyword": "Then", "name": "it never ran"}
+                ]
+            },
+            {
+                "type": "scenario",
+                "name": "Duration from steps",
+                "status": "failed",
+                "tags": [],
+                "steps": [
+                    {"keyword": "When", "name": "one", "result": {"status": "passed", "duration": 1.5}},
+                    {"keyword": "Then", "name": "two", "result": {"status": "failed", "duration": -0.25,
+                                                                  "error_message": ["a", {"b": [1, None, True]}]}}
+                ]
+            }
+        ]
+    },
+    {"keyword": "Feature", "name": "Empty", "elements": []},
+    {
+        "keyword": "Feature",
+        "elements": [{"type": "scenario", "name": "Name after elements", "status": "skipped", "duration": 12345678901234}],
+        "name": "Named last"
+    }
+]
+
+
+def expected_records(features):
+    """
+    Scenario records built from the loaded report, the reference for the streaming parser
+    """
+    records = []
+    for feature in features:
+        for element in feature.get("elements", []):
+            if element.get("type") == "background":
+                continue
+            steps = element.get("steps", [])
+            duration = element.get("duration")
+            if duration is None:
+                duration = sum(step.get("result", {}).get("duration", 0) for step in steps)
+            records.append({
+                "feature": feature.get("name", "Unknown Feature"),
+                "scenario": element["name"],
+                "status": element["status"],
+                "tags": element.get("tags", []),
+                "duration": float(duration)
+            })
+    return records
+
+
+def write_report(tmp_path, content, name="results.json"):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_plain_list_matches_json(tmp_path, chunk_size):
+    path = write_report(tmp_path, json.dumps(FEATURES, indent=2))
+    assert list(iter_scenarios(path, chunk_size=chunk_size)) == expected_records(FEATURES)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_ascii_escaped_report_matches_json(tmp_path, chunk_size):
+    # \\uXXXX escapes and surrogate pairs split across chunks must decode the same
+    path = write_report(tmp_path, json.dumps(FEATURES, ensure_ascii=True, separators=(',', ':')))
+    assert list(iter_scenarios(path, chunk_size=chunk_size)) == expected_records(FEATURES)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_wrapped_report_reads_meta(tmp_path, chunk_size):
+    report = {
+        "start_time": "2024-01-01T10:00:00",
+        "features": FEATURES,
+        "summary": {"nested": [{"ignored": "]}"}]},
+        "end_time": "2024-01-01T10:05:00"
+    }
+    path = write_report(tmp_path, json.dumps(report))
+    meta = {}
+    records = list(iter_scenarios(path, meta, chunk_size=chunk_size))
+    assert records == expected_records(FEATURES)
+    assert meta == {"start_time": "2024-01-01T10:00:00", "end_time": "2024-01-01T10:05:00"}
+
+
+def test_background_elements_are_skipped(tmp_path):
+    path = write_report(tmp_path, json.dumps(FEATURES))
+    scenarios = [record["scenario"] for record in iter_scenarios(path)]
+    assert "Open the forms page" not in scenarios
+    assert len(scenarios) == 3
+
+
+def test_steps_are_included_on_request(tmp_path):
+    path = write_report(tmp_path, json.dumps(FEATURES))
+    records = list(iter_scenarios(path, include_steps=True))
+    assert records[0]["steps"] == [
+        {"step": "Given I open the page", "status": "passed", "duration": 0.5},
+        {"step": "Then it never ran", "status": "untested", "duration": None}
+    ]
+    assert [step["duration"] for step in records[1]["steps"]] == [1.5, -0.25]
+    assert "steps" not in next(iter_scenarios(path))
+
+
+def test_feature_name_given_after_elements(tmp_path):
+    path = write_report(tmp_path, json.dumps(FEATURES))
+    assert list(iter_scenarios(path))[-1]["feature"] == "Named last"
+
+
+@pytest.mark.parametrize("content", ["", "   \n\t "])
+def test_empty_file(tmp_path, content):
+    path = write_report(tmp_path, content)
+    with pytest.raises(EmptyReportError):
+        list(iter_scenarios(path))
+
+
+@pytest.mark.parametrize("content", [
+    '[{"name": "Forms", "elements": [',
+    '[{"name": "Unterminated}]',
+    '[{"name": "Forms" "elements": []}]',
+    '[{"name": "Forms", "elements": [{"name": "a", "duration": 1.}]}]',
+    '[{"name": "Bad escape \\x"}]',
+    '[]]',
+    '[] {}',
+    '[nul]'
+])
+@pytest.mark.parametrize("chunk_size", [1, 64 * 1024])
+def test_invalid_file(tmp_path, content, chunk_size):
+    path = write_report(tmp_path, content)
+    with pytest.raises(ReportParseError):
+        list(iter_scenarios(path, chunk_size=chunk_size))
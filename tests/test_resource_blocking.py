@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.resource_blocking import ResourceBlocker
+
+
+@pytest.fixture
+def blocker():
+    return ResourceBlocker.from_config({
+        'block_resource_types': ['image', 'font'],
+        'block_url_patterns': ['*google-analytics.com*', '*/ads/*'],
+        'allow_url_patterns': ['*/static/logo.png', '*cdn.example.com/ads/*']
+    })
+
+
+@pytest.mark.parametrize('url, resource_type, blocked', [
+    ('https://site.test/photo.jpg', 'image', True),
+    ('https://site.test/font.woff2', 'font', True),
+    ('https://www.google-analytics.com/collect', 'script', True),
+    ('https://site.test/ads/banner.js', 'script', True),
+    ('https://site.test/forms.html', 'document', False),
+    ('https://site.test/app.js', 'script', False),
+    # Allow patterns win over both block lists
+    ('https://site.test/static/logo.png', 'image', False),
+    ('https://cdn.example.com/ads/banner.js', 'script', False)
+])
+def test_should_block(blocker, url, resource_type, blocked):
+    assert blocker.should_block(url, resource_type) is blocked
+
+
+def test_patterns_are_case_sensitive(blocker):
+    assert not blocker.should_block('https://site.test/ADS/banner.js', 'script')
+
+
+def test_empty_config_blocks_nothing():
+    assert not ResourceBlocker.from_config({}).should_block('https://site.test/photo.jpg', 'image')
+
+
+def test_route_handler_counts_blocked_and_loaded(blocker):
+    blocked_route = MagicMock()
+    blocked_route.request.url = 'https://site.test/photo.jpg'
+    blocked_route.request.resource_type = 'image'
+    passed_route = MagicMock()
+    passed_route.request.url = 'https://site.test/app.js'
+    passed_route.request.resource_type = 'script'
+
+    blocker._handle_route(blocked_route)
+    blocker._handle_route(passed_route)
+    blocker._on_response(MagicMock(headers={'content-length': '120'}))
+    blocker._on_response(MagicMock(headers={}))
+
+    blocked_route.abort.assert_called_once_with('blockedbyclient')
+    passed_route.fallback.assert_called_once_with()
+    assert blocker.stats() == {
+        'blocked_requests': 1,
+        'blocked_by_type': {'image': 1},
+        'allowed_requests': 2,
+        'allowed_bytes': 120
+    }
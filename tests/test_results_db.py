@@ -0,0 +1,109 @@
+import pytest
+
+from results_db import connect, default_run_id, duration_trend, percentile, record_run, regressions
+
+
+def scenario(name, duration, status="passed", steps=()):
+    return {
+        "feature": "Forms",
+        "scenario": name,
+        "status": status,
+        "duration": duration,
+        "steps": [{"step": step, "status": "passed", "duration": step_duration} for step, step_duration in steps]
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "history.db")
+    record_run(path, "r1", [
+        scenario("Fill", 1.0, steps=[("Given I open", 0.5), ("When I fill", 0.5)]),
+        scenario("Submit", 2.0),
+        scenario("Upload", 1.0),
+        scenario("Broken", 1.0, status="failed")
+    ], git_sha="aaa", browser="chromium")
+    record_run(path, "r2", [
+        scenario("Fill", 4.0, steps=[("Given I open", 3.5), ("When I fill", 0.5)]),
+        scenario("Submit", 2.5),
+        scenario("Upload", 0.5),
+        scenario("Broken", 9.0, status="failed")
+    ], git_sha="bbb", browser="chromium")
+    return path
+
+
+@pytest.mark.parametrize("values, fraction, expected", [
+    ([], 0.5, None),
+    ([7.0], 0.95, 7.0),
+    ([4, 1, 3, 2], 0.5, 2),
+    ([5, 1, 4, 2, 3], 0.5, 3),
+    (list(range(1, 21)), 0.95, 19),
+    (list(range(1, 101)), 0.95, 95),
+    ([1, 2, 3], 1.0, 3),
+    ([1, 2, 3], 0.0, 1)
+])
+def test_percentile_nearest_rank(values, fraction, expected):
+    assert percentile(values, fraction) == expected
+
+
+def test_regressions_rank_slowest_first(db_path):
+    connection = connect(db_path)
+    try:
+        rows = regressions(connection, "r1", "r2")
+        assert [(row[1], row[5]) for row in rows] == [("Fill", 3.0), ("Submit", 0.5)]
+        assert rows[0][6] == 4.0
+        # Faster and failing scenarios are not regressions
+        assert regressions(connection, "r1", "r2", min_delta=1.0)[0][1] == "Fill"
+        assert len(regressions(connection, "r1", "r2", min_delta=1.0)) == 1
+        assert regressions(connection, "r2", "r1")[0][1] == "Upload"
+    finally:
+        connection.close()
+
+
+def test_step_regressions(db_path):
+    connection = connect(db_path)
+    try:
+        rows = regressions(connection, "r1", "r2", steps=True)
+        assert [(row[2], row[5]) for row in rows] == [("Given I open", 3.0)]
+    finally:
+        connection.close()
+
+
+def test_regressions_use_the_median_of_repeated_names(tmp_path):
+    path = str(tmp_path / "history.db")
+    record_run(path, "r1", [scenario("Outline", 1.0), scenario("Outline", 1.0), scenario("Outline", 1.0)])
+    record_run(path, "r2", [scenario("Outline", 1.0), scenario("Outline", 2.0), scenario("Outline", 2.0)])
+    connection = connect(path)
+    try:
+        assert [(row[3], row[4]) for row in regressions(connection, "r1", "r2")] == [(1.0, 2.0)]
+    finally:
+        connection.close()
+
+
+def test_recording_a_run_again_replaces_it(db_path):
+    record_run(db_path, "r2", [scenario("Fill", 1.0)])
+    connection = connect(db_path)
+    try:
+        assert connection.execute("SELECT COUNT(*) FROM results WHERE run_id = 'r2'").fetchone()[0] == 1
+        assert connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 2
+    finally:
+        connection.close()
+
+
+def test_duration_trend(db_path):
+    connection = connect(db_path)
+    try:
+        trend = duration_trend(connection)
+        assert [(row[0], row[3], row[4], row[5]) for row in trend] == [("r1", 3, 1.0, 2.0), ("r2", 3, 2.5, 4.0)]
+        steps = duration_trend(connection, scenario="Fill", step="open")
+        assert [(row[0], row[4]) for row in steps] == [("r1", 0.5), ("r2", 3.5)]
+        assert duration_trend(connection, browser="firefox") == []
+    finally:
+        connection.close()
+
+
+def test_default_run_id_separates_matrix_jobs(monkeypatch):
+    monkeypatch.setenv("GITHUB_RUN_ID", "42")
+    monkeypatch.setenv("GITHUB_RUN_ATTEMPT", "2")
+    monkeypatch.setenv("GITHUB_JOB", "test")
+    assert default_run_id("chromium") == "42-2-test-chromium"
+    assert default_run_id("chromium") != default_run_id("firefox")
@@ -0,0 +1,57 @@
+import pytest
+
+from utils.upload_cache import MAX_BUFFER_BYTES, UploadPayloadCache, parse_size
+
+
+@pytest.mark.parametrize('size, expected', [
+    (512, 512),
+    ('512', 512),
+    ('512B', 512),
+    ('64KB', 64 * 1024),
+    ('64k', 64 * 1024),
+    (' 5 MB ', 5 * 1024 ** 2),
+    ('1.5MB', int(1.5 * 1024 ** 2)),
+    ('1GB', 1024 ** 3)
+])
+def test_parse_size(size, expected):
+    assert parse_size(size) == expected
+
+
+@pytest.mark.parametrize('size', ['', 'MB', '-1KB', '5 TB', 'five'])
+def test_parse_size_rejects_invalid(size):
+    with pytest.raises(ValueError):
+        parse_size(size)
+
+
+@pytest.fixture
+def uploads(tmp_path):
+    (tmp_path / 'small.txt').write_bytes(b'small file')
+    (tmp_path / 'large.bin').write_bytes(b'x' * 100)
+    return UploadPayloadCache(str(tmp_path), max_in_memory_bytes=50)
+
+
+def test_small_files_are_cached_in_memory(uploads):
+    payload = uploads.payload('small.txt')
+    assert payload == {'name': 'small.txt', 'mimeType': 'text/plain', 'buffer': b'small file'}
+    assert uploads.payload('small.txt') is payload
+    assert uploads.stats() == {'entries': 1, 'hits': 1, 'misses': 1, 'bytes_in_memory': 10}
+
+
+def test_large_files_are_passed_by_path(uploads, tmp_path):
+    assert uploads.payload('large.bin') == str(tmp_path / 'large.bin')
+    # Playwright cannot mix paths and buffers in one call
+    assert uploads.payloads(['small.txt', 'large.bin']) == [str(tmp_path / 'small.txt'), str(tmp_path / 'large.bin')]
+
+
+def test_missing_file_raises(uploads):
+    with pytest.raises(OSError):
+        uploads.payload('missing.txt')
+
+
+def test_synthetic_payloads(uploads):
+    payload = uploads.synthetic('2KB')
+    assert payload['name'] == 'synthetic_2048.bin'
+    assert len(payload['buffer']) == 2048
+    assert uploads.synthetic('2KB') is payload
+    with pytest.raises(ValueError):
+        uploads.synthetic(MAX_BUFFER_BYTES + 1)
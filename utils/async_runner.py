@@ -0,0 +1,258 @@
+"""
+Asyncio runner that executes scenarios as concurrent tasks, each in its
+own BrowserContext of one shared browser, using the async page objects.
+
+Usage:
+    python -m utils.async_runner --concurrency 8 --tags @p1 -o reports/async_results.json
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+from behave.parser import parse_file
+from behave.tag_expression import TagExpression
+from playwright.async_api import async_playwright
+from config.config_loader import config_loader
+from config.logging_config import logger, configure_logging, set_log_context, set_log_step
+from features.async_steps import load_steps, find_step
+from features.environment import determine_headless_mode
+from utils.auth_state import LoginStateCache
+from utils.downloads import DownloadDirectories
+from utils.local_server import LocalAUTServer
+from utils.screenshots import screenshot_service
+from utils.timing import action_timer, timing_output_path
+from utils.upload_cache import upload_cache
+
+FEATURES_DIR = 'features'
+SUPPORTED_BROWSERS = ('chromium', 'firefox', 'webkit')
+
+
+def collect_features(features_dir: str = FEATURES_DIR, tags: list = None) -> list:
+    """
+    Parse feature files and return (feature, [scenarios]) pairs matching the tags
+    """
+    tag_expression = TagExpression(tags or [])
+    collected = []
+    for feature_path in sorted(glob.glob(os.path.join(features_dir, '**', '*.feature'), recursive=True)):
+        feature = parse_file(feature_path)
+        if feature is None:
+            continue
+        scenarios = [
+            scenario for scenario in feature.walk_scenarios()
+            if not tags or tag_expression.check(scenario.effective_tags)
+        ]
+        if scenarios:
+            collected.append((feature, scenarios))
+    return collected
+
+
+def _step_result(step, status: str, duration: float = 0.0, error_message: str = None) -> dict:
+    """
+    Build a behave JSON step entry
+    """
+    result = {'status': status, 'duration': duration}
+    if error_message:
+        result['error_message'] = error_message
+    return {
+        'keyword': step.keyword,
+        'step_type': step.step_type,
+        'name': step.name,
+        'location': str(step.location),
+        'result': result
+    }
+
+
+async def run_scenario(browser, scenario, semaphore, config: dict, download_dirs, login_state_cache=None) -> dict:
+    """
+    Run one scenario in its own context once a concurrency slot is free
+    """
+    async with semaphore:
+        action_timer.set_scenario(scenario.name)
+        # Each scenario task has its own copy of the log context
+        set_log_context(scenario.feature.name, scenario.name)
+        scenario_start = time.perf_counter()
+        browser_context = await browser.new_context(
+            accept_downloads=True,
+            viewport=config.get('viewport', {'width': 1920, 'height': 1080})
+        )
+        page = await browser_context.new_page()
+        downloads_dir = download_dirs.create(scenario.name)
+        context = SimpleNamespace(
+            page=page,
+            browser_context=browser_context,
+            config=config,
+            downloads_dir=downloads_dir,
+            login_state_cache=login_state_cache,
+            table=None,
+            text=None
+        )
+
+        steps = []
+        status = 'passed'
+        try:
+            for step in scenario.all_steps:
+                if status != 'passed':
+                    steps.append(_step_result(step, 'skipped'))
+                    continue
+
+                match = find_step(step.step_type, step.name)
+                if match is None:
+                    status = 'failed'
+                    steps.append(_step_result(step, 'undefined'))
+                    logger.error(f"Undefined async step: {step.keyword} {step.name}")
+                    continue
+
+                kwargs = {arg.name: arg.value for arg in match.arguments or [] if arg.name}
+                action_timer.set_step(f"{step.keyword} {step.name}")
+                set_log_step(f"{step.keyword} {step.name}")
+                context.table = step.table
+                context.text = step.text
+                start = time.perf_counter()
+                try:
+                    await match.func(context, **kwargs)
+                    steps.append(_step_result(step, 'passed', time.perf_counter() - start))
+                except Exception as e:
+                    status = 'failed'
+                    message = f"{type(e).__name__}: {str(e)}"
+                    steps.append(_step_result(step, 'failed', time.perf_counter() - start, message))
+                    logger.error(f"Scenario '{scenario.name}' failed at '{step.name}': {message}")
+        finally:
+            set_log_step(None)
+            if status == 'failed':
+                try:
+                    await screenshot_service.capture_async(page, f"failure_{scenario.name}")
+                except Exception as e:
+                    logger.error(f"Failed to capture screenshot of '{scenario.name}': {str(e)}")
+            await browser_context.close()
+            download_dirs.release(downloads_dir, status == 'failed')
+
+        duration_ms = round((time.perf_counter() - scenario_start) * 1000, 3)
+        logger.info(f"Scenario '{scenario.name}' {status}", extra={'duration_ms': duration_ms})
+        return {
+            'type': 'scenario',
+            'keyword': scenario.keyword,
+            'name': scenario.name,
+            'tags': list(scenario.tags),
+            'location': str(scenario.location),
+            'status': status,
+            'steps': steps
+        }
+
+
+async def run(concurrency: int, tags: list, output: str) -> int:
+    """
+    Run all matching scenarios concurrently and write a behave-style JSON report
+    """
+    load_steps()
+    config = config_loader.get()
+    collected = collect_features(tags=tags)
+    total = sum(len(scenarios) for _, scenarios in collected)
+    if not total:
+        logger.warning("No scenarios matched, nothing to run")
+        return 0
+
+    browser_name = os.getenv('BROWSER', 'chromium')
+    if browser_name not in SUPPORTED_BROWSERS:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+    headless = determine_headless_mode(SimpleNamespace(config=config))
+    action_timer.enabled = config.get('timing', {}).get('enabled', False)
+    configure_logging(config.get('logging', {}))
+
+    local_server = None
+    server_config = config.get('local_server', {})
+    if server_config.get('enabled', False):
+        local_server = LocalAUTServer(
+            server_config.get('root', os.path.join('test_data', 'aut')),
+            server_config.get('host', '127.0.0.1'),
+            server_config.get('port', 0)
+        )
+        local_server.start()
+        config_loader.override('base_url', local_server.base_url)
+
+    download_dirs = DownloadDirectories.from_config(
+        os.path.join(os.getcwd(), 'test_data', 'downloads', 'async'), config.get('downloads', {}), 'async'
+    )
+    upload_cache.configure(config.get('uploads', {}))
+    screenshot_service.configure(os.path.join(os.getcwd(), 'screenshots', 'async'), config.get('screenshots', {}))
+
+    # Scenarios of the run share logged-in storage state, as in the behave hooks
+    login_state_cache = None
+    login_cache_config = config.get('login_state_cache', {})
+    if login_cache_config.get('enabled', False):
+        login_state_cache = LoginStateCache.from_config(login_cache_config)
+
+    logger.info(f"Running {total} scenario(s) with concurrency {concurrency}")
+    start = time.perf_counter()
+    semaphore = asyncio.Semaphore(concurrency)
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch(headless=headless)
+        try:
+            results = await asyncio.gather(*[
+                asyncio.gather(*[
+                    run_scenario(browser, scenario, semaphore, config, download_dirs, login_state_cache)
+                    for scenario in scenarios
+                ])
+                for _, scenarios in collected
+            ])
+        finally:
+            await browser.close()
+            if local_server is not None:
+                local_server.stop()
+
+    report = []
+    failed = 0
+    for (feature, _), elements in zip(collected, results):
+        feature_failed = any(element['status'] != 'passed' for element in elements)
+        failed += sum(1 for element in elements if element['status'] != 'passed')
+        report.append({
+            'keyword': feature.keyword,
+            'name': feature.name,
+            'tags': list(feature.tags),
+            'location': str(feature.location),
+            'status': 'failed' if feature_failed else 'passed',
+            'elements': elements
+        })
+
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    download_dirs.close()
+    logger.info(f"Download directory stats: {download_dirs.stats()}")
+    if login_state_cache is not None:
+        logger.info(f"Login state cache stats: {login_state_cache.stats()}")
+    screenshot_service.flush()
+    logger.info(f"Screenshot stats: {screenshot_service.stats()}")
+    logger.info(f"Upload cache stats: {upload_cache.stats()}")
+
+    if action_timer.enabled and action_timer.actions:
+        timing_path = timing_output_path(config.get('timing', {}))
+        action_timer.write_json(timing_path)
+        logger.info(f"Page action timings (full data in {timing_path}):\n{action_timer.summary_table()}")
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"{total - failed} passed, {failed} failed in {elapsed:.2f}s "
+                f"({total / elapsed:.2f} scenarios/s), report at {output}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run behave scenarios concurrently on asyncio")
+    parser.add_argument('-c', '--concurrency', type=int, default=None,
+                        help="Maximum scenarios running at once (default: async_runner.concurrency in config)")
+    parser.add_argument('-t', '--tags', action='append', default=[],
+                        help="Tag expression to filter scenarios, may be repeated")
+    parser.add_argument('-o', '--output', default=os.path.join('reports', 'async_results.json'),
+                        help="Path of the JSON report")
+    args = parser.parse_args()
+
+    concurrency = args.concurrency or config_loader.get().get('async_runner', {}).get('concurrency', 4)
+    sys.exit(asyncio.run(run(max(1, concurrency), args.tags, args.output)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import time
+from config.logging_config import logger
+
+
+class LoginStateCache:
+    """
+    Caches the Playwright storage_state and post-login URL per credential set,
+    so a run only has to go through the login form once per user.
+    """
+
+    def __init__(self, ttl_seconds: int = 1800, verify_timeout: int = 5000):
+        self.ttl_seconds = ttl_seconds
+        # Milliseconds a restored state gets to show the post-login page before it is rejected
+        self.verify_timeout = verify_timeout
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, login_cache_config: dict):
+        """
+        Create the cache from the login_state_cache config section
+        """
+        return cls(login_cache_config.get('ttl_seconds', 1800), login_cache_config.get('verify_timeout', 5000))
+
+    @staticmethod
+    def _key(base_url: str, username: str, password: str) -> str:
+        """
+        Build a cache key without keeping the password in memory as plain text
+        """
+        digest = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        return f"{base_url}|{username}|{digest}"
+
+    def _is_expired(self, entry: dict) -> bool:
+        """
+        Check the entry against the TTL and the expiry of its cookies
+        """
+        now = time.time()
+        if now - entry['created'] > self.ttl_seconds:
+            return True
+        for cookie in entry['storage_state'].get('cookies', []):
+            expires = cookie.get('expires', -1)
+            if 0 < expires < now:
+                return True
+        return False
+
+    def get(self, base_url: str, username: str, password: str):
+        """
+        Get a fresh cached login state, or None if there is none
+        """
+        key = self._key(base_url, username, password)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_expired(entry):
+            logger.info(f"Cached login state for {username} expired")
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def save(self, base_url: str, username: str, password: str, storage_state: dict, url: str):
+        """
+        Store the login state captured right after a successful login
+        """
+        self._entries[self._key(base_url, username, password)] = {
+            'storage_state': storage_state,
+            'url': url,
+            'created': time.time()
+        }
+        logger.info(f"Cached login state for {username}")
+
+    def invalidate(self, base_url: str, username: str, password: str):
+        """
+        Drop the cached login state for a credential set
+        """
+        self._entries.pop(self._key(base_url, username, password), None)
+
+    def stats(self) -> dict:
+        """
+        Get hit/miss counters
+        """
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+def _local_storage_scripts(storage_state: dict):
+    """
+    Yield an init script per origin restoring its local storage before the page scripts run
+    """
+    for origin in storage_state.get('origins', []):
+        items = {item['name']: item['value'] for item in origin.get('localStorage', [])}
+        if items:
+            yield (
+                "(() => {"
+                f"if (window.location.origin !== {json.dumps(origin['origin'])}) return;"
+                f"const items = {json.dumps(items)};"
+                "for (const [name, value] of Object.entries(items)) window.localStorage.setItem(name, value);"
+                "})();"
+            )
+
+
+def apply_login_state(browser_context, page, entry: dict):
+    """
+    Load a cached storage state into an existing context and open the post-login page
+    """
+    storage_state = entry['storage_state']
+    if storage_state.get('cookies'):
+        browser_context.add_cookies(storage_state['cookies'])
+    for script in _local_storage_scripts(storage_state):
+        browser_context.add_init_script(script)
+    page.goto(entry['url'])
+
+
+async def apply_login_state_async(browser_context, page, entry: dict):
+    """
+    Load a cached storage state into an existing async context and open the post-login page
+    """
+    storage_state = entry['storage_state']
+    if storage_state.get('cookies'):
+        await browser_context.add_cookies(storage_state['cookies'])
+    for script in _local_storage_scripts(storage_state):
+        await browser_context.add_init_script(script)
+    await page.goto(entry['url'])
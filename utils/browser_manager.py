@@ -0,0 +1,106 @@
+from playwright.sync_api import sync_playwright, Error as PlaywrightError
+from config.logging_config import logger
+
+SUPPORTED_BROWSERS = ('chromium', 'firefox', 'webkit')
+
+
+class BrowserManager:
+    """
+    Owns the Playwright driver and a single browser process.
+    Scenarios get isolated BrowserContexts from new_context(); the browser
+    is relaunched transparently if it crashes or disconnects mid-run.
+    """
+
+    def __init__(self, browser_name: str, headless: bool, context_options: dict = None):
+        if browser_name not in SUPPORTED_BROWSERS:
+            raise ValueError(f"Unsupported browser: {browser_name}")
+        self.browser_name = browser_name
+        self.headless = headless
+        self.context_options = context_options or {}
+        self.playwright = None
+        self.browser = None
+        self.relaunch_count = 0
+        self._disconnected = False
+        # Set while stop() closes the browser, whose disconnected event is then expected
+        self._closing = False
+
+    def start(self):
+        """
+        Start the Playwright driver and launch the browser
+        """
+        self.playwright = sync_playwright().start()
+        self._launch()
+        logger.info(f"Browser {self.browser_name} launched in {'headless' if self.headless else 'headed'} mode")
+
+    def _launch(self):
+        """
+        Launch a new browser process and watch it for disconnects
+        """
+        browser_type = getattr(self.playwright, self.browser_name)
+        self.browser = browser_type.launch(headless=self.headless)
+        self._disconnected = False
+        self.browser.on("disconnected", self._on_disconnected)
+
+    def _on_disconnected(self, browser):
+        """
+        Record that the browser went away so the next context request relaunches it
+        """
+        if browser is self.browser:
+            self._disconnected = True
+            if self._closing:
+                return
+            logger.warning(f"Browser {self.browser_name} disconnected")
+
+    def is_alive(self) -> bool:
+        """
+        Check if the browser process is still connected
+        """
+        return (
+            self.browser is not None and
+            not self._disconnected and
+            self.browser.is_connected()
+        )
+
+    def ensure_browser(self):
+        """
+        Return a connected browser, relaunching it if it has crashed
+        """
+        if not self.is_alive():
+            logger.warning(f"Browser {self.browser_name} is not connected, relaunching")
+            self._launch()
+            self.relaunch_count += 1
+        return self.browser
+
+    def new_context(self, **overrides):
+        """
+        Create a new isolated BrowserContext using the configured options
+        """
+        options = dict(self.context_options)
+        options.update(overrides)
+        browser = self.ensure_browser()
+        try:
+            return browser.new_context(**options)
+        except PlaywrightError:
+            # The browser may have died between the liveness check and the call
+            if self.is_alive():
+                raise
+            return self.ensure_browser().new_context(**options)
+
+    def stop(self):
+        """
+        Close the browser and stop the Playwright driver
+        """
+        self._closing = True
+        try:
+            if self.browser is not None and self.browser.is_connected():
+                self.browser.close()
+        except PlaywrightError as e:
+            logger.warning(f"Error closing browser: {str(e)}")
+        finally:
+            self._closing = False
+            self.browser = None
+            if self.playwright is not None:
+                self.playwright.stop()
+                self.playwright = None
+        if self.relaunch_count:
+            logger.warning(f"Browser was relaunched {self.relaunch_count} time(s) during the run")
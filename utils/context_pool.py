@@ -0,0 +1,150 @@
+import time
+from collections import deque
+from playwright.sync_api import Error as PlaywrightError
+from config.logging_config import logger
+
+
+class ContextPool:
+    """
+    Keeps a number of ready-made BrowserContexts, each with an open page,
+    so a scenario can start without waiting for new_context()/new_page().
+
+    Playwright's sync API may only be driven from the thread that started it,
+    so creation and disposal happen in replenish(), which the environment
+    hooks call between scenarios rather than while a scenario is running.
+    That still runs on the test thread: in a sequential run the cost moves from
+    before_scenario to after_scenario, it is not removed, and a size above 1 only
+    keeps idle contexts open. stats() reports the replenish time next to the
+    acquire waits so the pool's real effect on wall time is visible.
+    """
+
+    def __init__(self, browser_manager, size: int = 1, prepare_context=None):
+        self.browser_manager = browser_manager
+        self.size = max(1, int(size))
+        # Called with each new context, e.g. to start tracing while pre-warming
+        self.prepare_context = prepare_context
+        self._ready = deque()
+        self._retired = deque()
+        self._generation = browser_manager.relaunch_count
+        self.hits = 0
+        self.misses = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.replenishes = 0
+        self.total_replenish_ms = 0.0
+        self.max_replenish_ms = 0.0
+
+    def _create(self):
+        """
+        Create one context/page pair
+        """
+        browser_context = self.browser_manager.new_context()
+        if self.prepare_context is not None:
+            self.prepare_context(browser_context)
+        page = browser_context.new_page()
+        return browser_context, page
+
+    def _discard_stale(self):
+        """
+        Drop pooled contexts that belong to a browser which has since been relaunched
+        """
+        self.browser_manager.ensure_browser()
+        if self._generation != self.browser_manager.relaunch_count:
+            logger.warning(f"Discarding {len(self._ready)} pooled context(s) from a crashed browser")
+            self._ready.clear()
+            self._retired.clear()
+            self._generation = self.browser_manager.relaunch_count
+
+    def acquire(self):
+        """
+        Hand out a ready context/page pair, creating one on a pool miss
+        """
+        start = time.perf_counter()
+        self._discard_stale()
+
+        entry = None
+        while self._ready:
+            browser_context, page = self._ready.popleft()
+            if not page.is_closed():
+                entry = (browser_context, page)
+                break
+            self._retired.append(browser_context)
+
+        if entry is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry = self._create()
+
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        return entry
+
+    def release(self, browser_context):
+        """
+        Queue a used context for disposal on the next replenish()
+        """
+        self._retired.append(browser_context)
+
+    def replenish(self):
+        """
+        Dispose retired contexts and top the pool back up to its size
+        """
+        start = time.perf_counter()
+        try:
+            self._refill()
+        finally:
+            replenish_ms = (time.perf_counter() - start) * 1000
+            self.replenishes += 1
+            self.total_replenish_ms += replenish_ms
+            self.max_replenish_ms = max(self.max_replenish_ms, replenish_ms)
+
+    def _refill(self):
+        """
+        Close retired contexts and create new ones until the pool is full
+        """
+        self._discard_stale()
+        while self._retired:
+            browser_context = self._retired.popleft()
+            try:
+                browser_context.close()
+            except PlaywrightError as e:
+                logger.warning(f"Error closing pooled context: {str(e)}")
+        while len(self._ready) < self.size:
+            self._ready.append(self._create())
+
+    def close(self):
+        """
+        Close every pooled and retired context
+        """
+        while self._ready:
+            self._retired.append(self._ready.popleft()[0])
+        if self.browser_manager.is_alive():
+            while self._retired:
+                try:
+                    self._retired.popleft().close()
+                except PlaywrightError as e:
+                    logger.warning(f"Error closing pooled context: {str(e)}")
+        self._retired.clear()
+
+    def stats(self) -> dict:
+        """
+        Get hit/miss and wait-time counters for sizing the pool. critical_path_ms adds the
+        acquire waits and the replenish time, both spent on the test thread.
+        """
+        acquisitions = self.hits + self.misses
+        return {
+            'size': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / acquisitions if acquisitions else 0.0,
+            'total_wait_ms': round(self.total_wait_ms, 3),
+            'avg_wait_ms': round(self.total_wait_ms / acquisitions, 3) if acquisitions else 0.0,
+            'max_wait_ms': round(self.max_wait_ms, 3),
+            'replenishes': self.replenishes,
+            'total_replenish_ms': round(self.total_replenish_ms, 3),
+            'avg_replenish_ms': round(self.total_replenish_ms / self.replenishes, 3) if self.replenishes else 0.0,
+            'max_replenish_ms': round(self.max_replenish_ms, 3),
+            'critical_path_ms': round(self.total_wait_ms + self.total_replenish_ms, 3)
+        }
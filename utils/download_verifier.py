@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+from config.logging_config import logger
+
+# Expected size and SHA-256 of downloadable files, per environment and file name,
+# resolved from the project root rather than the working directory
+CHECKSUMS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test_data', 'download_checksums.json'
+)
+
+# Read size when streaming a downloaded file through the hash
+CHUNK_SIZE = 1024 * 1024
+
+_expected_checksums = {}
+
+
+def hash_file(path: str, chunk_size: int = CHUNK_SIZE) -> tuple:
+    """
+    Stream a file through SHA-256 in fixed-size chunks, returning (hex digest, size in bytes)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def download_stats(path: str, started: float, first_byte: float, completed: float) -> dict:
+    """
+    Hash a saved download and compute its time-to-first-byte and throughput.
+    Times are perf_counter() values of the click, the download event and the completed save.
+    """
+    sha256, size = hash_file(path)
+    duration = completed - first_byte
+    return {
+        'path': path,
+        'file_name': os.path.basename(path),
+        'size': size,
+        'sha256': sha256,
+        'ttfb_ms': round((first_byte - started) * 1000, 3),
+        'duration_ms': round(duration * 1000, 3),
+        'throughput_bps': round(size / duration, 1) if duration > 0 else None
+    }
+
+
+def expected_checksums(env: str = None, path: str = CHECKSUMS_PATH) -> dict:
+    """
+    Get the expected checksums of an environment (default: ENV), read once per process
+    """
+    env = env or os.getenv('ENV', 'dev')
+    if path not in _expected_checksums:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                _expected_checksums[path] = json.load(f)
+        except FileNotFoundError:
+            logger.warning(f"No download checksums file at {path}")
+            _expected_checksums[path] = {}
+    return _expected_checksums[path].get(env, {})
+
+
+def verify_download(stats: dict, expected: dict, env: str = None, strict: bool = False) -> None:
+    """
+    Check a download's size and SHA-256 against the expected entry of its file name.
+    A file without an entry in the environment's checksums is only checked for being
+    non-empty, or fails the check when strict.
+    """
+    logger.info(
+        f"Download {stats['file_name']}: {stats['size']} bytes, ttfb {stats['ttfb_ms']} ms, "
+        f"{stats['duration_ms']} ms, {stats['throughput_bps']} bytes/s"
+    )
+    if stats['size'] == 0:
+        raise AssertionError(f"Downloaded file is empty: {stats['path']}")
+
+    entry = expected.get(stats['file_name'])
+    if entry is None:
+        env = env or os.getenv('ENV', 'dev')
+        message = (
+            f"No expected checksum for {stats['file_name']} in environment {env}. If this download is correct, "
+            f"add it to {CHECKSUMS_PATH} under \"{env}\": "
+            f"{json.dumps({stats['file_name']: {'size': stats['size'], 'sha256': stats['sha256']}})}"
+        )
+        if strict:
+            logger.error(message)
+            raise AssertionError(message)
+        logger.warning(f"{message}. Only checked that it is not empty")
+        return
+    if 'size' in entry and stats['size'] != entry['size']:
+        raise AssertionError(
+            f"Downloaded file {stats['file_name']} has {stats['size']} bytes, expected {entry['size']}"
+        )
+    if 'sha256' in entry and stats['sha256'] != entry['sha256'].lower():
+        raise AssertionError(
+            f"Downloaded file {stats['file_name']} has SHA-256 {stats['sha256']}, expected {entry['sha256']}"
+        )
@@ -0,0 +1,134 @@
+import os
+import queue
+import re
+import shutil
+import tempfile
+import threading
+from config.logging_config import logger
+
+# Characters not kept in download directory names
+UNSAFE_NAME_PATTERN = re.compile(r'[^\w.-]+')
+
+# Where the downloads of failed scenarios are kept, next to the traces and reports of the run
+DEFAULT_FAILED_ROOT = os.path.join('reports', 'downloads')
+
+
+class DownloadReaper:
+    """
+    Background thread deleting download directories once their scenario is done,
+    so scenario teardown does not wait on file system cleanup
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.removed = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        """
+        Start the reaper thread on first use
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='download-reaper', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            path = self._queue.get()
+            try:
+                shutil.rmtree(path)
+                self.removed += 1
+                logger.debug(f"Removed download directory: {path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.failed += 1
+                logger.error(f"Error removing download directory {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def schedule(self, path: str):
+        """
+        Queue a directory for removal
+        """
+        self._ensure_started()
+        self._queue.put(path)
+
+    def drain(self):
+        """
+        Wait until every queued directory has been removed
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+
+class DownloadDirectories:
+    """
+    Hands every scenario its own temporary downloads directory under a
+    per-worker root, so concurrent scenarios never share files. Directories
+    are removed in the background once the scenario is done; those of failed
+    scenarios can be kept for inspection, moved out of the scratch root into
+    failed_root with the other run reports.
+    """
+
+    def __init__(self, root: str, keep_failed: bool = True, failed_root: str = DEFAULT_FAILED_ROOT):
+        self.root = root
+        self.keep_failed = keep_failed
+        self.failed_root = failed_root
+        self.retained = []
+        self._reaper = DownloadReaper()
+        os.makedirs(root, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, root: str, downloads_config: dict, worker_dir: str = None):
+        """
+        Create the directories manager from the downloads config section,
+        keeping failed downloads under worker_dir of failed_directory when given
+        """
+        failed_root = downloads_config.get('failed_directory', DEFAULT_FAILED_ROOT)
+        if worker_dir:
+            failed_root = os.path.join(failed_root, worker_dir)
+        return cls(root, keep_failed=downloads_config.get('keep_failed', True), failed_root=failed_root)
+
+    def create(self, scenario_name: str) -> str:
+        """
+        Create a fresh downloads directory for a scenario
+        """
+        prefix = f"{UNSAFE_NAME_PATTERN.sub('_', scenario_name).strip('_')[:60]}_"
+        return tempfile.mkdtemp(prefix=prefix, dir=self.root)
+
+    def release(self, path: str, failed: bool = False):
+        """
+        Hand a scenario's directory to the reaper, or keep it if the scenario failed and retention is on
+        """
+        if failed and self.keep_failed:
+            kept_path = os.path.join(self.failed_root, os.path.basename(path))
+            try:
+                os.makedirs(self.failed_root, exist_ok=True)
+                shutil.move(path, kept_path)
+            except OSError as e:
+                logger.error(f"Error moving downloads of failed scenario to {kept_path}: {e}")
+                kept_path = path
+            self.retained.append(kept_path)
+            logger.info(f"Kept downloads of failed scenario at: {kept_path}")
+            return
+        self._reaper.schedule(path)
+
+    def close(self):
+        """
+        Wait for pending removals to finish
+        """
+        self._reaper.drain()
+
+    def stats(self) -> dict:
+        """
+        Get removal and retention counters
+        """
+        return {
+            'removed': self._reaper.removed,
+            'failed_removals': self._reaper.failed,
+            'retained': len(self.retained)
+        }
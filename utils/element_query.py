@@ -0,0 +1,201 @@
+import re
+
+# Trailing Playwright text pseudo-class on a CSS selector, e.g. button:has-text('Log in')
+TEXT_PSEUDO_PATTERN = re.compile(r"^(?P<css>.*?):(?P<kind>has-text|text)\((?P<quote>['\"])(?P<text>.*)(?P=quote)\)$")
+
+# Shared in-page helpers resolving queries built by to_query. Matching follows
+# Playwright: text is whitespace-normalised, unquoted text and the pseudo-classes
+# match a case-insensitive substring, text="..." matches exactly, and text
+# selectors resolve to the smallest element containing the text.
+_RESOLVER_JS = """
+    const SKIPPED_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'HEAD', 'TEMPLATE']);
+    const normalize = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+    const elementText = (el) => {
+        if (el.tagName === 'INPUT' && (el.type === 'submit' || el.type === 'button')) {
+            return normalize(el.value);
+        }
+        return normalize(el.textContent);
+    };
+    const matchesText = (el, query) => {
+        const text = elementText(el);
+        return query.exact ? text === query.text : text.toLowerCase().includes(query.text.toLowerCase());
+    };
+    const smallestMatch = (candidates, query) => candidates.find((el) =>
+        !SKIPPED_TAGS.has(el.tagName) &&
+        matchesText(el, query) &&
+        ![...el.children].some((child) => matchesText(child, query))
+    );
+    const resolve = (query) => {
+        switch (query.kind) {
+            case 'css':
+                return document.querySelector(query.css);
+            case 'text':
+                return smallestMatch([...document.querySelectorAll(query.css || 'body *')], query) || null;
+            case 'has-text':
+                return [...document.querySelectorAll(query.css)].find((el) => matchesText(el, query)) || null;
+        }
+        return undefined;
+    };
+    const controlOf = (el) => el.tagName === 'LABEL' && el.control ? el.control : el;
+    const state = (el) => {
+        if (!el) {
+            return {found: false, visible: false, text: null, value: null, checked: null,
+                    valid: null, validation_message: null};
+        }
+        const style = window.getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        const control = controlOf(el);
+        let checked = null;
+        if (control.tagName === 'INPUT' && (control.type === 'checkbox' || control.type === 'radio')) {
+            checked = control.checked;
+        } else if (control.hasAttribute('aria-checked')) {
+            checked = control.getAttribute('aria-checked') === 'true';
+        }
+        let value = null;
+        if (control.tagName === 'SELECT' && control.multiple) {
+            value = [...control.selectedOptions].map((option) => option.value);
+        } else if (['INPUT', 'TEXTAREA', 'SELECT'].includes(control.tagName)) {
+            value = control.value;
+        }
+        const hasValidity = control.validity !== undefined && control.willValidate !== undefined;
+        return {
+            found: true,
+            visible: rect.width > 0 && rect.height > 0 && style.visibility === 'visible',
+            text: el.textContent,
+            value: value,
+            checked: checked,
+            valid: hasValidity ? control.validity.valid && control.getAttribute('aria-invalid') !== 'true' : null,
+            validation_message: hasValidity ? control.validationMessage : null
+        };
+    };
+"""
+
+# Resolves every query in the page and reads its state in a single evaluation
+ELEMENT_STATE_SCRIPT = """
+(queries) => {
+""" + _RESOLVER_JS + """
+    return queries.map((query) => {
+        try {
+            const el = resolve(query);
+            return el === undefined ? null : state(el);
+        } catch (e) {
+            // Invalid CSS for the browser, let the caller query it through Playwright
+            return null;
+        }
+    });
+}
+"""
+
+# Applies a form-fill plan in a single evaluation, firing the input/change events
+# Playwright's fill/check/select_option would, and returns the state of every field.
+# Fields it cannot set like Playwright would (file inputs, missing or read-only
+# elements, values an input rejects) are reported back for the caller to handle.
+FILL_FORM_SCRIPT = """
+(fields) => {
+""" + _RESOLVER_JS + """
+    const fire = (el, type) => el.dispatchEvent(new Event(type, {bubbles: true}));
+    const setNativeValue = (el, value) => {
+        const prototype = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(prototype, 'value').set.call(el, value);
+    };
+    const fill = (el, value) => {
+        const control = controlOf(el);
+        if (control.disabled || control.readOnly) {
+            return 'unsupported';
+        }
+        if (control.tagName === 'INPUT' && control.type === 'file') {
+            return 'file';
+        }
+        if (control.tagName === 'INPUT' && (control.type === 'checkbox' || control.type === 'radio')) {
+            if (control.checked !== Boolean(value)) {
+                control.click();
+            }
+            return control.checked === Boolean(value) ? 'filled' : 'unsupported';
+        }
+        if (control.tagName === 'SELECT') {
+            const wanted = (Array.isArray(value) ? value : [value]).map(String);
+            const options = [...control.options];
+            const matches = (option) => wanted.includes(option.value) || wanted.includes(normalize(option.label));
+            if ((!control.multiple && wanted.length > 1) ||
+                !wanted.every((w) => options.some((option) => option.value === w || normalize(option.label) === w))) {
+                return 'unsupported';
+            }
+            control.focus();
+            options.forEach((option) => { option.selected = matches(option); });
+            fire(control, 'input');
+            fire(control, 'change');
+            return 'filled';
+        }
+        if (control.tagName === 'TEXTAREA' || control.tagName === 'INPUT') {
+            control.focus();
+            setNativeValue(control, String(value));
+            if (control.value !== String(value)) {
+                return 'unsupported';
+            }
+            fire(control, 'input');
+            fire(control, 'change');
+            return 'filled';
+        }
+        if (control.isContentEditable) {
+            control.focus();
+            control.textContent = String(value);
+            fire(control, 'input');
+            return 'filled';
+        }
+        return 'unsupported';
+    };
+    const elements = fields.map((field) => {
+        try {
+            return resolve(field.query);
+        } catch (e) {
+            return undefined;
+        }
+    });
+    const statuses = fields.map((field, index) => {
+        const el = elements[index];
+        if (el === undefined) {
+            return 'unsupported';
+        }
+        return el === null ? 'missing' : fill(el, field.value);
+    });
+    return statuses.map((status, index) => ({status: status, state: elements[index] ? state(elements[index]) : null}));
+}
+"""
+
+
+def to_query(selector: str):
+    """
+    Translate a Playwright selector into a query for ELEMENT_STATE_SCRIPT, or None if unsupported
+    """
+    selector = selector.strip()
+    if '>>' in selector or selector.startswith(('xpath=', '//', '..', 'id=', 'data-testid=', 'internal:', 'role=')):
+        return None
+
+    if selector.startswith('text='):
+        text = selector[len('text='):].strip()
+        if text.startswith('/'):
+            return None
+        if len(text) > 1 and text[0] == text[-1] and text[0] in '"\'':
+            return {'kind': 'text', 'css': None, 'text': ' '.join(text[1:-1].split()), 'exact': True}
+        return {'kind': 'text', 'css': None, 'text': ' '.join(text.split()), 'exact': False}
+
+    if selector.startswith('css='):
+        selector = selector[len('css='):]
+    elif re.match(r'^[a-z-]+=', selector):
+        return None
+
+    match = TEXT_PSEUDO_PATTERN.match(selector)
+    if match:
+        css = match.group('css').strip() or '*'
+        if ':has-text(' in css or ':text(' in css:
+            return None
+        return {
+            'kind': match.group('kind'),
+            'css': css,
+            'text': ' '.join(match.group('text').split()),
+            'exact': False
+        }
+
+    if ':has-text(' in selector or ':text' in selector or ':visible' in selector or ':nth-match(' in selector:
+        return None
+    return {'kind': 'css', 'css': selector, 'text': None, 'exact': False}
@@ -0,0 +1,57 @@
+import os
+import re
+from config.logging_config import logger
+
+HAR_MODES = ('off', 'record', 'replay')
+
+
+def _slugify(name: str) -> str:
+    """
+    Turn a feature or scenario name into a safe file name
+    """
+    return re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_').lower() or 'unnamed'
+
+
+def har_path(directory: str, env: str, scenario) -> str:
+    """
+    Get the HAR file used to record or replay a scenario
+    """
+    return os.path.join(
+        directory,
+        env,
+        _slugify(scenario.feature.name),
+        f"{_slugify(scenario.name)}.har"
+    )
+
+
+def apply_har(browser_context, mode: str, path: str, not_found: str = 'abort', url_filter: str = None):
+    """
+    Record the context's traffic into a HAR file, or serve it back from one
+
+    In record mode Playwright writes the HAR when the context is closed.
+    In replay mode requests missing from the HAR are aborted when
+    not_found is 'abort', or sent to the network when it is 'fallback'.
+    """
+    if mode == 'off':
+        return
+
+    if mode == 'record':
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        browser_context.route_from_har(
+            path,
+            url=url_filter,
+            update=True,
+            update_content='embed',
+            update_mode='full'
+        )
+        logger.info(f"Recording traffic to HAR: {path}")
+    elif mode == 'replay':
+        if not os.path.exists(path):
+            if not_found == 'abort':
+                raise FileNotFoundError(f"No recorded HAR for scenario at {path}, run with HAR_MODE=record first")
+            logger.warning(f"No recorded HAR at {path}, using the network")
+            return
+        browser_context.route_from_har(path, url=url_filter, not_found=not_found)
+        logger.info(f"Replaying traffic from HAR: {path}")
+    else:
+        raise ValueError(f"Unsupported HAR mode: {mode}")
@@ -0,0 +1,100 @@
+import mimetypes
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.logging_config import logger
+
+
+class LocalAUTServer:
+    """
+    Serves a local stand-in of the Application Under Test from memory.
+    Every file under root is read once at start so requests never touch disk.
+    """
+
+    def __init__(self, root: str, host: str = '127.0.0.1', port: int = 0):
+        self.root = root
+        self.host = host
+        self.port = port
+        self._files = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Get the URL the server is reachable on
+        """
+        return f"http://{self.host}:{self.port}"
+
+    def _load_files(self):
+        """
+        Read all files under root into memory keyed by URL path
+        """
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                file_path = os.path.join(directory, filename)
+                url_path = '/' + os.path.relpath(file_path, self.root).replace(os.sep, '/')
+                content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                if content_type.startswith('text/') or content_type == 'application/javascript':
+                    content_type += '; charset=utf-8'
+                with open(file_path, 'rb') as f:
+                    self._files[url_path] = (f.read(), content_type)
+        self._files['/'] = self._files.get('/index.html', (b'', 'text/html; charset=utf-8'))
+
+    def _make_handler(self):
+        """
+        Build a request handler class bound to the in-memory files
+        """
+        files = self._files
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections alive so the browser can reuse them
+            protocol_version = 'HTTP/1.1'
+
+            def _send(self, include_body: bool):
+                path = self.path.split('?', 1)[0].split('#', 1)[0]
+                entry = files.get(path)
+                if entry is None:
+                    self.send_error(404)
+                    return
+                body, content_type = entry
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if include_body:
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                self._send(include_body=True)
+
+            def do_HEAD(self):
+                self._send(include_body=False)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Local AUT: {format % args}")
+
+        return Handler
+
+    def start(self):
+        """
+        Load the pages and start serving them on a background thread
+        """
+        self._load_files()
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Local AUT server serving {len(self._files) - 1} file(s) from {self.root} at {self.base_url}")
+
+    def stop(self):
+        """
+        Stop serving and release the port
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            logger.info("Local AUT server stopped")
@@ -0,0 +1,103 @@
+import weakref
+
+# Selector constants of each page object class, collected once per class
+_class_selectors = {}
+
+# One registry per Playwright page, dropped when the page is garbage collected
+_registries = weakref.WeakKeyDictionary()
+
+
+def selectors_of(page_class) -> dict:
+    """
+    Get the UPPER_CASE selector constants of a page object class and its bases.
+    String constants map to their selector, dict constants (e.g. PIZZA_SIZE_MAP)
+    to their name -> selector mapping.
+    """
+    selectors = _class_selectors.get(page_class)
+    if selectors is None:
+        selectors = {}
+        for klass in reversed(page_class.__mro__):
+            for name, value in vars(klass).items():
+                if not name.isupper() or name.startswith('_'):
+                    continue
+                if isinstance(value, str):
+                    selectors[name] = value
+                elif isinstance(value, dict) and value and all(isinstance(v, str) for v in value.values()):
+                    selectors[name] = dict(value)
+        _class_selectors[page_class] = selectors
+    return selectors
+
+
+class LocatorRegistry:
+    """
+    Caches Playwright Locator objects per page, so page objects built for every
+    step share the locators of their selectors instead of re-creating them.
+    Locators keep the first-match behaviour of page.click(selector).
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self._locators = {}
+
+    @classmethod
+    def for_page(cls, page):
+        """
+        Get the registry of a page, creating it on first use
+        """
+        registry = _registries.get(page)
+        if registry is None:
+            registry = cls(page)
+            _registries[page] = registry
+        return registry
+
+    def locator(self, selector: str):
+        """
+        Get the cached locator of a selector
+        """
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self.page.locator(selector).first
+            self._locators[selector] = locator
+        return locator
+
+    def selector(self, page_class, name: str, key: str = None) -> str:
+        """
+        Get a registered selector by constant name, or by map name and key
+        """
+        selectors = selectors_of(page_class)
+        if name not in selectors:
+            raise KeyError(f"{page_class.__name__} has no locator named {name}")
+        value = selectors[name]
+        if isinstance(value, dict):
+            if key is None:
+                raise KeyError(f"{page_class.__name__}.{name} is a locator map, a key is required")
+            if key not in value:
+                raise KeyError(f"{page_class.__name__}.{name} has no entry {key!r}, expected one of {list(value)}")
+            return value[key]
+        return value
+
+    def named(self, page_class, name: str, key: str = None):
+        """
+        Get the cached locator of a registered selector constant or map entry
+        """
+        return self.locator(self.selector(page_class, name, key))
+
+    def expand(self, page_class, names) -> dict:
+        """
+        Expand constant names into label -> selector, maps giving one entry per key
+        """
+        selectors = selectors_of(page_class)
+        expanded = {}
+        for name in names:
+            value = selectors.get(name)
+            if value is None:
+                raise KeyError(f"{page_class.__name__} has no locator named {name}")
+            if isinstance(value, dict):
+                for key, selector in value.items():
+                    expanded[f"{name}[{key}]"] = selector
+            else:
+                expanded[name] = value
+        return expanded
+
+    def __len__(self):
+        return len(self._locators)
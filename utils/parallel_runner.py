@@ -0,0 +1,194 @@
+"""
+Parallel runner that splits the scenarios under features/ across
+several behave worker processes and merges their JSON results.
+
+Usage:
+    python -m utils.parallel_runner --workers 4 --tags @smoke -o reports/parallel_results.json
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from behave.parser import parse_file
+from behave.tag_expression import TagExpression
+from config.logging_config import logger, RUN_ID
+
+FEATURES_DIR = 'features'
+WORKER_REPORTS_DIR = os.path.join('reports', 'parallel')
+NOT_RUN_STATUSES = ('skipped', 'untested')
+
+
+def collect_scenarios(features_dir: str = FEATURES_DIR, tags: list = None) -> list:
+    """
+    Collect (location, estimated cost) pairs for every scenario matching the tags
+    """
+    tag_expression = TagExpression(tags or [])
+    scenarios = []
+    for feature_path in sorted(glob.glob(os.path.join(features_dir, '**', '*.feature'), recursive=True)):
+        feature = parse_file(feature_path)
+        if feature is None:
+            continue
+        background_steps = len(feature.background.steps) if feature.background else 0
+        for scenario in feature.scenarios:
+            if tags and not tag_expression.check(scenario.effective_tags):
+                continue
+            # Step count is a cheap, stable proxy for scenario duration
+            if hasattr(scenario, 'scenarios'):
+                cost = sum(len(s.steps) + background_steps for s in scenario.scenarios)
+            else:
+                cost = len(scenario.steps) + background_steps
+            scenarios.append((f"{feature_path}:{scenario.line}", max(cost, 1)))
+    return scenarios
+
+
+def partition(scenarios: list, workers: int) -> list:
+    """
+    Split scenarios into balanced buckets, longest first onto the least loaded worker
+    """
+    buckets = [{'cost': 0, 'locations': []} for _ in range(workers)]
+    for location, cost in sorted(scenarios, key=lambda item: item[1], reverse=True):
+        bucket = min(buckets, key=lambda b: b['cost'])
+        bucket['locations'].append(location)
+        bucket['cost'] += cost
+    return [bucket['locations'] for bucket in buckets if bucket['locations']]
+
+
+def _stream_output(worker_id: int, stream):
+    """
+    Forward a worker's output line by line, prefixed with its id
+    """
+    for line in iter(stream.readline, ''):
+        sys.stdout.write(f"[worker {worker_id}] {line}")
+        sys.stdout.flush()
+    stream.close()
+
+
+def start_worker(worker_id: int, locations: list, tags: list, extra_args: list):
+    """
+    Launch one behave process for a bucket of scenario locations
+    """
+    report_path = os.path.join(WORKER_REPORTS_DIR, f'worker_{worker_id}_results.json')
+    junit_dir = os.path.join(WORKER_REPORTS_DIR, f'worker_{worker_id}_junit')
+    command = [
+        sys.executable, '-m', 'behave',
+        '--format=json', f'--outfile={report_path}',
+        '--format=progress',
+        f'--junit-directory={junit_dir}',
+    ]
+    for tag in tags or []:
+        command.append(f'--tags={tag}')
+    command.extend(extra_args)
+    command.extend(locations)
+
+    # Workers share the run id, so their per-worker log files can be correlated
+    env = dict(os.environ, WORKER_ID=str(worker_id), RUN_ID=RUN_ID)
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        env=env
+    )
+    reader = threading.Thread(target=_stream_output, args=(worker_id, process.stdout), daemon=True)
+    reader.start()
+    return process, reader, report_path
+
+
+def merge_reports(report_paths: list) -> list:
+    """
+    Merge behave JSON reports into one behave-compatible list of features
+    """
+    features = {}
+    for report_path in report_paths:
+        try:
+            with open(report_path, 'r', encoding='utf-8') as f:
+                content = f.read().strip()
+        except OSError as e:
+            logger.error(f"Missing worker report {report_path}: {str(e)}")
+            continue
+        if not content:
+            continue
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in worker report {report_path}: {str(e)}")
+            continue
+
+        for feature in data:
+            key = feature.get('location', '').split(':')[0] or feature.get('name')
+            if key not in features:
+                features[key] = dict(feature, elements={})
+            # Workers see whole feature files, so keep the executed copy of each element
+            elements = features[key]['elements']
+            for element in feature.get('elements', []):
+                location = element.get('location', element.get('name'))
+                current = elements.get(location)
+                if current is None or (current.get('status') in NOT_RUN_STATUSES and
+                                       element.get('status') not in NOT_RUN_STATUSES):
+                    elements[location] = element
+
+    def _line(element):
+        try:
+            return int(element.get('location', '').rsplit(':', 1)[1])
+        except (IndexError, ValueError):
+            return 0
+
+    merged = []
+    for key in sorted(features):
+        feature = features[key]
+        feature['elements'] = sorted(feature['elements'].values(), key=_line)
+        merged.append(feature)
+    return merged
+
+
+def run(workers: int, tags: list, output: str, extra_args: list = None) -> int:
+    """
+    Run the matching scenarios across worker processes and write the merged report
+    """
+    scenarios = collect_scenarios(tags=tags)
+    if not scenarios:
+        logger.warning("No scenarios matched, nothing to run")
+        return 0
+
+    buckets = partition(scenarios, min(workers, len(scenarios)))
+    os.makedirs(WORKER_REPORTS_DIR, exist_ok=True)
+    logger.info(f"Running {len(scenarios)} scenario(s) across {len(buckets)} worker(s)")
+
+    start = time.perf_counter()
+    running = [start_worker(i, locations, tags, extra_args or []) for i, locations in enumerate(buckets)]
+
+    exit_code = 0
+    report_paths = []
+    for process, reader, report_path in running:
+        if process.wait() != 0:
+            exit_code = 1
+        reader.join()
+        report_paths.append(report_path)
+
+    merged = merge_reports(report_paths)
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, indent=2)
+
+    logger.info(f"Parallel run finished in {time.perf_counter() - start:.2f}s, merged report at {output}")
+    return exit_code
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run behave scenarios across parallel worker processes")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: number of CPU cores)")
+    parser.add_argument('-t', '--tags', action='append', default=[],
+                        help="Tag expression passed to behave, may be repeated")
+    parser.add_argument('-o', '--output', default=os.path.join('reports', 'parallel_results.json'),
+                        help="Path of the merged JSON report")
+    args, extra_args = parser.parse_known_args()
+    sys.exit(run(max(1, args.workers), args.tags, args.output, extra_args))
+
+
+if __name__ == '__main__':
+    main()
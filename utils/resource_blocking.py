@@ -0,0 +1,80 @@
+from collections import Counter
+from fnmatch import fnmatchcase
+
+
+class ResourceBlocker:
+    """
+    Aborts requests the scenarios never need (images, fonts, analytics, ...)
+    through context.route and counts what was blocked and what was loaded.
+
+    Requests matching an allow pattern are never blocked. Patterns are
+    fnmatch-style globs matched against the full request URL.
+    """
+
+    def __init__(self, block_resource_types: list = None, block_url_patterns: list = None,
+                 allow_url_patterns: list = None):
+        self.block_resource_types = set(block_resource_types or [])
+        self.block_url_patterns = list(block_url_patterns or [])
+        self.allow_url_patterns = list(allow_url_patterns or [])
+        self.blocked = Counter()
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """
+        Create a blocker from the resource_blocking config section
+        """
+        return cls(
+            config.get('block_resource_types'),
+            config.get('block_url_patterns'),
+            config.get('allow_url_patterns')
+        )
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """
+        Decide whether a request is blocked
+        """
+        if any(fnmatchcase(url, pattern) for pattern in self.allow_url_patterns):
+            return False
+        if resource_type in self.block_resource_types:
+            return True
+        return any(fnmatchcase(url, pattern) for pattern in self.block_url_patterns)
+
+    def attach(self, browser_context):
+        """
+        Route every request of the context through the blocker
+        """
+        browser_context.route("**/*", self._handle_route)
+        browser_context.on("response", self._on_response)
+
+    def _handle_route(self, route):
+        """
+        Abort blocked requests and pass the rest on to other handlers or the network
+        """
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.blocked[request.resource_type] += 1
+            route.abort('blockedbyclient')
+        else:
+            route.fallback()
+
+    def _on_response(self, response):
+        """
+        Count loaded requests and their declared body size
+        """
+        self.allowed_requests += 1
+        content_length = response.headers.get('content-length')
+        if content_length and content_length.isdigit():
+            self.allowed_bytes += int(content_length)
+
+    def stats(self) -> dict:
+        """
+        Get blocked and loaded request counters
+        """
+        return {
+            'blocked_requests': sum(self.blocked.values()),
+            'blocked_by_type': dict(self.blocked),
+            'allowed_requests': self.allowed_requests,
+            'allowed_bytes': self.allowed_bytes
+        }
@@ -0,0 +1,151 @@
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import perf_counter
+from config.logging_config import logger
+
+SCREENSHOT_FORMATS = {'png': 'png', 'jpeg': 'jpg'}
+
+# Characters not kept in screenshot file names
+UNSAFE_NAME_PATTERN = re.compile(r'[^\w.-]+')
+
+
+class ScreenshotService:
+    """
+    Takes screenshots off the critical path: the raw bytes are captured on the
+    calling thread, while hashing, de-duplication and writing to disk happen on
+    a background thread. Identical images are written only once.
+    """
+
+    def __init__(self):
+        self.directory = os.path.join(os.getcwd(), 'screenshots')
+        self.image_format = 'png'
+        self.quality = None
+        self.full_page = True
+        self._paths_by_digest = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._stats = {'captured': 0, 'written': 0, 'duplicates': 0, 'bytes_written': 0, 'capture_ms': 0.0}
+
+    def configure(self, directory: str, settings: dict = None):
+        """
+        Set the target directory and the format, quality and full_page capture options
+        """
+        settings = settings or {}
+        image_format = settings.get('format', 'png').lower()
+        if image_format == 'jpg':
+            image_format = 'jpeg'
+        if image_format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"Unsupported screenshot format: {image_format}, expected one of {list(SCREENSHOT_FORMATS)}")
+        quality = settings.get('quality')
+        if quality is not None and not 0 <= quality <= 100:
+            raise ValueError(f"Screenshot quality must be between 0 and 100, got {quality}")
+
+        self.directory = directory
+        self.image_format = image_format
+        # Playwright only accepts a quality for JPEG
+        self.quality = quality if image_format == 'jpeg' else None
+        self.full_page = settings.get('full_page', True)
+        os.makedirs(directory, exist_ok=True)
+
+    def _screenshot_options(self, full_page: bool = None) -> dict:
+        """
+        Get the page.screenshot options of the configured format
+        """
+        options = {
+            'type': self.image_format,
+            'full_page': self.full_page if full_page is None else full_page
+        }
+        if self.quality is not None:
+            options['quality'] = self.quality
+        return options
+
+    def capture(self, page, name: str, full_page: bool = None):
+        """
+        Capture a screenshot and queue it for writing.
+        Returns a future resolving to the path of the file holding the image.
+        """
+        start = perf_counter()
+        data = page.screenshot(**self._screenshot_options(full_page))
+        return self.submit(data, name, perf_counter() - start)
+
+    async def capture_async(self, page, name: str, full_page: bool = None):
+        """
+        Capture a screenshot from an async page and queue it for writing.
+        Returns a future resolving to the path of the file holding the image.
+        """
+        start = perf_counter()
+        data = await page.screenshot(**self._screenshot_options(full_page))
+        return self.submit(data, name, perf_counter() - start)
+
+    def submit(self, data: bytes, name: str, capture_seconds: float = 0.0):
+        """
+        Queue captured image bytes for hashing and writing on the background thread
+        """
+        with self._lock:
+            self._stats['captured'] += 1
+            self._stats['capture_ms'] += capture_seconds * 1000
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='screenshot-writer')
+            executor = self._executor
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        stem = os.path.join(self.directory, f"{UNSAFE_NAME_PATTERN.sub('_', name).strip('_')}_{timestamp}")
+        return executor.submit(self._write, data, stem, SCREENSHOT_FORMATS[self.image_format])
+
+    def _write(self, data: bytes, stem: str, extension: str) -> str:
+        """
+        Write an image unless the same image was already written, returning its path.
+        The file name ends with a digest prefix, so different images taken under the
+        same name within one second never share a path.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = f"{stem}_{digest[:12]}.{extension}"
+        with self._lock:
+            existing = self._paths_by_digest.get(digest)
+            if existing is None:
+                self._paths_by_digest[digest] = path
+        if existing is not None:
+            with self._lock:
+                self._stats['duplicates'] += 1
+            logger.info(f"Screenshot identical to {existing}, not written again")
+            return existing
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(data)
+        except OSError as e:
+            with self._lock:
+                self._paths_by_digest.pop(digest, None)
+            logger.error(f"Failed to write screenshot {path}: {str(e)}")
+            raise
+        with self._lock:
+            self._stats['written'] += 1
+            self._stats['bytes_written'] += len(data)
+        logger.info(f"Screenshot captured at: {path}")
+        return path
+
+    def flush(self):
+        """
+        Wait until every queued screenshot is written
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """
+        Get capture, write and de-duplication counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['capture_ms'] = round(stats['capture_ms'], 3)
+        return stats
+
+
+# Process-wide screenshot service shared by page objects and hooks
+screenshot_service = ScreenshotService()
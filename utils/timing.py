@@ -0,0 +1,342 @@
+import bisect
+import functools
+import inspect
+import json
+import math
+import os
+from collections import defaultdict
+from contextvars import ContextVar
+from time import perf_counter
+
+# Upper bounds of the latency histogram buckets in milliseconds
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, math.inf)
+
+# Page and locator methods whose first argument is a selector (or URL for goto)
+SELECTOR_METHODS = {
+    'goto', 'click', 'dblclick', 'fill', 'type', 'press', 'check', 'uncheck', 'set_checked',
+    'select_option', 'set_input_files', 'hover', 'focus', 'tap', 'text_content', 'inner_text',
+    'inner_html', 'input_value', 'get_attribute', 'is_visible', 'is_hidden', 'is_checked',
+    'is_enabled', 'is_disabled', 'is_editable', 'wait_for_selector', 'dispatch_event'
+}
+
+# Calls that only build locators client-side, wrapped but not timed
+LOCATOR_BUILDERS = {
+    'locator', 'frame_locator', 'get_by_role', 'get_by_text', 'get_by_label', 'get_by_placeholder',
+    'get_by_alt_text', 'get_by_title', 'get_by_test_id', 'nth', 'filter', 'and_', 'or_'
+}
+
+# Scenario and step the current thread or asyncio task is running
+_current_scenario = ContextVar('timing_scenario', default=None)
+_current_step = ContextVar('timing_step', default=None)
+# Nesting depth of timed calls, so a primitive is not counted again for the page calls it makes
+_depth = ContextVar('timing_depth', default=0)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with count, total, min and max
+    """
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKET_BOUNDS_MS)
+
+    def add(self, elapsed_ms: float):
+        """
+        Record one latency
+        """
+        self.count += 1
+        self.total += elapsed_ms
+        if elapsed_ms < self.min:
+            self.min = elapsed_ms
+        if elapsed_ms > self.max:
+            self.max = elapsed_ms
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile as the upper bound of the bucket it falls in, capped at the max
+        """
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        cumulative = 0
+        for bound, count in zip(BUCKET_BOUNDS_MS, self.buckets):
+            cumulative += count
+            if cumulative >= threshold:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """
+        Get the histogram as JSON-serialisable data
+        """
+        return {
+            'count': self.count,
+            'total_ms': round(self.total, 3),
+            'mean_ms': round(self.total / self.count, 3) if self.count else 0.0,
+            'min_ms': round(self.min, 3) if self.count else 0.0,
+            'max_ms': round(self.max, 3),
+            'p50_ms': round(self.percentile(0.5), 3),
+            'p95_ms': round(self.percentile(0.95), 3),
+            'buckets': {
+                ('inf' if bound == math.inf else f"<={bound}"): count
+                for bound, count in zip(BUCKET_BOUNDS_MS, self.buckets) if count
+            }
+        }
+
+
+class ActionTimer:
+    """
+    Records the latency of page object actions per action and per selector,
+    and attributes the time to the scenario and step that was running.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.actions = defaultdict(LatencyHistogram)
+        self.selectors = defaultdict(LatencyHistogram)
+        self.steps = defaultdict(lambda: defaultdict(float))
+
+    def set_scenario(self, name: str = None):
+        """
+        Attribute following actions to a scenario
+        """
+        _current_scenario.set(name)
+        _current_step.set(None)
+
+    def set_step(self, name: str = None):
+        """
+        Attribute following actions to a step of the current scenario
+        """
+        _current_step.set(name)
+
+    def record(self, action: str, selector, elapsed: float):
+        """
+        Record one timed action, elapsed in seconds
+        """
+        elapsed_ms = elapsed * 1000
+        self.actions[action].add(elapsed_ms)
+        if selector is not None:
+            self.selectors[(action, selector)].add(elapsed_ms)
+        self.steps[(_current_scenario.get(), _current_step.get())][action] += elapsed_ms
+
+    def to_dict(self) -> dict:
+        """
+        Get all recorded timings as JSON-serialisable data
+        """
+        return {
+            'actions': {action: histogram.to_dict() for action, histogram in sorted(self.actions.items())},
+            'selectors': [
+                {'action': action, 'selector': selector, **histogram.to_dict()}
+                for (action, selector), histogram in sorted(
+                    self.selectors.items(), key=lambda item: item[1].total, reverse=True
+                )
+            ],
+            'steps': [
+                {'scenario': scenario, 'step': step, 'action': action, 'total_ms': round(total, 3)}
+                for (scenario, step), totals in self.steps.items()
+                for action, total in sorted(totals.items(), key=lambda item: item[1], reverse=True)
+            ]
+        }
+
+    def summary_table(self, limit: int = 15) -> str:
+        """
+        Format per-action totals and the slowest selectors as a text table
+        """
+        header = f"{'action':<32} {'count':>7} {'total ms':>11} {'mean':>9} {'p50':>9} {'p95':>9} {'max':>9}"
+        lines = [header, '-' * len(header)]
+
+        def row(label, histogram):
+            data = histogram.to_dict()
+            lines.append(
+                f"{label[:32]:<32} {data['count']:>7} {data['total_ms']:>11.1f} {data['mean_ms']:>9.1f} "
+                f"{data['p50_ms']:>9.1f} {data['p95_ms']:>9.1f} {data['max_ms']:>9.1f}"
+            )
+
+        for action, histogram in sorted(self.actions.items(), key=lambda item: item[1].total, reverse=True):
+            row(action, histogram)
+        if self.selectors:
+            lines.append('')
+            lines.append(f"Slowest selectors (top {limit} by total time)")
+            slowest = sorted(self.selectors.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+            for (action, selector), histogram in slowest:
+                row(f"{action} {selector}", histogram)
+        return '\n'.join(lines)
+
+    def write_json(self, path: str):
+        """
+        Write all recorded timings to a JSON file
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def reset(self):
+        """
+        Drop all recorded timings
+        """
+        self.actions.clear()
+        self.selectors.clear()
+        self.steps.clear()
+
+
+# Process-wide timer shared by page objects and hooks
+action_timer = ActionTimer()
+
+
+def _call_timed(action: str, selector, func, args, kwargs):
+    """
+    Call func and record its latency unless an enclosing call is already timed
+    """
+    depth = _depth.get()
+    token = _depth.set(depth + 1)
+    start = perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        elapsed = perf_counter() - start
+        _depth.reset(token)
+        if depth == 0:
+            action_timer.record(action, selector, elapsed)
+
+
+async def _await_timed(action: str, selector, func, args, kwargs):
+    """
+    Await func and record its latency unless an enclosing call is already timed
+    """
+    depth = _depth.get()
+    token = _depth.set(depth + 1)
+    start = perf_counter()
+    try:
+        return await func(*args, **kwargs)
+    finally:
+        elapsed = perf_counter() - start
+        _depth.reset(token)
+        if depth == 0:
+            action_timer.record(action, selector, elapsed)
+
+
+def timed(action: str, selector_arg: bool = True):
+    """
+    Decorate a page object method to time it as an action, attributed to the selector
+    (or URL) passed as its first argument unless selector_arg is False
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if not action_timer.enabled:
+                    return await func(self, *args, **kwargs)
+                selector = args[0] if selector_arg and args and isinstance(args[0], str) else None
+                return await _await_timed(action, selector, func, (self,) + args, kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not action_timer.enabled:
+                return func(self, *args, **kwargs)
+            selector = args[0] if selector_arg and args and isinstance(args[0], str) else None
+            return _call_timed(action, selector, func, (self,) + args, kwargs)
+        return wrapper
+    return decorator
+
+
+class _Instrumented:
+    """
+    Proxy timing every method call of a Playwright Page or Locator
+    """
+
+    _prefix = ''
+
+    def __init__(self, target, selector: str = None):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_selector', selector)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if _is_locator(attribute):
+            return InstrumentedLocator(attribute, self._selector)
+        if not callable(attribute) or name.startswith('expect_') or name in ('on', 'once', 'remove_listener'):
+            return attribute
+
+        action = f"{self._prefix}.{name}"
+        if name in LOCATOR_BUILDERS:
+            def build(*args, **kwargs):
+                result = attribute(*args, **kwargs)
+                if _is_locator(result):
+                    selector = args[0] if args and isinstance(args[0], str) else self._selector
+                    return InstrumentedLocator(result, selector)
+                return result
+            return build
+
+        if inspect.iscoroutinefunction(attribute):
+            async def call_async(*args, **kwargs):
+                return await _await_timed(action, self._selector_for(name, args), attribute, args, kwargs)
+            return call_async
+
+        def call(*args, **kwargs):
+            return _call_timed(action, self._selector_for(name, args), attribute, args, kwargs)
+        return call
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+    def _selector_for(self, name: str, args: tuple):
+        """
+        Get the selector a call acts on
+        """
+        if self._selector is not None:
+            return self._selector
+        if name in SELECTOR_METHODS and args and isinstance(args[0], str):
+            return args[0]
+        return None
+
+
+class InstrumentedPage(_Instrumented):
+    """
+    Page proxy timing every call as a page.<method> action
+    """
+
+    _prefix = 'page'
+
+
+class InstrumentedLocator(_Instrumented):
+    """
+    Locator proxy timing every call as a locator.<method> action against its selector
+    """
+
+    _prefix = 'locator'
+
+
+def _is_locator(value) -> bool:
+    """
+    Check for a Playwright Locator of either API without importing both
+    """
+    return type(value).__name__ == 'Locator' and type(value).__module__.startswith('playwright.')
+
+
+def instrument_page(page):
+    """
+    Wrap a page for timing when the timer is enabled, otherwise return it unchanged
+    """
+    if not action_timer.enabled or isinstance(page, InstrumentedPage):
+        return page
+    return InstrumentedPage(page)
+
+
+def timing_output_path(timing_config: dict) -> str:
+    """
+    Get the timing JSON path, one file per parallel worker
+    """
+    path = timing_config.get('output', os.path.join('reports', 'timing.json'))
+    worker_id = os.getenv('WORKER_ID')
+    if worker_id is not None:
+        root, extension = os.path.splitext(path)
+        path = f"{root}_worker_{worker_id}{extension}"
+    return path
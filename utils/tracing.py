@@ -0,0 +1,118 @@
+import os
+import re
+import weakref
+from datetime import datetime
+from time import perf_counter
+from playwright.sync_api import Error as PlaywrightError
+from config.logging_config import logger
+
+# Characters not kept in trace file names
+UNSAFE_NAME_PATTERN = re.compile(r'[^\w.-]+')
+
+
+class ScenarioTracer:
+    """
+    Records a Playwright trace per scenario for trace_on_failure.
+    Tracing is started once per browser context and split into one chunk per
+    scenario; the chunk is written to disk only when the scenario failed.
+    """
+
+    def __init__(self, directory: str, screenshots: bool = True, snapshots: bool = True, sources: bool = False):
+        self.directory = directory
+        self.options = {'screenshots': screenshots, 'snapshots': snapshots, 'sources': sources}
+        self._started = weakref.WeakSet()
+        self.scenarios = 0
+        self.saved = 0
+        self.bytes_saved = 0
+        self.start_ms = 0.0
+        self.chunk_ms = 0.0
+        self.discard_ms = 0.0
+        self.save_ms = 0.0
+        self.scenario_ms = 0.0
+        self._scenario_start = None
+
+    @classmethod
+    def from_config(cls, directory: str, tracing_config: dict):
+        """
+        Create a tracer from the tracing config section
+        """
+        return cls(
+            directory,
+            screenshots=tracing_config.get('screenshots', True),
+            snapshots=tracing_config.get('snapshots', True),
+            sources=tracing_config.get('sources', False)
+        )
+
+    def attach(self, browser_context):
+        """
+        Start tracing on a context unless it is already tracing, e.g. while pre-warming the pool
+        """
+        if browser_context in self._started:
+            return
+        start = perf_counter()
+        browser_context.tracing.start(**self.options)
+        self.start_ms += (perf_counter() - start) * 1000
+        self._started.add(browser_context)
+
+    def start_scenario(self, browser_context, name: str):
+        """
+        Start the trace chunk of a scenario
+        """
+        self.attach(browser_context)
+        start = perf_counter()
+        browser_context.tracing.start_chunk(title=name)
+        self.chunk_ms += (perf_counter() - start) * 1000
+        self.scenarios += 1
+        self._scenario_start = perf_counter()
+
+    def stop_scenario(self, browser_context, name: str, failed: bool):
+        """
+        Stop the trace chunk of a scenario, writing it to disk only if the scenario failed.
+        Returns the trace path, or None when the chunk was discarded.
+        """
+        if self._scenario_start is not None:
+            self.scenario_ms += (perf_counter() - self._scenario_start) * 1000
+            self._scenario_start = None
+
+        start = perf_counter()
+        if not failed:
+            browser_context.tracing.stop_chunk()
+            self.discard_ms += (perf_counter() - start) * 1000
+            return None
+
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        file_name = f"trace_{UNSAFE_NAME_PATTERN.sub('_', name).strip('_')}_{timestamp}.zip"
+        trace_path = os.path.join(self.directory, file_name)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            browser_context.tracing.stop_chunk(path=trace_path)
+        except PlaywrightError as e:
+            # A lost trace must not keep the scenario's browser resources from being cleaned up
+            logger.error(f"Failed to save trace of '{name}': {str(e)}")
+            return None
+        finally:
+            self.save_ms += (perf_counter() - start) * 1000
+        self.saved += 1
+        self.bytes_saved += os.path.getsize(trace_path)
+        logger.info(f"Trace saved at: {trace_path} (open with: playwright show-trace {trace_path})")
+        return trace_path
+
+    def stats(self) -> dict:
+        """
+        Get the time spent in the tracing start/chunk calls, overall and relative to scenario time.
+        The snapshots and screenshots tracing records during every action are not included;
+        compare scenario durations of runs with tracing off and on for the full overhead.
+        """
+        api_ms = self.start_ms + self.chunk_ms + self.discard_ms + self.save_ms
+        return {
+            'scenarios': self.scenarios,
+            'traces_saved': self.saved,
+            'bytes_saved': self.bytes_saved,
+            'start_ms': round(self.start_ms, 3),
+            'start_chunk_ms': round(self.chunk_ms, 3),
+            'discard_chunk_ms': round(self.discard_ms, 3),
+            'save_chunk_ms': round(self.save_ms, 3),
+            'tracing_api_ms': round(api_ms, 3),
+            'avg_tracing_api_ms': round(api_ms / self.scenarios, 3) if self.scenarios else 0.0,
+            'tracing_api_pct': round(100 * api_ms / self.scenario_ms, 2) if self.scenario_ms else 0.0
+        }
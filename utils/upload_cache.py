@@ -0,0 +1,137 @@
+import mimetypes
+import os
+import re
+import threading
+from config.logging_config import logger
+
+# Upload fixtures, resolved from the project root rather than the working directory
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test_data', 'uploads')
+
+# Files above this size are handed to Playwright by path, which streams them, instead of being kept in memory
+DEFAULT_MAX_IN_MEMORY_BYTES = 8 * 1024 * 1024
+
+# Playwright rejects buffer payloads above 50 MB
+MAX_BUFFER_BYTES = 50 * 1024 * 1024
+
+SIZE_PATTERN = re.compile(r'^\s*(?P<number>\d+(?:\.\d+)?)\s*(?P<unit>[KMG]?B?)\s*$', re.IGNORECASE)
+SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'KB': 1024, 'M': 1024 ** 2, 'MB': 1024 ** 2, 'G': 1024 ** 3, 'GB': 1024 ** 3}
+
+# Repeated to build synthetic payloads, printable so uploaded content is easy to inspect
+SYNTHETIC_PATTERN = bytes(range(32, 127)) + b'\n'
+
+
+def parse_size(size) -> int:
+    """
+    Parse a size such as 512, "64KB" or "5MB" into bytes
+    """
+    if isinstance(size, int):
+        return size
+    match = SIZE_PATTERN.match(str(size))
+    if not match:
+        raise ValueError(f"Invalid size: {size!r}, expected e.g. 512, 64KB or 5MB")
+    return int(float(match.group('number')) * SIZE_UNITS[match.group('unit').upper()])
+
+
+class UploadPayloadCache:
+    """
+    Loads upload fixtures once per process and hands them to set_input_files
+    as in-memory payloads. Large files are passed by path so they are never
+    held in memory, and synthetic payloads of up to 50 MB can be generated for
+    measuring upload latency without storing big files in the repository.
+    """
+
+    def __init__(self, directory: str = UPLOADS_DIR, max_in_memory_bytes: int = DEFAULT_MAX_IN_MEMORY_BYTES):
+        self.directory = directory
+        self.max_in_memory_bytes = max_in_memory_bytes
+        self._payloads = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, uploads_config: dict):
+        """
+        Apply the uploads config section
+        """
+        self.max_in_memory_bytes = parse_size(uploads_config.get('max_in_memory_bytes', DEFAULT_MAX_IN_MEMORY_BYTES))
+
+    def payload(self, filename: str):
+        """
+        Get the set_input_files payload of an upload fixture: a name/mimeType/buffer dict,
+        or the file's absolute path when it is too large to keep in memory
+        """
+        with self._lock:
+            payload = self._payloads.get(filename)
+            if payload is not None:
+                self.hits += 1
+                return payload
+            self.misses += 1
+
+        file_path = os.path.join(self.directory, filename)
+        try:
+            size = os.path.getsize(file_path)
+            if size > self.max_in_memory_bytes:
+                payload = file_path
+            else:
+                with open(file_path, 'rb') as f:
+                    payload = {'name': filename, 'mimeType': _mime_type(filename), 'buffer': f.read()}
+        except OSError as e:
+            logger.error(f"Failed to load upload file {file_path}: {str(e)}")
+            raise
+
+        with self._lock:
+            payload = self._payloads.setdefault(filename, payload)
+        logger.debug(f"Loaded upload file {filename} ({size} bytes, {'path' if isinstance(payload, str) else 'in memory'})")
+        return payload
+
+    def payloads(self, filenames: list) -> list:
+        """
+        Get the payloads of several upload fixtures. Playwright does not accept
+        paths and buffers in one call, so if any file is too large all are passed by path.
+        """
+        payloads = [self.payload(filename) for filename in filenames]
+        if any(isinstance(payload, str) for payload in payloads):
+            return [os.path.join(self.directory, filename) for filename in filenames]
+        return payloads
+
+    def synthetic(self, size, name: str = None) -> dict:
+        """
+        Get a generated payload of the given size (e.g. "5MB"), built once per size and name
+        """
+        size_bytes = parse_size(size)
+        if size_bytes > MAX_BUFFER_BYTES:
+            raise ValueError(f"Synthetic payloads are limited to {MAX_BUFFER_BYTES} bytes, got {size_bytes}")
+        name = name or f"synthetic_{size_bytes}.bin"
+        key = ('synthetic', name, size_bytes)
+        with self._lock:
+            payload = self._payloads.get(key)
+            if payload is not None:
+                self.hits += 1
+                return payload
+            self.misses += 1
+            repeats = size_bytes // len(SYNTHETIC_PATTERN) + 1
+            payload = {
+                'name': name,
+                'mimeType': _mime_type(name),
+                'buffer': (SYNTHETIC_PATTERN * repeats)[:size_bytes]
+            }
+            self._payloads[key] = payload
+        return payload
+
+    def stats(self) -> dict:
+        """
+        Get hit/miss counters and the number of bytes held in memory
+        """
+        with self._lock:
+            in_memory = sum(len(p['buffer']) for p in self._payloads.values() if isinstance(p, dict))
+            return {'entries': len(self._payloads), 'hits': self.hits, 'misses': self.misses, 'bytes_in_memory': in_memory}
+
+
+def _mime_type(filename: str) -> str:
+    """
+    Guess the MIME type of an upload from its name
+    """
+    return mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+
+# Process-wide cache, so each parallel worker loads the fixtures once
+upload_cache = UploadPayloadCache()